@@ -0,0 +1,8 @@
+"""
+Audit Kit - helpers shared by the skill audit scripts.
+
+Scripts add the parent `.shared` directory to sys.path and import from here:
+
+    sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+    from audit_kit.parallel import FileResult, run_file_checks
+"""
@@ -0,0 +1,134 @@
+"""
+Size-aware file reading for the scanners.
+
+Generated bundles, minified JS and large JSON dumps should not be read whole
+into memory by every rule. These helpers sniff binaries, enforce a max size
+and scan large files through an mmap window by window.
+"""
+
+import heapq
+import mmap
+import os
+import re
+from typing import Iterator, List, Optional, Pattern, Tuple
+
+DEFAULT_MAX_BYTES = 2 * 1024 * 1024
+CHUNK_BYTES = 1024 * 1024
+CHUNK_OVERLAP = 4096
+SNIFF_BYTES = 8192
+
+_SIZE = re.compile(r'^(\d+(?:\.\d+)?)\s*([kmg]?)i?b?$', re.IGNORECASE)
+_UNITS = {'': 1, 'k': 1024, 'm': 1024 ** 2, 'g': 1024 ** 3}
+# Bytes that never appear in UTF-8/ASCII source text (NUL and most C0 controls)
+_CONTROL = bytes(range(0, 9)) + bytes(range(14, 32))
+
+
+def parse_size(value: str) -> int:
+    """'500K', '2M', '1.5MB', '4096' -> bytes."""
+    match = _SIZE.match(value.strip())
+    if not match:
+        raise ValueError(f"Invalid size: {value}")
+    return int(float(match.group(1)) * _UNITS[match.group(2).lower()])
+
+
+def parse_max_size(argv: List[str], default: int = DEFAULT_MAX_BYTES) -> int:
+    """Read `--max-size SIZE` / `--max-size=SIZE` from argv."""
+    for i, arg in enumerate(argv):
+        if arg == '--max-size' and i + 1 < len(argv):
+            return parse_size(argv[i + 1])
+        if arg.startswith('--max-size='):
+            return parse_size(arg.split('=', 1)[1])
+    return default
+
+
+def is_binary(path: str) -> bool:
+    """Sniff the first few KB: NUL bytes or >30% control bytes mean binary."""
+    try:
+        with open(path, 'rb') as f:
+            sample = f.read(SNIFF_BYTES)
+    except OSError:
+        return False
+    if not sample:
+        return False
+    if b'\0' in sample:
+        return True
+    return len(sample.translate(None, _CONTROL)) < len(sample) * 0.7
+
+
+def skip_reason(path: str, max_bytes: int) -> Optional[str]:
+    """Why a file should not be read whole, or None if it is fine to read."""
+    try:
+        size = os.path.getsize(path)
+    except OSError as e:
+        return f"unreadable ({e.strerror})"
+    if size > max_bytes:
+        return f"too large ({size / 1024 / 1024:.1f} MB > {max_bytes / 1024 / 1024:.1f} MB)"
+    if is_binary(path):
+        return "binary"
+    return None
+
+
+def read_text(path: str, max_bytes: int = DEFAULT_MAX_BYTES,
+              errors: str = 'replace') -> Tuple[Optional[str], Optional[str]]:
+    """Return (content, None), or (None, reason) for binary/oversized files."""
+    reason = skip_reason(path, max_bytes)
+    if reason:
+        return None, reason
+    try:
+        with open(path, 'r', encoding='utf-8', errors=errors) as f:
+            return f.read(), None
+    except OSError as e:
+        return None, f"unreadable ({e.strerror})"
+
+
+def finditer_mmap(path: str, pattern: Pattern[bytes], chunk: int = CHUNK_BYTES,
+                  overlap: int = CHUNK_OVERLAP) -> Iterator[re.Match]:
+    """
+    Yield matches of a bytes pattern over a memory-mapped file, one window at
+    a time. Windows overlap so a match crossing a boundary is still found; a
+    match is reported only by the window it starts in, re-matched without the
+    window limit so it is not cut short, and scanning resumes after it, so none
+    repeat. Same matches as one finditer over the file, as long as finding a
+    match's start needs no more than `overlap` bytes past its window.
+    """
+    with open(path, 'rb') as f:
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # empty file
+            return
+        with mm:
+            size = len(mm)
+            last_end = 0
+            for start in range(0, size, chunk):
+                # The last window also owns an empty match at end of file
+                owned_end = start + chunk if start + chunk < size else size + 1
+                if last_end >= owned_end:
+                    continue
+                window_end = min(size, owned_end + overlap)
+                for match in pattern.finditer(mm, max(start, last_end), window_end):
+                    if match.start() >= owned_end:
+                        break
+                    if match.start() < last_end:
+                        continue  # inside a match already extended past this window
+                    if window_end < size:
+                        match = pattern.match(mm, match.start())
+                    last_end = match.end()
+                    yield match
+
+
+class SlowestFiles:
+    """Keep only the N slowest (seconds, path) entries seen."""
+
+    def __init__(self, n: int = 5):
+        self.n = n
+        self._heap: List[Tuple[float, str]] = []
+
+    def record(self, path: str, seconds: float) -> None:
+        if len(self._heap) < self.n:
+            heapq.heappush(self._heap, (seconds, path))
+        elif seconds > self._heap[0][0]:
+            heapq.heapreplace(self._heap, (seconds, path))
+
+    def top(self) -> List[dict]:
+        return [{"file": path, "seconds": round(t, 4)}
+                for t, path in sorted(self._heap, reverse=True)]
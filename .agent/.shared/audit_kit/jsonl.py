@@ -0,0 +1,50 @@
+"""
+Streaming JSONL output.
+
+One JSON object per line, flushed immediately so CI can pipe findings into
+other tools while the scan is still running. Records carry a "type" of
+"finding" or "summary".
+"""
+
+import json
+import os
+import sys
+from typing import Optional
+
+from .parallel import FileResult
+
+
+def emit(record: dict) -> None:
+    """Write one record as a JSON line and flush."""
+    try:
+        sys.stdout.write(json.dumps(record, ensure_ascii=False) + '\n')
+        sys.stdout.flush()
+    except BrokenPipeError:
+        # Downstream consumer (e.g. `| head`) closed the pipe: stop quietly
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+        sys.exit(1)
+
+
+def emit_finding(tool: str, level: str, message: str, file: Optional[str] = None, **extra) -> None:
+    record = {"type": "finding", "tool": tool, "level": level}
+    if file is not None:
+        record["file"] = file
+    record["message"] = message
+    record.update(extra)
+    emit(record)
+
+
+def emit_file_result(tool: str, result: FileResult) -> None:
+    """Emit every issue and warning of one audited file."""
+    if result.skipped:
+        emit({"type": "skipped", "tool": tool, "file": result.filepath, "reason": result.skipped})
+    for message in result.issues:
+        emit_finding(tool, "issue", message, result.filepath)
+    for message in result.warnings:
+        emit_finding(tool, "warning", message, result.filepath)
+
+
+def emit_summary(tool: str, **fields) -> None:
+    record = {"type": "summary", "tool": tool}
+    record.update(fields)
+    emit(record)
@@ -0,0 +1,288 @@
+"""
+Lightweight JSX/TSX/HTML element tokenizer.
+
+Parses a file once into a stream of start-tag Elements (tag name, attributes,
+offsets, matching close tag) so checkers can ask "which <img> has no alt?"
+instead of re-scanning the raw text with a regex per rule. It is not a full
+parser: it skips comments, generic type arguments (`useState<string>`),
+comparison operators and <script>/<style> bodies, which is where most regex
+false positives came from.
+
+Usage:
+    doc = load(path)                 # cached per file (path, mtime, size)
+    for img in doc.find('img'):
+        if not img.has('alt'): ...
+"""
+
+import os
+import re
+from bisect import bisect_right
+from collections import OrderedDict
+from typing import Dict, Iterator, List, Optional, Union
+
+VOID_ELEMENTS = {
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'link',
+    'meta', 'param', 'source', 'track', 'wbr',
+}
+RAW_TEXT_ELEMENTS = {'script', 'style'}
+
+# Comments are matched so they can be skipped.
+_TOKEN = re.compile(
+    r'<!--|/\*|(?<![:\w"\'`/])//|<(/?)([A-Za-z][\w.:-]*)'
+)
+# `<` straight after an identifier, `)` or `]` is a generic (`useState<User>`,
+# `Record<string, T>`) unless it looks like inline markup (`word<br/>`).
+_GENERIC_PREFIX = re.compile(r'[\w)\]]')
+TS_TYPE_WORDS = {
+    'string', 'number', 'boolean', 'any', 'unknown', 'void', 'never', 'object',
+    'null', 'undefined', 'bigint', 'symbol', 'typeof', 'keyof', 'readonly',
+}
+# JSX/HTML attribute names plus Vue/Svelte directives (@click, :prop, on:click)
+_ATTR_NAME = re.compile(r'[A-Za-z_:@#$][\w:.@#$-]*')
+_UNQUOTED_VALUE = re.compile(r'[^\s>]+')
+_SPACE = re.compile(r'\s*')
+_STRING_LITERAL = re.compile(r'^\{\s*(["\'`])(.*)\1\s*\}$', re.S)
+_TAG = re.compile(r'<[^>]*>')
+_JSX_COMMENT = re.compile(r'\{\s*/\*.*?\*/\s*\}', re.S)
+
+AttrValue = Union[str, bool]
+
+
+class Element:
+    """One start tag. Attribute names are lower-cased; values are the literal
+    string, the raw `{expression}` source, or True for bare attributes."""
+
+    __slots__ = ('tag', 'name', 'attrs', 'start', 'end', 'close', 'self_closing', 'spread')
+
+    def __init__(self, tag: str, start: int):
+        self.tag = tag
+        self.name = tag.lower()
+        self.attrs: Dict[str, AttrValue] = {}
+        self.start = start
+        self.end = start
+        self.close: Optional[int] = None
+        self.self_closing = False
+        self.spread = False
+
+    def has(self, attr: str) -> bool:
+        return attr.lower() in self.attrs
+
+    def get(self, attr: str, default=None) -> Optional[AttrValue]:
+        return self.attrs.get(attr.lower(), default)
+
+    def __repr__(self):
+        return f"<{self.tag} {self.attrs}{' /' if self.self_closing else ''}>"
+
+
+def _skip_expression(text: str, pos: int, limit: int) -> int:
+    """Return the offset just past the `}` closing the `{` at pos."""
+    depth = 0
+    i = pos
+    while i < limit:
+        ch = text[i]
+        if ch == '{':
+            depth += 1
+        elif ch == '}':
+            depth -= 1
+            if depth == 0:
+                return i + 1
+        elif ch in '"\'`':
+            close = text.find(ch, i + 1, limit)
+            while close != -1 and text[close - 1] == '\\':
+                close = text.find(ch, close + 1, limit)
+            if close == -1:
+                return limit
+            i = close
+        elif ch == '/' and text.startswith('/*', i):
+            close = text.find('*/', i + 2, limit)
+            i = limit - 1 if close == -1 else close + 1
+        i += 1
+    return limit
+
+
+def _read_tag(text: str, el: Element, pos: int, limit: int, nested: List[Element]) -> int:
+    """
+    Parse attributes from pos up to the closing `>`; return the offset after it,
+    or -1 when the text cannot be a tag (e.g. the comparison in `a<b;`).
+    """
+    while pos < limit:
+        pos = _SPACE.match(text, pos).end()
+        if pos >= limit:
+            break
+        ch = text[pos]
+        if ch == '>':
+            return pos + 1
+        if ch == '/' and text.startswith('/>', pos):
+            el.self_closing = True
+            return pos + 2
+        if ch == '{':
+            end = _skip_expression(text, pos, limit)
+            if text.startswith('{...', pos):
+                el.spread = True
+            pos = end
+            continue
+        match = _ATTR_NAME.match(text, pos)
+        if not match:
+            return -1
+        name = match.group().lower()
+        pos = _SPACE.match(text, match.end()).end()
+        if not text.startswith('=', pos):
+            el.attrs[name] = True
+            continue
+        pos = _SPACE.match(text, pos + 1).end()
+        if pos >= limit:
+            break
+        quote = text[pos]
+        if quote in '"\'':
+            close = text.find(quote, pos + 1, limit)
+            close = limit if close == -1 else close
+            el.attrs[name] = text[pos + 1:close]
+            pos = close + 1
+        elif quote == '{':
+            end = _skip_expression(text, pos, limit)
+            raw = text[pos:end]
+            literal = _STRING_LITERAL.match(raw)
+            el.attrs[name] = literal.group(2) if literal else raw
+            if '<' in raw:
+                # JSX passed as a prop, e.g. icon={<img src="..." />}
+                nested.extend(_scan(text, pos + 1, end - 1))
+            pos = end
+        else:
+            match = _UNQUOTED_VALUE.match(text, pos)
+            el.attrs[name] = match.group().rstrip('/') if match else ''
+            pos = match.end() if match else pos + 1
+    return limit
+
+
+def _scan(text: str, pos: int, limit: int) -> Iterator[Element]:
+    """Yield start tags in document order, matching close tags as we go."""
+    stack: List[Element] = []
+    while pos < limit:
+        match = _TOKEN.search(text, pos, limit)
+        if not match:
+            break
+        token = match.group()
+        if token == '<!--':
+            end = text.find('-->', match.end(), limit)
+            pos = limit if end == -1 else end + 3
+            continue
+        if token == '/*':
+            end = text.find('*/', match.end(), limit)
+            pos = limit if end == -1 else end + 2
+            continue
+        if token == '//':
+            end = text.find('\n', match.end(), limit)
+            pos = limit if end == -1 else end + 1
+            continue
+
+        closing, tag = match.group(1), match.group(2)
+        if (not closing and match.start() > 0 and _GENERIC_PREFIX.match(text, match.start() - 1)
+                and (tag[0].isupper() or tag in TS_TYPE_WORDS)):
+            pos = match.end()
+            continue
+        if closing:
+            name = tag.lower()
+            for i in range(len(stack) - 1, -1, -1):
+                if stack[i].name == name:
+                    stack[i].close = match.start()
+                    del stack[i:]
+                    break
+            end = text.find('>', match.end(), limit)
+            pos = limit if end == -1 else end + 1
+            continue
+
+        el = Element(tag, match.start())
+        nested: List[Element] = []
+        end = _read_tag(text, el, match.end(), limit, nested)
+        if end < 0:
+            pos = match.end()
+            continue
+        pos = el.end = end
+        yield el
+        yield from nested
+
+        if el.self_closing or (el.name in VOID_ELEMENTS and tag.islower()):
+            continue
+        if el.name in RAW_TEXT_ELEMENTS:
+            close = re.compile(r'</' + el.name + r'\s*>', re.I).search(text, pos, limit)
+            if close:
+                el.close = close.start()
+                pos = close.end()
+            continue
+        stack.append(el)
+
+
+class Document:
+    """Element stream for one source file, indexed by lower-cased tag name."""
+
+    def __init__(self, source: str):
+        self.source = source
+        self.elements: List[Element] = list(_scan(source, 0, len(source)))
+        self._by_name: Dict[str, List[Element]] = {}
+        for el in self.elements:
+            self._by_name.setdefault(el.name, []).append(el)
+        self._line_starts: Optional[List[int]] = None
+
+    def find(self, *names: str) -> List[Element]:
+        """Elements with any of the given tag names, in document order."""
+        if len(names) == 1:
+            return self._by_name.get(names[0].lower(), [])
+        wanted = {n.lower() for n in names}
+        return [el for el in self.elements if el.name in wanted]
+
+    def count(self, *names: str) -> int:
+        return sum(len(self._by_name.get(n.lower(), ())) for n in set(names))
+
+    def with_attr(self, attr: str) -> List[Element]:
+        attr = attr.lower()
+        return [el for el in self.elements if attr in el.attrs]
+
+    def inner(self, el: Element) -> str:
+        """Raw source between the start tag and its matching close tag."""
+        if el.close is None:
+            return ''
+        return self.source[el.end:el.close]
+
+    def inner_text(self, el: Element) -> str:
+        """Children with tags and JSX comments removed; {expressions} count as text."""
+        return _TAG.sub('', _JSX_COMMENT.sub('', self.inner(el))).strip()
+
+    def line(self, el: Element) -> int:
+        if self._line_starts is None:
+            self._line_starts = [0] + [m.end() for m in re.finditer('\n', self.source)]
+        return bisect_right(self._line_starts, el.start)
+
+
+def parse(source: str) -> Document:
+    """Parse source without caching."""
+    return Document(source)
+
+
+_CACHE: 'OrderedDict[tuple, Document]' = OrderedDict()
+_CACHE_SIZE = 128
+
+
+def load(path: str, source: Optional[str] = None) -> Document:
+    """
+    Parse a file once and cache the element stream by (path, mtime, size).
+    Pass `source` when the caller has already read the file.
+    """
+    try:
+        st = os.stat(path)
+        key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+    except OSError:
+        return parse(source or '')
+
+    doc = _CACHE.get(key)
+    if doc is not None:
+        _CACHE.move_to_end(key)
+        return doc
+
+    if source is None:
+        with open(path, 'r', encoding='utf-8', errors='replace') as f:
+            source = f.read()
+    doc = Document(source)
+    _CACHE[key] = doc
+    if len(_CACHE) > _CACHE_SIZE:
+        _CACHE.popitem(last=False)
+    return doc
@@ -0,0 +1,121 @@
+"""
+Parallel file auditing.
+
+Each file is checked independently into a FileResult, so the checks can run
+in a process pool and be merged afterwards in the original file order.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional
+
+from . import profiling
+
+
+class FileResult:
+    """Findings for a single audited file."""
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        self.issues: List[str] = []
+        self.warnings: List[str] = []
+        self.passed = 0
+        self.checked = False
+        self.skipped: Optional[str] = None
+        self.elapsed = 0.0
+
+
+def parse_jobs(argv: List[str], default: int = 1) -> int:
+    """Read `--jobs N` / `--jobs=N` from argv. 0 means one worker per CPU."""
+    value = None
+    for i, arg in enumerate(argv):
+        if arg == '--jobs' and i + 1 < len(argv):
+            value = argv[i + 1]
+        elif arg.startswith('--jobs='):
+            value = arg.split('=', 1)[1]
+    if value is None:
+        return default
+    try:
+        jobs = int(value)
+    except ValueError:
+        return default
+    return jobs if jobs > 0 else (os.cpu_count() or 1)
+
+
+def walk_files(directory: str, extensions: set, skip_dirs: set) -> List[str]:
+    """Collect matching files in a stable (sorted) order, pruning skip_dirs."""
+    paths = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if d not in skip_dirs)
+        for file in sorted(files):
+            if os.path.splitext(file)[1] in extensions:
+                paths.append(os.path.join(root, file))
+    return paths
+
+
+def _timed(check: Callable[[str], FileResult], filepath: str) -> FileResult:
+    start = time.perf_counter()
+    with profiling.track_file(filepath):
+        result = check(filepath)
+    result.elapsed = time.perf_counter() - start
+    return result
+
+
+def run_file_checks(check: Callable[[str], FileResult], paths: Iterable[str],
+                    jobs: int = 1) -> Iterator[FileResult]:
+    """
+    Run `check` over paths and yield results in input order.
+
+    `check` must be picklable (a module-level function or staticmethod) when
+    jobs > 1, since files are dispatched to worker processes. While profiling,
+    checks run in-process so every timing lands in the active profiler.
+    """
+    paths = list(paths)
+    if jobs <= 1 or profiling.active() is not None or len(paths) < 2:
+        for path in paths:
+            yield _timed(check, path)
+        return
+
+    chunksize = max(1, len(paths) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        yield from pool.map(_timed, [check] * len(paths), paths, chunksize=chunksize)
+
+
+class Timing:
+    """Wall-clock and per-file timing for one audit run."""
+
+    def __init__(self, jobs: int = 1):
+        self.jobs = jobs
+        self.started = time.perf_counter()
+        self.wall = 0.0
+        self.per_file: List[tuple] = []
+
+    def record(self, result: FileResult) -> None:
+        self.per_file.append((result.filepath, result.elapsed))
+
+    def stop(self) -> None:
+        self.wall = time.perf_counter() - self.started
+
+    def slowest(self, n: int = 5) -> List[tuple]:
+        return sorted(self.per_file, key=lambda item: item[1], reverse=True)[:n]
+
+    def to_dict(self, top: int = 5) -> dict:
+        return {
+            "jobs": self.jobs,
+            "wall_seconds": round(self.wall, 3),
+            "cpu_seconds": round(sum(t for _, t in self.per_file), 3),
+            "slowest_files": [
+                {"file": path, "seconds": round(t, 4)} for path, t in self.slowest(top)
+            ],
+        }
+
+    def print_summary(self, top: int = 5, base: Optional[str] = None) -> None:
+        data = self.to_dict(top)
+        files = len(self.per_file)
+        rate = files / self.wall if self.wall > 0 else 0.0
+        print(f"[TIMING] {files} files in {data['wall_seconds']}s "
+              f"(jobs={self.jobs}, {rate:.1f} files/s, check time {data['cpu_seconds']}s)")
+        for path, t in self.slowest(top):
+            shown = os.path.relpath(path, base) if base else path
+            print(f"  {t * 1000:8.1f}ms  {shown}")
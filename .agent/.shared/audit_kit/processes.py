@@ -0,0 +1,56 @@
+"""
+Process-tree control for tools run under a deadline.
+
+Linters and test runners are usually wrappers (npx -> node -> workers), so
+killing the direct child leaves grandchildren running and holding its pipes
+open. Tools are started as the leader of their own process group and the
+whole group is killed when time runs out.
+"""
+
+import os
+import signal
+import subprocess
+from typing import Any, List, Optional, Tuple
+
+
+def popen_group(cmd: List[str], **kwargs) -> subprocess.Popen:
+    """subprocess.Popen with the child leading a new process group."""
+    if os.name == 'nt':
+        kwargs['creationflags'] = kwargs.get('creationflags', 0) | subprocess.CREATE_NEW_PROCESS_GROUP
+    else:
+        kwargs['start_new_session'] = True
+    return subprocess.Popen(cmd, **kwargs)
+
+
+def kill_group(proc: subprocess.Popen) -> None:
+    """Kill proc and every process in its group, then reap proc."""
+    if os.name == 'nt':
+        subprocess.run(['taskkill', '/F', '/T', '/PID', str(proc.pid)],
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    else:
+        try:
+            os.killpg(proc.pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+    proc.kill()
+    proc.wait()
+
+
+def run_group(cmd: List[str], timeout: float, drain: float = 2.0, **kwargs) -> Tuple[Optional[int], Any, Any, bool]:
+    """
+    subprocess.run(capture_output=True) that kills the whole process group on
+    timeout. Returns (returncode, stdout, stderr, timed_out); after a timeout
+    the returncode is None and the output is whatever arrived within `drain`
+    seconds (None if a stray process still held the pipes).
+    """
+    proc = popen_group(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, **kwargs)
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+        return proc.returncode, stdout, stderr, False
+    except subprocess.TimeoutExpired:
+        kill_group(proc)
+    try:
+        stdout, stderr = proc.communicate(timeout=drain)
+    except subprocess.TimeoutExpired:
+        stdout = stderr = None
+    return None, stdout, stderr, True
@@ -0,0 +1,372 @@
+"""
+Opt-in per-rule / per-file profiling for the audit scripts.
+
+Most checker rules are a regex call, so the checkers swap their `re` module
+for a timing proxy. While no profiler is active the proxy just forwards the
+call; with `--profile` every pattern call is timed under a rule key made of
+its call site and pattern (or a label registered for it), and every file
+tracked with `track_file` is timed as a whole.
+
+Usage (in a checker):
+    re = profiling.instrument(re)          # right after `import re`
+    with profiling.track_file(path): ...   # around each file's checks
+
+    profiler = profiling.from_argv(sys.argv, 'ux_audit')
+    ...
+    if profiler: profiler.finish()
+
+CLI flags: --profile, --profile-top N (default 10), --profile-out FILE.
+FILE ending in .speedscope.json is written in speedscope format, .folded as
+collapsed stacks for flamegraph.pl, anything else as a JSON report.
+"""
+
+import json
+import os
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+OTHER = '(other)'
+_PATTERN_CHARS = 48
+
+_ACTIVE: Optional['Profiler'] = None
+_NULL = nullcontext()
+_LABELS: Dict[str, str] = {}
+
+
+class Profiler:
+    """Self time per rule, total time per file, and self time per (file, rule)."""
+
+    def __init__(self, name: str, top: int = 10, out_path: Optional[str] = None):
+        self.name = name
+        self.top = top
+        self.out_path = out_path
+        self.rules: Dict[str, List[float]] = {}      # key -> [calls, seconds]
+        self.files: Dict[str, float] = {}
+        self.stacks: Dict[Tuple[str, str], float] = {}
+        self.current_file = OTHER
+        self._children = [0.0]
+        self.started = time.perf_counter()
+        self.wall = 0.0
+
+    def enter(self) -> None:
+        self._children.append(0.0)
+
+    def leave(self, key: str, elapsed: float, calls: int = 1) -> None:
+        own = elapsed - self._children.pop()
+        self._children[-1] += elapsed
+        entry = self.rules.get(key)
+        if entry is None:
+            self.rules[key] = [calls, own]
+        else:
+            entry[0] += calls
+            entry[1] += own
+        stack = (self.current_file, key)
+        self.stacks[stack] = self.stacks.get(stack, 0.0) + own
+
+    def add_file(self, path: str, elapsed: float) -> None:
+        self.files[path] = self.files.get(path, 0.0) + elapsed
+
+    def stop(self) -> None:
+        self.wall = time.perf_counter() - self.started
+
+    # ------------------------------------------------------------------ report
+
+    def top_rules(self, n: int) -> List[Tuple[str, int, float]]:
+        ranked = sorted(self.rules.items(), key=lambda item: item[1][1], reverse=True)
+        return [(key, int(calls), secs) for key, (calls, secs) in ranked[:n]]
+
+    def top_files(self, n: int) -> List[Tuple[str, float]]:
+        return sorted(self.files.items(), key=lambda item: item[1], reverse=True)[:n]
+
+    def to_dict(self, top: int = 10) -> dict:
+        return {
+            "tool": self.name,
+            "wall_seconds": round(self.wall, 4),
+            "rule_seconds": round(sum(secs for _, secs in self.rules.values()), 4),
+            "files_profiled": len(self.files),
+            "rules": [{"rule": key, "calls": calls, "seconds": round(secs, 6)}
+                      for key, calls, secs in self.top_rules(top)],
+            "files": [{"file": path, "seconds": round(secs, 6)}
+                      for path, secs in self.top_files(top)],
+        }
+
+    def print_report(self, top: int = 10, out=None) -> None:
+        """Human-readable top-N report (stderr by default, so --json stays clean)."""
+        out = out or sys.stderr
+        total = sum(secs for _, secs in self.rules.values()) or 1e-9
+        print(f"\n[PROFILE] {self.name}: {len(self.files)} files, {len(self.rules)} rules, "
+              f"{self.wall:.3f}s wall", file=out)
+        print(f"  Top {top} rules (self time):", file=out)
+        for key, calls, secs in self.top_rules(top):
+            print(f"  {secs * 1000:9.1f}ms {secs / total * 100:5.1f}% {calls:8d}x  {key}", file=out)
+        print(f"  Top {top} files:", file=out)
+        for path, secs in self.top_files(top):
+            print(f"  {secs * 1000:9.1f}ms  {path}", file=out)
+
+    def _file_stacks(self) -> Iterator[Tuple[Tuple[str, ...], float]]:
+        """(stack, seconds) pairs; file time not spent in a rule is its own frame."""
+        in_rules: Dict[str, float] = {}
+        for (path, key), secs in self.stacks.items():
+            in_rules[path] = in_rules.get(path, 0.0) + secs
+            yield (path, key), secs
+        for path, secs in self.files.items():
+            rest = secs - in_rules.get(path, 0.0)
+            if rest > 0:
+                yield (path,), rest
+
+    def to_speedscope(self) -> dict:
+        """Sampled speedscope profile: one weighted sample per (file, rule) stack."""
+        frames: List[dict] = []
+        index: Dict[str, int] = {}
+        samples, weights = [], []
+        for stack, secs in self._file_stacks():
+            ids = []
+            for name in stack:
+                if name not in index:
+                    index[name] = len(frames)
+                    frames.append({"name": name})
+                ids.append(index[name])
+            samples.append(ids)
+            weights.append(secs)
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": frames},
+            "profiles": [{
+                "type": "sampled",
+                "name": self.name,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": sum(weights),
+                "samples": samples,
+                "weights": weights,
+            }],
+            "name": self.name,
+            "exporter": "audit_kit.profiling",
+        }
+
+    def to_folded(self) -> str:
+        """Collapsed stacks (`file;rule microseconds`) for flamegraph.pl / inferno."""
+        lines = []
+        for stack, secs in self._file_stacks():
+            micros = int(secs * 1_000_000)
+            if micros:
+                frames = ';'.join(name.replace(';', ',') for name in (self.name,) + stack)
+                lines.append(f"{frames} {micros}")
+        return '\n'.join(lines) + '\n'
+
+    def write(self, path: str, top: int = 10) -> None:
+        if path.endswith('.folded'):
+            data = self.to_folded()
+        elif path.endswith('.speedscope.json'):
+            data = json.dumps(self.to_speedscope())
+        else:
+            data = json.dumps(self.to_dict(top), indent=2)
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(data)
+
+    def finish(self) -> None:
+        """Stop, deactivate, print the top-N report and write out_path if set."""
+        global _ACTIVE
+        self.stop()
+        if _ACTIVE is self:
+            _ACTIVE = None
+        self.print_report(self.top)
+        if self.out_path:
+            self.write(self.out_path, self.top)
+            print(f"  Profile written to {self.out_path}", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------- control
+
+def start(name: str, top: int = 10, out_path: Optional[str] = None) -> Profiler:
+    """Create a profiler and make it the active one."""
+    global _ACTIVE
+    _ACTIVE = Profiler(name, top, out_path)
+    return _ACTIVE
+
+
+def active() -> Optional[Profiler]:
+    return _ACTIVE
+
+
+def parse_profile_args(argv: List[str]) -> Tuple[bool, int, Optional[str]]:
+    """(enabled, top, out_path) from --profile / --profile-top N / --profile-out FILE."""
+    enabled, top, out_path = False, 10, None
+    for i, arg in enumerate(argv):
+        value = argv[i + 1] if i + 1 < len(argv) else None
+        if arg == '--profile':
+            enabled = True
+        elif arg.startswith('--profile-top'):
+            value = arg.split('=', 1)[1] if '=' in arg else value
+            if value and value.isdigit():
+                enabled, top = True, int(value)
+        elif arg.startswith('--profile-out'):
+            value = arg.split('=', 1)[1] if '=' in arg else value
+            if value:
+                enabled, out_path = True, value
+    return enabled, top, out_path
+
+
+def from_argv(argv: List[str], name: str) -> Optional[Profiler]:
+    """Start a profiler if any profile flag is present, else return None."""
+    enabled, top, out_path = parse_profile_args(argv)
+    return start(name, top, out_path) if enabled else None
+
+
+@contextmanager
+def _track(profiler: Profiler, path: str) -> Iterator[None]:
+    previous = profiler.current_file
+    profiler.current_file = path
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.add_file(path, time.perf_counter() - started)
+        profiler.current_file = previous
+
+
+def track_file(path: str):
+    """Attribute the enclosed work to `path`. A shared no-op when not profiling."""
+    if _ACTIVE is None:
+        return _NULL
+    return _track(_ACTIVE, str(path))
+
+
+@contextmanager
+def _timed_rule(profiler: Profiler, key: str) -> Iterator[None]:
+    profiler.enter()
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        profiler.leave(key, time.perf_counter() - started)
+
+
+def rule(name: str):
+    """Time a non-regex rule or phase (e.g. markup parsing) under `name`."""
+    if _ACTIVE is None:
+        return _NULL
+    return _timed_rule(_ACTIVE, name)
+
+
+def label(patterns: Iterable[Tuple[str, str]]) -> None:
+    """Report (pattern, rule name) pairs by name instead of by pattern text."""
+    for pattern, name in patterns:
+        _LABELS[pattern] = name
+
+
+# ----------------------------------------------------------------- re proxying
+
+def _rule_key(pattern, frame) -> str:
+    text = getattr(pattern, 'pattern', pattern)
+    if isinstance(text, bytes):
+        text = text.decode('utf-8', 'replace')
+    name = _LABELS.get(text)
+    if name is None:
+        name = '/' + (text if len(text) <= _PATTERN_CHARS else text[:_PATTERN_CHARS] + '...') + '/'
+    return f"{os.path.basename(frame.f_code.co_filename)}:{frame.f_lineno} {name}"
+
+
+def _timed_call(profiler: Profiler, key: str, func, args, kwargs):
+    profiler.enter()
+    started = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        profiler.leave(key, time.perf_counter() - started)
+
+
+def _timed_iter(profiler: Profiler, key: str, iterator) -> Iterator:
+    """finditer does its work lazily, so time each step of the iteration."""
+    calls = 1
+    while True:
+        profiler.enter()
+        started = time.perf_counter()
+        try:
+            item = next(iterator)
+        except StopIteration:
+            profiler.leave(key, time.perf_counter() - started, calls)
+            return
+        profiler.leave(key, time.perf_counter() - started, calls)
+        calls = 0
+        yield item
+
+
+_METHODS = ('search', 'match', 'fullmatch', 'findall', 'sub', 'subn', 'split')
+
+
+class _TimedPattern:
+    """Compiled pattern whose match methods are timed under its compile site."""
+
+    __slots__ = ('_pattern', '_key')
+
+    def __init__(self, pattern, key: str):
+        self._pattern = pattern
+        self._key = key
+
+    def __getattr__(self, name):
+        return getattr(self._pattern, name)
+
+    def finditer(self, *args, **kwargs):
+        result = self._pattern.finditer(*args, **kwargs)
+        profiler = _ACTIVE
+        return result if profiler is None else _timed_iter(profiler, self._key, result)
+
+
+def _pattern_method(name):
+    def method(self, *args, **kwargs):
+        func = getattr(self._pattern, name)
+        profiler = _ACTIVE
+        if profiler is None:
+            return func(*args, **kwargs)
+        return _timed_call(profiler, self._key, func, args, kwargs)
+    method.__name__ = name
+    return method
+
+
+class _TimedRe:
+    """Stand-in for the `re` module; constants and anything else fall through."""
+
+    def __init__(self, module):
+        self._re = module
+
+    def __getattr__(self, name):
+        return getattr(self._re, name)
+
+    def compile(self, pattern, flags=0):
+        if isinstance(pattern, _TimedPattern):
+            return pattern
+        return _TimedPattern(self._re.compile(pattern, flags), _rule_key(pattern, sys._getframe(1)))
+
+    def finditer(self, pattern, *args, **kwargs):
+        pattern = getattr(pattern, '_pattern', pattern)
+        result = self._re.finditer(pattern, *args, **kwargs)
+        profiler = _ACTIVE
+        if profiler is None:
+            return result
+        return _timed_iter(profiler, _rule_key(pattern, sys._getframe(1)), result)
+
+
+def _module_function(name):
+    def function(self, pattern, *args, **kwargs):
+        pattern = getattr(pattern, '_pattern', pattern)
+        func = getattr(self._re, name)
+        profiler = _ACTIVE
+        if profiler is None:
+            return func(pattern, *args, **kwargs)
+        return _timed_call(profiler, _rule_key(pattern, sys._getframe(1)), func,
+                           (pattern,) + args, kwargs)
+    function.__name__ = name
+    return function
+
+
+for _name in _METHODS:
+    setattr(_TimedPattern, _name, _pattern_method(_name))
+    setattr(_TimedRe, _name, _module_function(_name))
+
+
+def instrument(re_module) -> _TimedRe:
+    """Wrap a checker's `re` module so its pattern calls can be profiled."""
+    return _TimedRe(re_module)
@@ -4,15 +4,23 @@ Schema Validator - Database schema validation
 Validates Prisma schemas and checks for common issues.
 
 Usage:
-    python schema_validator.py <project_path>
+    python schema_validator.py <project_path> [--queries src]
 
 Checks:
     - Prisma schema syntax
     - Missing relations
     - Index recommendations
     - Naming conventions
+    - Raw SQL migrations (e.g. supabase/*.sql): the CREATE/ALTER TABLE and
+      CREATE INDEX statements are folded into one table/column/index model and
+      cross-referenced with the filters and sorts of Supabase query chains
+      (`.from('t').eq('col', ..).order('col')`) found under --queries:
+      unindexed filter/order columns, missing composite indexes, indexes that
+      duplicate a PRIMARY KEY/UNIQUE constraint or another index's prefix, and
+      indexes no scanned query uses
 """
 
+import os
 import sys
 import json
 import re
@@ -26,6 +34,23 @@ except:
     pass
 
 
+SKIP_DIRS = {'node_modules', '.git', '.next', 'dist', 'build', '__pycache__', '.venv', 'venv'}
+QUERY_EXTENSIONS = {'.ts', '.tsx', '.js', '.jsx', '.mjs'}
+
+# Supabase filter methods whose first argument is a column name
+FILTER_METHODS = {'eq', 'neq', 'gt', 'gte', 'lt', 'lte', 'like', 'ilike', 'is', 'in',
+                  'contains', 'containedBy', 'textSearch'}
+PATTERN_METHODS = {'like', 'ilike', 'textSearch', 'contains', 'containedBy'}
+WRITE_METHODS = ('select', 'insert', 'update', 'upsert', 'delete')
+COLUMN_KEYWORDS = r'DEFAULT|NOT|NULL|PRIMARY|UNIQUE|REFERENCES|CHECK|CONSTRAINT|GENERATED|COLLATE'
+
+FROM_CALL = re.compile(r'\.from\(\s*[\'"`]([A-Za-z_][\w.]*)[\'"`]\s*\)')
+METHOD_CALL = re.compile(r'\.(\w+)\(\s*(?:[\'"`]([\w.]+)[\'"`])?')
+ORDER_CALL = re.compile(r'\.order\(\s*[\'"`](\w+)[\'"`]\s*(?:,\s*\{([^}]*)\})?')
+MATCH_CALL = re.compile(r'\.match\(\s*\{([^}]*)\}')
+OR_FILTER = re.compile(r'(\w+)\.(eq|neq|gt|gte|lt|lte|like|ilike|is|in|cs|cd|fts)\.')
+
+
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
     schemas = []
@@ -41,7 +66,14 @@ def find_schema_files(project_path: Path) -> list:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
     
-    return schemas[:10]  # Limit
+    schemas = schemas[:10]  # Limit
+
+    # Raw SQL migrations, checked together as one model
+    for root, dirs, files in os.walk(project_path):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        schemas.extend(('sql', Path(root) / f) for f in sorted(files) if f.endswith('.sql'))
+
+    return schemas
 
 
 def validate_prisma_schema(file_path: Path) -> list:
@@ -91,8 +123,400 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
+# ---------------------------------------------------------------------------
+# Raw SQL: DDL model
+# ---------------------------------------------------------------------------
+
+def split_sql_statements(sql: str) -> list:
+    """Split SQL on top-level semicolons, dropping comments; quotes and $$ bodies stay intact."""
+    statements, current = [], []
+    i, n = 0, len(sql)
+    while i < n:
+        ch = sql[i]
+        if sql.startswith('--', i):
+            end = sql.find('\n', i)
+            i = n if end == -1 else end
+            continue
+        if sql.startswith('/*', i):
+            end = sql.find('*/', i + 2)
+            i = n if end == -1 else end + 2
+            continue
+        if ch in ("'", '"'):
+            end = i + 1
+            while end < n and not (sql[end] == ch and not sql.startswith(ch * 2, end)):
+                end += 2 if sql.startswith(ch * 2, end) else 1
+            current.append(sql[i:end + 1])
+            i = end + 1
+            continue
+        dollar = re.match(r'\$(\w*)\$', sql[i:i + 64]) if ch == '$' else None
+        if dollar:
+            tag = dollar.group(0)
+            end = sql.find(tag, i + len(tag))
+            end = n if end == -1 else end + len(tag)
+            current.append(sql[i:end])
+            i = end
+            continue
+        if ch == ';':
+            statement = ''.join(current).strip()
+            if statement:
+                statements.append(statement)
+            current = []
+        else:
+            current.append(ch)
+        i += 1
+    statement = ''.join(current).strip()
+    if statement:
+        statements.append(statement)
+    return statements
+
+
+def split_top_level(text: str) -> list:
+    """Split on commas outside parentheses and quotes."""
+    parts, depth, quote, start = [], 0, None, 0
+    for i, ch in enumerate(text):
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+        elif ch == ',' and depth == 0:
+            parts.append(text[start:i].strip())
+            start = i + 1
+    parts.append(text[start:].strip())
+    return [p for p in parts if p]
+
+
+def paren_body(text: str, start: int) -> tuple:
+    """(contents, end) of the parenthesised group opening at or after start."""
+    open_at = text.find('(', start)
+    if open_at == -1:
+        return '', len(text)
+    depth, quote = 0, None
+    for i in range(open_at, len(text)):
+        ch = text[i]
+        if quote:
+            if ch == quote:
+                quote = None
+        elif ch in ("'", '"'):
+            quote = ch
+        elif ch == '(':
+            depth += 1
+        elif ch == ')':
+            depth -= 1
+            if depth == 0:
+                return text[open_at + 1:i], i + 1
+    return text[open_at + 1:], len(text)
+
+
+def sql_name(name: str) -> str:
+    """Unquoted identifier; the default public schema is dropped."""
+    name = name.replace('"', '').strip()
+    return name[len('public.'):] if name.lower().startswith('public.') else name
+
+
+def column_list(text: str) -> list:
+    return [sql_name(c.split()[0]) for c in split_top_level(text)]
+
+
+def _table(model: dict, name: str, source: str) -> dict:
+    return model.setdefault(name, {
+        'columns': {}, 'primary_key': [], 'unique': [], 'indexes': [], 'file': source
+    })
+
+
+def _add_column(table: dict, definition: str):
+    match = re.match(rf'("?\w+"?)\s+(.+?)(?=\s+(?:{COLUMN_KEYWORDS})\b|$)', definition, re.I | re.S)
+    if not match:
+        return
+    column = sql_name(match.group(1))
+    table['columns'][column] = ' '.join(match.group(2).split())
+    flags = re.sub(r"'[^']*'", "''", definition).upper()
+    if re.search(r'\bPRIMARY\s+KEY\b', flags):
+        table['primary_key'] = [column]
+    elif re.search(r'\bUNIQUE\b', flags):
+        table['unique'].append([column])
+
+
+def _add_constraint(table: dict, definition: str):
+    definition = re.sub(r'^CONSTRAINT\s+"?\w+"?\s+', '', definition, flags=re.I)
+    kind = re.match(r'(PRIMARY\s+KEY|UNIQUE)\s*\(', definition, re.I)
+    if kind:
+        columns = column_list(paren_body(definition, 0)[0])
+        if kind.group(1).upper() == 'UNIQUE':
+            table['unique'].append(columns)
+        else:
+            table['primary_key'] = columns
+
+
+def _is_constraint(definition: str) -> bool:
+    return bool(re.match(r'(CONSTRAINT|PRIMARY\s+KEY|UNIQUE|FOREIGN\s+KEY|CHECK|EXCLUDE)\b', definition, re.I))
+
+
+def parse_index_columns(text: str) -> list:
+    """Index elements as (column-or-expression, descending)."""
+    columns = []
+    for element in split_top_level(text):
+        match = re.match(r'("?\w+"?)(?:\s+\w+_ops)?(\s+(ASC|DESC))?(\s+NULLS\s+(FIRST|LAST))?\s*$', element, re.I)
+        if match:
+            columns.append((sql_name(match.group(1)), (match.group(3) or '').upper() == 'DESC'))
+        else:
+            columns.append((' '.join(element.split()), False))
+    return columns
+
+
+def apply_ddl(model: dict, statement: str, source: str):
+    """Fold one DDL statement into the model; non-DDL statements are ignored."""
+    match = re.match(r'CREATE\s+(?:UNLOGGED\s+|TEMP(?:ORARY)?\s+)?TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([\w."]+)',
+                     statement, re.I)
+    if match:
+        table = _table(model, sql_name(match.group(1)), source)
+        table['file'] = source
+        body, _ = paren_body(statement, match.end())
+        for definition in split_top_level(body):
+            if _is_constraint(definition):
+                _add_constraint(table, definition)
+            else:
+                _add_column(table, definition)
+        return
+
+    match = re.match(r'ALTER\s+TABLE\s+(?:IF\s+EXISTS\s+)?(?:ONLY\s+)?([\w."]+)\s+(.*)$', statement, re.I | re.S)
+    if match:
+        table = _table(model, sql_name(match.group(1)), source)
+        for action in split_top_level(match.group(2)):
+            add = re.match(r'ADD\s+(?:COLUMN\s+)?(?:IF\s+NOT\s+EXISTS\s+)?(.*)$', action, re.I | re.S)
+            drop = re.match(r'DROP\s+(?:COLUMN\s+)?(?:IF\s+EXISTS\s+)?("?\w+"?)', action, re.I)
+            if add and _is_constraint(add.group(1)):
+                _add_constraint(table, add.group(1))
+            elif add:
+                _add_column(table, add.group(1))
+            elif drop and drop.group(1).upper() != 'CONSTRAINT':
+                # Postgres drops the constraints and indexes that use the column too
+                column = sql_name(drop.group(1))
+                table['columns'].pop(column, None)
+                table['unique'] = [cols for cols in table['unique'] if column not in cols]
+                table['indexes'] = [ix for ix in table['indexes']
+                                    if column not in (c for c, _ in ix['columns'])]
+        return
+
+    match = re.match(r'CREATE\s+(UNIQUE\s+)?INDEX\s+(?:CONCURRENTLY\s+)?(?:IF\s+NOT\s+EXISTS\s+)?'
+                     r'([\w."]+)?\s*ON\s+(?:ONLY\s+)?([\w."]+)\s*(?:USING\s+(\w+)\s*)?', statement, re.I)
+    if match:
+        table = _table(model, sql_name(match.group(3)), source)
+        columns_text, end = paren_body(statement, match.end())
+        name = sql_name(match.group(2) or f"{sql_name(match.group(3))}_idx")
+        table['indexes'] = [ix for ix in table['indexes'] if ix['name'] != name]
+        table['indexes'].append({
+            'name': name,
+            'columns': parse_index_columns(columns_text),
+            'unique': bool(match.group(1)),
+            'method': (match.group(4) or 'btree').lower(),
+            'partial': bool(re.search(r'\bWHERE\b', statement[end:], re.I)),
+            'file': source,
+        })
+        return
+
+    match = re.match(r'DROP\s+(INDEX|TABLE)\s+(?:CONCURRENTLY\s+)?(?:IF\s+EXISTS\s+)?(.*)$', statement, re.I | re.S)
+    if match:
+        for name in column_list(re.sub(r'\s+(CASCADE|RESTRICT)\s*$', '', match.group(2), flags=re.I)):
+            if match.group(1).upper() == 'TABLE':
+                model.pop(name, None)
+                continue
+            for table in model.values():
+                table['indexes'] = [ix for ix in table['indexes'] if ix['name'] != name]
+
+
+def build_sql_model(files: list, project_path: Path) -> dict:
+    """Table/column/index model of every SQL file, in path order."""
+    model = {}
+    for file_path in sorted(files):
+        try:
+            sql = file_path.read_text(encoding='utf-8', errors='ignore')
+        except OSError:
+            continue
+        source = str(file_path.relative_to(project_path))
+        for statement in split_sql_statements(sql):
+            apply_ddl(model, statement, source)
+    return model
+
+
+def access_paths(table: dict) -> list:
+    """Every btree access path: (name, leading columns, kind) incl. PK/UNIQUE constraints."""
+    paths = []
+    if table['primary_key']:
+        paths.append(('PRIMARY KEY', table['primary_key'], 'constraint'))
+    for columns in table['unique']:
+        paths.append((f"UNIQUE ({', '.join(columns)})", columns, 'constraint'))
+    for index in table['indexes']:
+        if index['method'] == 'btree' and not index['partial']:
+            paths.append((index['name'], [c for c, _ in index['columns']], 'index'))
+    return paths
+
+
+# ---------------------------------------------------------------------------
+# Raw SQL: Supabase query shapes
+# ---------------------------------------------------------------------------
+
+def find_supabase_queries(query_root: Path, project_path: Path) -> list:
+    """Filters and sorts of every `.from('table')...` chain under query_root."""
+    queries = []
+    for root, dirs, files in os.walk(query_root):
+        dirs[:] = sorted(d for d in dirs if d not in SKIP_DIRS)
+        for name in sorted(files):
+            if os.path.splitext(name)[1] not in QUERY_EXTENSIONS:
+                continue
+            path = Path(root) / name
+            try:
+                content = path.read_text(encoding='utf-8', errors='ignore')
+            except OSError:
+                continue
+            if '.from(' not in content:
+                continue
+            starts = [m for m in FROM_CALL.finditer(content)]
+            for i, match in enumerate(starts):
+                limit = starts[i + 1].start() if i + 1 < len(starts) else len(content)
+                semicolon = content.find(';', match.end(), limit)
+                chain = content[match.end():semicolon if semicolon != -1 else limit]
+                queries.append(parse_query_chain(
+                    match.group(1), chain,
+                    f"{path.relative_to(project_path)}:{content.count(chr(10), 0, match.start()) + 1}"))
+    return queries
+
+
+def parse_query_chain(table: str, chain: str, location: str) -> dict:
+    query = {'table': sql_name(table), 'location': location, 'operation': None,
+             'filters': [], 'order': []}
+    for method, column in METHOD_CALL.findall(chain):
+        # `.insert(..).select()` is an insert; a bare `.select()` is a read
+        if method in WRITE_METHODS and query['operation'] in (None, 'select'):
+            query['operation'] = method
+        elif method in FILTER_METHODS and column:
+            query['filters'].append((column, method))
+    for keys in MATCH_CALL.findall(chain):
+        query['filters'].extend((key, 'eq') for key in re.findall(r'(\w+)\s*:', keys))
+    for expression in re.findall(r'\.or\(\s*[\'"`]([^\'"`]*)', chain):
+        query['filters'].extend((column, 'or') for column, _ in OR_FILTER.findall(expression))
+    for column, options in ORDER_CALL.findall(chain):
+        descending = bool(re.search(r'ascending\s*:\s*false', options or ''))
+        query['order'].append((column, descending))
+    query['operation'] = query['operation'] or 'select'
+    return query
+
+
+def _covered(paths: list, prefix: list) -> bool:
+    """True when some access path starts with the given columns (equality prefix in any order)."""
+    for _, columns, _ in paths:
+        if len(columns) >= len(prefix) and sorted(columns[:len(prefix)]) == sorted(prefix):
+            return True
+    return False
+
+
+def _covered_sorted(paths: list, equality: list, order_column: str) -> bool:
+    for _, columns, _ in paths:
+        n = len(equality)
+        if len(columns) > n and sorted(columns[:n]) == sorted(equality) and columns[n] == order_column:
+            return True
+    return False
+
+
+def analyze_index_coverage(model: dict, queries: list) -> dict:
+    """Issues per schema file: unindexed filters/sorts, missing composites, redundant and unused indexes."""
+    issues = {}
+
+    def report(table_name: str, message: str):
+        source = model[table_name]['file'] if table_name in model else '(queries)'
+        if message not in issues.setdefault(source, []):
+            issues[source].append(message)
+
+    used = set()
+    for query in queries:
+        name = query['table']
+        if name not in model:
+            report(name, f"Query on '{name}' ({query['location']}) but no CREATE TABLE for it in the SQL files")
+            continue
+        if query['operation'] == 'insert' and not query['filters']:
+            continue
+        table = model[name]
+        paths = access_paths(table)
+        for column in [c for c, _ in query['filters']] + [c for c, _ in query['order']]:
+            if column not in table['columns']:
+                report(name, f"{name}.{column} used by {query['location']} is not a column in the schema")
+
+        equality = list(dict.fromkeys(c for c, op in query['filters'] if op == 'eq'))
+        # A unique equality lookup (id, slug) needs nothing else
+        unique_keys = [cols for _, cols, kind in paths if kind == 'constraint'] + \
+                      [[c for c, _ in ix['columns']] for ix in table['indexes'] if ix['unique']]
+        if any(set(cols) <= set(equality) for cols in unique_keys):
+            used.update((name, p) for p, cols, _ in paths if cols[0] in equality)
+            continue
+
+        # One indexed filter column is enough for an index scan; the rest are rechecked
+        filter_columns = list(dict.fromkeys(c for c, op in query['filters'] if op not in PATTERN_METHODS))
+        indexed = any(_covered(paths, [column]) for column in filter_columns)
+        for column, op in query['filters']:
+            if op in PATTERN_METHODS:
+                if not any(ix['method'] in ('gin', 'gist') and any(column in c for c, _ in ix['columns'])
+                           for ix in table['indexes']):
+                    report(name, f"Pattern/text filter .{op}('{column}') on {name} ({query['location']}) "
+                                 f"has no GIN/trigram index; a btree index cannot serve it")
+            elif not indexed:
+                report(name, f"Unindexed filter column {name}.{column} ({query['location']}): "
+                             f"CREATE INDEX ON {name}({column})")
+
+        if len(equality) > 1 and not _covered(paths, equality):
+            report(name, f"Missing composite index for {name} filters on {', '.join(equality)} "
+                         f"({query['location']}): CREATE INDEX ON {name}({', '.join(equality)})")
+
+        if query['order'] and query['order'][0][0] not in equality:
+            order_column, descending = query['order'][0]
+            if equality and not _covered_sorted(paths, equality, order_column):
+                columns = ', '.join(equality + [order_column + (' DESC' if descending else '')])
+                report(name, f"Missing composite index for {name} filtered on {', '.join(equality)} "
+                             f"ordered by {order_column} ({query['location']}): CREATE INDEX ON {name}({columns})")
+            elif not equality and not _covered(paths, [order_column]):
+                report(name, f"Unindexed order column {name}.{order_column} ({query['location']}): "
+                             f"sorts the whole table; CREATE INDEX ON {name}({order_column}"
+                             f"{' DESC' if descending else ''})")
+
+        for path_name, columns, _ in paths:
+            if columns[0] in equality or (query['order'] and columns[0] == query['order'][0][0]):
+                used.add((name, path_name))
+
+    for name, table in model.items():
+        constraint_keys = [cols for _, cols, kind in access_paths(table) if kind == 'constraint']
+        for index in table['indexes']:
+            columns = [c for c, _ in index['columns']]
+            if index['method'] != 'btree' or index['partial']:
+                continue
+            duplicate = next((cols for cols in constraint_keys if cols == columns), None)
+            if duplicate:
+                kind = 'PRIMARY KEY' if duplicate == table['primary_key'] else 'UNIQUE constraint'
+                report(name, f"Redundant index {index['name']} on {name}({', '.join(columns)}): "
+                             f"the {kind} on ({', '.join(duplicate)}) already provides this index")
+                continue
+            wider = next((other for other in table['indexes']
+                          if other is not index and other['method'] == 'btree' and not other['partial']
+                          and len(other['columns']) > len(columns)
+                          and [c for c, _ in other['columns'][:len(columns)]] == columns), None)
+            if wider and not index['unique']:
+                report(name, f"Redundant index {index['name']} on {name}({', '.join(columns)}): "
+                             f"it is a prefix of {wider['name']}")
+            elif queries and (name, index['name']) not in used and not index['unique']:
+                report(name, f"Index {index['name']} on {name}({', '.join(columns)}) is not used by any "
+                             f"scanned query (write cost only)")
+    return issues
+
+
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = [a for i, a in enumerate(sys.argv[1:], 1)
+            if not a.startswith('--') and sys.argv[i - 1] != '--queries']
+    project_path = Path(args[0] if args else ".").resolve()
+    query_root = project_path / 'src'
+    if '--queries' in sys.argv[:-1]:
+        query_root = project_path / sys.argv[sys.argv.index('--queries') + 1]
     
     print(f"\n{'='*60}")
     print(f"[SCHEMA VALIDATOR] Database Schema Validation")
@@ -119,8 +543,11 @@ def main():
     
     # Validate each schema
     all_issues = []
+    sql_files = [f for schema_type, f in schemas if schema_type == 'sql']
     
     for schema_type, file_path in schemas:
+        if schema_type == 'sql':
+            continue
         print(f"\nValidating: {file_path.name} ({schema_type})")
         
         if schema_type == 'prisma':
@@ -135,6 +562,18 @@ def main():
                 "issues": issues
             })
     
+    if sql_files:
+        model = build_sql_model(sql_files, project_path)
+        queries = find_supabase_queries(query_root, project_path) if query_root.is_dir() else []
+        print(f"\nValidating: {len(sql_files)} SQL files (sql) - {len(model)} tables, "
+              f"{sum(len(t['indexes']) for t in model.values())} indexes, {len(queries)} queries")
+        for source, issues in sorted(analyze_index_coverage(model, queries).items()):
+            all_issues.append({
+                "file": source,
+                "type": "sql",
+                "issues": issues
+            })
+    
     # Summary
     print("\n" + "="*60)
     print("SCHEMA ISSUES")
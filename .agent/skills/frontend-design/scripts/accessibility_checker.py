@@ -16,10 +16,12 @@ Checks:
 
 import sys
 import json
-import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit import markup
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -47,60 +49,59 @@ def check_accessibility(file_path: Path) -> list:
     
     try:
         content = file_path.read_text(encoding='utf-8', errors='ignore')
+        doc = markup.load(str(file_path), content)
         
         # Check for form inputs without labels
-        inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
-        for inp in inputs:
-            if 'type="hidden"' not in inp.lower():
-                if 'aria-label' not in inp.lower() and 'id=' not in inp.lower():
+        for inp in doc.find('input'):
+            if str(inp.get('type', '')).lower() != 'hidden' and not inp.spread:
+                if not inp.has('aria-label') and not inp.has('aria-labelledby') and not inp.has('id'):
                     issues.append("Input without label or aria-label")
                     break
         
-        # Check for buttons without accessible text
-        buttons = re.findall(r'<button[^>]*>[^<]*</button>', content, re.IGNORECASE)
-        for btn in buttons:
-            # Check if button has text content or aria-label
-            if 'aria-label' not in btn.lower():
-                text = re.sub(r'<[^>]+>', '', btn)
-                if not text.strip():
+        # Check for buttons without accessible text (icon-only buttons included)
+        for btn in doc.find('button'):
+            if btn.close is None or btn.spread:
+                continue
+            if not btn.has('aria-label') and not btn.has('aria-labelledby') and not btn.has('title'):
+                if not doc.inner_text(btn):
                     issues.append("Button without accessible text")
                     break
         
         # Check for missing lang attribute
-        if '<html' in content.lower() and 'lang=' not in content.lower():
+        html = doc.find('html')
+        if html and not html[0].has('lang'):
             issues.append("Missing lang attribute on <html>")
         
         # Check for missing skip link
-        if '<main' in content.lower() or '<body' in content.lower():
+        if doc.count('main', 'body'):
             if 'skip' not in content.lower() and '#main' not in content.lower():
                 issues.append("Consider adding skip-to-main-content link")
         
         # Check for click handlers without keyboard support
-        onclick_count = content.lower().count('onclick=')
-        onkeydown_count = content.lower().count('onkeydown=') + content.lower().count('onkeyup=')
+        onclick_count = len(doc.with_attr('onclick'))
+        onkeydown_count = len(doc.with_attr('onkeydown')) + len(doc.with_attr('onkeyup'))
         if onclick_count > 0 and onkeydown_count == 0:
             issues.append("onClick without keyboard handler (onKeyDown)")
         
         # Check for tabIndex misuse
-        if 'tabindex=' in content.lower():
-            if 'tabindex="-1"' not in content.lower() and 'tabindex="0"' not in content.lower():
-                positive_tabindex = re.findall(r'tabindex="([1-9]\d*)"', content, re.IGNORECASE)
-                if positive_tabindex:
-                    issues.append("Avoid positive tabIndex values")
+        for el in doc.with_attr('tabindex'):
+            value = str(el.get('tabindex')).strip('{} ')
+            if value.isdigit() and int(value) > 0:
+                issues.append("Avoid positive tabIndex values")
+                break
         
         # Check for autoplay media
-        if 'autoplay' in content.lower():
-            if 'muted' not in content.lower():
+        for media in doc.with_attr('autoplay'):
+            if not media.has('muted'):
                 issues.append("Autoplay media should be muted")
+                break
         
         # Check for role usage
-        if 'role="button"' in content.lower():
-            # Divs with role button should have tabindex
-            div_buttons = re.findall(r'<div[^>]*role="button"[^>]*>', content, re.IGNORECASE)
-            for div in div_buttons:
-                if 'tabindex' not in div.lower():
-                    issues.append("role='button' without tabindex")
-                    break
+        # Divs with role button should have tabindex
+        for div in doc.find('div'):
+            if div.get('role') == 'button' and not div.has('tabindex'):
+                issues.append("role='button' without tabindex")
+                break
         
     except Exception as e:
         issues.append(f"Error reading file: {str(e)[:50]}")
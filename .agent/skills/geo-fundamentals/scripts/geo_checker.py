@@ -14,13 +14,19 @@ WHAT IT CHECKS:
     - NOT markdown files (those are developer docs, not public content)
 
 Usage:
-    python geo_checker.py <project_path>
+    python geo_checker.py <project_path> [--profile] [--profile-out prof.speedscope.json]
 """
 import sys
 import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit import profiling
+
+# Times each pattern per file when run with --profile; a plain pass-through otherwise
+re = profiling.instrument(re)
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -222,6 +228,7 @@ def check_page(file_path: Path) -> dict:
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
+    profiler = profiling.from_argv(sys.argv, 'geo_checker')
     
     print("\n" + "=" * 60)
     print("  GEO CHECKER - AI Citation Readiness Audit")
@@ -245,7 +252,8 @@ def main():
     # Check each page
     results = []
     for page in pages:
-        result = check_page(page)
+        with profiling.track_file(page):
+            result = check_page(page)
         results.append(result)
     
     # Print results
@@ -281,6 +289,7 @@ def main():
         "passed": avg_score >= 60
     }
     print("\n" + json.dumps(output, indent=2))
+    if profiler: profiler.finish()
     
     sys.exit(0 if avg_score >= 60 else 1)
 
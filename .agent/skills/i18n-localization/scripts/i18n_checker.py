@@ -2,12 +2,23 @@
 """
 i18n Checker - Detects hardcoded strings and missing translations.
 Scans for untranslated text in React, Vue, and Python files.
+
+Usage:
+    python i18n_checker.py <project_path> [--profile] [--profile-out prof.speedscope.json]
 """
 import sys
 import re
 import json
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit import profiling
+from audit_kit.files import read_text
+from audit_kit.parallel import walk_files
+
+# Times each pattern per file when run with --profile; a plain pass-through otherwise
+re = profiling.instrument(re)
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -50,22 +61,44 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
-def find_locale_files(project_path: Path) -> list:
-    """Find translation/locale files."""
-    patterns = [
-        "**/locales/**/*.json",
-        "**/translations/**/*.json",
-        "**/lang/**/*.json",
-        "**/i18n/**/*.json",
-        "**/messages/*.json",
-        "**/*.po",  # gettext
-    ]
-    
-    files = []
-    for pattern in patterns:
-        files.extend(project_path.glob(pattern))
+# Code file extension -> HARDCODED_PATTERNS key
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+LOCALE_EXTENSIONS = {'.json', '.po'}
+# Never descended into (pruned during the walk, not filtered afterwards)
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', '__pycache__', 'venv', '.venv'}
+# Path parts containing these are test code, not user-facing strings
+TEST_MARKERS = ('test', 'spec')
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}
+
+# Compiled once: any i18n call marks the file as translated, and each
+# hardcoded-string rule only needs its first match for the example
+I18N_RE = re.compile('|'.join(f'(?:{p})' for p in I18N_PATTERNS))
+HARDCODED_RES = {kind: [re.compile(p) for p in patterns] for kind, patterns in HARDCODED_PATTERNS.items()}
+
+
+def collect_files(project_path: Path) -> list:
+    """One pruned walk for both code and locale files."""
+    extensions = set(CODE_EXTENSIONS) | LOCALE_EXTENSIONS
+    return [Path(f) for f in walk_files(str(project_path), extensions, SKIP_DIRS)]
+
+def find_locale_files(project_path: Path, files: list = None) -> list:
+    """Find translation/locale files (*/locales/**, */messages/*.json, *.po, ...)."""
+    if files is None:
+        files = collect_files(project_path)
     
-    return [f for f in files if 'node_modules' not in str(f)]
+    locale_files = []
+    for f in files:
+        if f.suffix == '.po':
+            locale_files.append(f)
+        elif f.suffix == '.json':
+            dirs = f.relative_to(project_path).parts[:-1]
+            if LOCALE_DIRS.intersection(dirs) or (dirs and dirs[-1] == 'messages'):
+                locale_files.append(f)
+    return locale_files
 
 def check_locale_completeness(locale_files: list) -> dict:
     """Check if all locales have the same keys."""
@@ -128,24 +161,44 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
-    issues = []
-    passed = []
+def is_test_path(rel_path: Path) -> bool:
+    return any(marker in part for part in rel_path.parts for marker in TEST_MARKERS)
+
+def _first_match(rx, content: str):
+    """Same value as rx.findall(content)[0], without collecting every match."""
+    match = rx.search(content)
+    if match is None:
+        return None
+    if rx.groups == 0:
+        return match.group(0)
+    return match.group(1) if rx.groups == 1 else match.groups()
+
+def analyze_code_file(file_path: Path) -> tuple:
+    """(has_i18n, [first match of each hardcoded-string rule that fired])."""
+    content, _ = read_text(str(file_path), errors='ignore')
+    if content is None:
+        return False, []
     
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
+    # Files that use i18n are not reported, so their strings are never scanned
+    if I18N_RE.search(content):
+        return True, []
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    examples = []
+    for rx in HARDCODED_RES.get(CODE_EXTENSIONS.get(file_path.suffix, 'jsx'), []):
+        example = _first_match(rx, content)
+        if example is not None:
+            examples.append(example)
+    return False, examples
+
+def check_hardcoded_strings(project_path: Path, files: list = None) -> dict:
+    """Check every code file for hardcoded strings (test and build dirs excluded)."""
+    issues = []
+    passed = []
     
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    if files is None:
+        files = collect_files(project_path)
+    code_files = [f for f in files
+                  if f.suffix in CODE_EXTENSIONS and not is_test_path(f.relative_to(project_path))]
     
     if not code_files:
         return {'passed': ["[!] No code files found"], 'issues': []}
@@ -154,33 +207,19 @@ def check_hardcoded_strings(project_path: Path) -> dict:
     files_with_hardcoded = 0
     hardcoded_examples = []
     
-    for file_path in code_files[:50]:  # Limit
+    for file_path in code_files:
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
-        except:
+            with profiling.track_file(file_path):
+                has_i18n, examples = analyze_code_file(file_path)
+        except Exception:
             continue
+        
+        if has_i18n:
+            files_with_i18n += 1
+        elif examples:
+            files_with_hardcoded += 1
+            for example in examples[:5 - len(hardcoded_examples)]:
+                hardcoded_examples.append(f"{file_path.name}: {str(example)[:40]}...")
     
     passed.append(f"[OK] Analyzed {len(code_files)} code files")
     
@@ -199,17 +238,20 @@ def check_hardcoded_strings(project_path: Path) -> dict:
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     project_path = Path(target)
+    profiler = profiling.from_argv(sys.argv, 'i18n_checker')
     
     print("\n" + "=" * 60)
     print("  i18n CHECKER - Internationalization Audit")
     print("=" * 60 + "\n")
     
+    files = collect_files(project_path)
+    
     # Check locale files
-    locale_files = find_locale_files(project_path)
+    locale_files = find_locale_files(project_path, files)
     locale_result = check_locale_completeness(locale_files)
     
     # Check hardcoded strings
-    code_result = check_hardcoded_strings(project_path)
+    code_result = check_hardcoded_strings(project_path, files)
     
     # Print results
     print("[LOCALE FILES]")
@@ -230,6 +272,7 @@ def main():
     critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
     
     print("\n" + "=" * 60)
+    if profiler: profiler.finish()
     if critical_issues == 0:
         print("[OK] i18n CHECK: PASSED")
         sys.exit(0)
@@ -4,19 +4,53 @@ Lint Runner - Unified linting and type checking
 Runs appropriate linters based on project type.
 
 Usage:
-    python lint_runner.py <project_path>
+    python lint_runner.py <project_path> [--budget SECONDS] [--jobs N] [--quiet]
+    python lint_runner.py <project_path> --changed [--base REF] [--hash-cache] [--cache-dir DIR]
+
+Linters run concurrently and share one wall-clock budget (default 120s), so a
+full run takes about as long as the slowest linter. Output is streamed live,
+prefixed with the linter name, unless --quiet is given.
+
+--changed lints only files changed in git (working tree and untracked files,
+or everything since --base REF). eslint, ruff and mypy get just those paths;
+tsc and `npm run lint` stay project-wide. All tools use their own caches
+under a managed cache dir (default <project>/.lint-cache). With --hash-cache,
+files whose content is unchanged since a linter last passed them are skipped;
+outside a git repo that cache is the only change detection.
 
 Supports:
     - Node.js: npm run lint, npx tsc --noEmit
     - Python: ruff check, mypy
 """
 
+import hashlib
+import os
 import subprocess
 import sys
 import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit.parallel import parse_jobs, walk_files
+from audit_kit.processes import kill_group, popen_group
+
+DEFAULT_BUDGET = 120
+# After a kill, how long to wait for output still buffered in the pipes
+DRAIN_TIMEOUT = 2
+CACHE_DIR_NAME = '.lint-cache'
+CLEAN_HASHES = 'clean-hashes.json'
+JS_EXTENSIONS = {'.js', '.jsx', '.ts', '.tsx', '.mjs', '.cjs'}
+TS_EXTENSIONS = {'.ts', '.tsx'}
+PY_EXTENSIONS = {'.py', '.pyi'}
+SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '.next', '__pycache__', 'venv', '.venv', CACHE_DIR_NAME}
+# Above this many paths a file-scoped linter runs on "." (its cache keeps it fast)
+MAX_FILE_ARGS = 1000
+VALUE_FLAGS = {'--budget', '--jobs', '--base', '--cache-dir'}
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -24,12 +58,28 @@ except:
     pass
 
 
-def detect_project_type(project_path: Path) -> dict:
-    """Detect project type and available linters."""
+def _scoped(files: list, extensions: set) -> list:
+    return [f for f in files if os.path.splitext(f)[1] in extensions]
+
+
+def _file_linter(name: str, cmd: list, files: list) -> dict:
+    """A linter that accepts paths; too many paths fall back to the whole project."""
+    if len(files) > MAX_FILE_ARGS:
+        return {"name": name, "cmd": cmd + ["."]}
+    return {"name": name, "cmd": cmd, "files": files}
+
+
+def detect_project_type(project_path: Path, changed: list = None, cache_dir: Path = None) -> dict:
+    """
+    Detect project type and available linters. With `changed` (paths relative
+    to project_path), file-scoped linters only get matching changed files, are
+    left out when there are none, and run with their caches in cache_dir.
+    """
     result = {
         "type": "unknown",
         "linters": []
     }
+    incremental = changed is not None
     
     # Node.js project
     package_json = project_path / "package.json"
@@ -40,15 +90,27 @@ def detect_project_type(project_path: Path) -> dict:
             scripts = pkg.get("scripts", {})
             deps = {**pkg.get("dependencies", {}), **pkg.get("devDependencies", {})}
             
-            # Check for lint script
-            if "lint" in scripts:
+            # Check for lint script (eslint is called directly so it can take paths)
+            if incremental and "eslint" in deps:
+                js_files = _scoped(changed, JS_EXTENSIONS)
+                if js_files:
+                    result["linters"].append(_file_linter("eslint", [
+                        "npx", "eslint", "--cache", "--cache-location", str(cache_dir / "eslint") + os.sep
+                    ], js_files))
+            elif "lint" in scripts:
                 result["linters"].append({"name": "npm lint", "cmd": ["npm", "run", "lint"]})
             elif "eslint" in deps:
                 result["linters"].append({"name": "eslint", "cmd": ["npx", "eslint", "."]})
             
-            # Check for TypeScript
+            # Check for TypeScript (always whole-program; incremental reuses the last build info)
             if "typescript" in deps or (project_path / "tsconfig.json").exists():
-                result["linters"].append({"name": "tsc", "cmd": ["npx", "tsc", "--noEmit"]})
+                if not incremental:
+                    result["linters"].append({"name": "tsc", "cmd": ["npx", "tsc", "--noEmit"]})
+                elif _scoped(changed, TS_EXTENSIONS):
+                    result["linters"].append({"name": "tsc", "cmd": [
+                        "npx", "tsc", "--noEmit", "--incremental",
+                        "--tsBuildInfoFile", str(cache_dir / "tsc.tsbuildinfo")
+                    ]})
                 
         except:
             pass
@@ -57,52 +119,239 @@ def detect_project_type(project_path: Path) -> dict:
     if (project_path / "pyproject.toml").exists() or (project_path / "requirements.txt").exists():
         result["type"] = "python"
         
-        # Check for ruff
-        result["linters"].append({"name": "ruff", "cmd": ["ruff", "check", "."]})
+        py_files = _scoped(changed, PY_EXTENSIONS) if incremental else None
+        has_mypy = (project_path / "mypy.ini").exists() or (project_path / "pyproject.toml").exists()
         
-        # Check for mypy
-        if (project_path / "mypy.ini").exists() or (project_path / "pyproject.toml").exists():
-            result["linters"].append({"name": "mypy", "cmd": ["mypy", "."]})
+        if not incremental:
+            # Check for ruff
+            result["linters"].append({"name": "ruff", "cmd": ["ruff", "check", "."]})
+            
+            # Check for mypy
+            if has_mypy:
+                result["linters"].append({"name": "mypy", "cmd": ["mypy", "."]})
+        elif py_files:
+            result["linters"].append(_file_linter("ruff", [
+                "ruff", "check", "--cache-dir", str(cache_dir / "ruff")
+            ], py_files))
+            if has_mypy:
+                result["linters"].append(_file_linter("mypy", [
+                    "mypy", "--incremental", "--cache-dir", str(cache_dir / "mypy")
+                ], py_files))
     
     return result
 
 
-def run_linter(linter: dict, cwd: Path) -> dict:
-    """Run a single linter and return results."""
+def _git(project_path: Path, *args: str) -> list:
+    proc = subprocess.run(["git", "-C", str(project_path), *args], capture_output=True,
+                          text=True, encoding='utf-8', errors='replace', timeout=60)
+    if proc.returncode != 0:
+        raise RuntimeError(proc.stderr.strip())
+    return [line for line in proc.stdout.splitlines() if line]
+
+
+def git_changed_files(project_path: Path, base: str = None) -> list:
+    """
+    Existing files changed relative to HEAD (or to the merge-base with `base`),
+    plus untracked ones, relative to project_path. None when git is unavailable.
+    """
+    try:
+        if base:
+            merge_base = _git(project_path, "merge-base", base, "HEAD")[0]
+            diff = _git(project_path, "diff", "--name-only", "--relative", "--diff-filter=ACMR", merge_base)
+        else:
+            diff = _git(project_path, "diff", "--name-only", "--relative", "--diff-filter=ACMR", "HEAD")
+        untracked = _git(project_path, "ls-files", "--others", "--exclude-standard")
+    except (OSError, RuntimeError, IndexError, subprocess.TimeoutExpired):
+        return None
+    files = sorted(set(diff) | set(untracked))
+    return [f for f in files if (project_path / f).is_file()]
+
+
+def all_source_files(project_path: Path) -> list:
+    """Every lintable file (pruned walk), for --changed outside a git repo."""
+    extensions = JS_EXTENSIONS | PY_EXTENSIONS
+    return [os.path.relpath(f, project_path) for f in walk_files(str(project_path), extensions, SKIP_DIRS)]
+
+
+def prepare_cache_dir(project_path: Path, override: str = None) -> Path:
+    """Create the managed cache dir; it ignores itself so it never shows up in git."""
+    cache_dir = Path(override).resolve() if override else project_path / CACHE_DIR_NAME
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    ignore = cache_dir / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding='utf-8')
+    return cache_dir
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def load_clean_hashes(cache_dir: Path) -> dict:
+    """{linter name: {path: content hash}} of files each linter last passed."""
+    try:
+        return json.loads((cache_dir / CLEAN_HASHES).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+
+
+def save_clean_hashes(cache_dir: Path, hashes: dict) -> None:
+    tmp = cache_dir / (CLEAN_HASHES + ".tmp")
+    tmp.write_text(json.dumps(hashes, sort_keys=True), encoding='utf-8')
+    os.replace(tmp, cache_dir / CLEAN_HASHES)
+
+
+def drop_clean_files(linters: list, project_path: Path, clean: dict) -> list:
+    """Remove files a linter already passed with identical content; drop emptied linters."""
+    kept = []
+    for linter in linters:
+        if "files" in linter:
+            known = clean.get(linter["name"], {})
+            linter["hashes"] = {f: file_hash(project_path / f) for f in linter["files"]}
+            linter["files"] = [f for f in linter["files"] if known.get(f) != linter["hashes"][f]]
+            if not linter["files"]:
+                continue
+        kept.append(linter)
+    return kept
+
+
+def record_clean_files(linters: list, results: list, clean: dict) -> dict:
+    """Remember the hashes of files that file-scoped linters passed this run."""
+    for linter, result in zip(linters, results):
+        if result["passed"] and "files" in linter:
+            known = clean.setdefault(linter["name"], {})
+            for f in linter["files"]:
+                known[f] = linter["hashes"][f]
+    return clean
+
+
+def positional_args(argv: list) -> list:
+    """Arguments that are neither flags nor flag values."""
+    args = []
+    skip = False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in VALUE_FLAGS:
+            skip = True
+        elif not arg.startswith('--'):
+            args.append(arg)
+    return args
+
+
+def flag_value(argv: list, flag: str, default: str = None) -> str:
+    """Read `FLAG VALUE` / `FLAG=VALUE` from argv."""
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + '='):
+            return arg.split('=', 1)[1]
+    return default
+
+
+def parse_budget(argv: list, default: float = DEFAULT_BUDGET) -> float:
+    """Read `--budget SECONDS` / `--budget=SECONDS` from argv."""
+    try:
+        return float(flag_value(argv, '--budget', default))
+    except ValueError:
+        return default
+
+
+_print_lock = threading.Lock()
+
+
+def _pump(stream, sink: list, label: str, echo: bool) -> None:
+    """Collect a pipe line by line, echoing each line as it arrives."""
+    for line in stream:
+        sink.append(line)
+        if echo:
+            with _print_lock:
+                print(f"  [{label}] {line.rstrip()}", flush=True)
+    stream.close()
+
+
+def run_linter(linter: dict, cwd: Path, deadline: float = None, echo: bool = False) -> dict:
+    """
+    Run a single linter and return results. The linter's whole process group
+    is killed when the shared deadline (a time.monotonic() value) passes.
+    """
     result = {
         "name": linter["name"],
         "passed": False,
         "output": "",
-        "error": ""
+        "error": "",
+        "duration": 0.0
     }
+    if "files" in linter:
+        result["files"] = linter["files"]
+    if deadline is None:
+        deadline = time.monotonic() + DEFAULT_BUDGET
     
+    started = time.monotonic()
     try:
-        proc = subprocess.run(
-            linter["cmd"],
+        proc = popen_group(
+            linter["cmd"] + linter.get("files", []),
             cwd=str(cwd),
-            capture_output=True,
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
             text=True,
             encoding='utf-8',
-            errors='replace',
-            timeout=120
+            errors='replace'
         )
+        stdout, stderr = [], []
+        pumps = [
+            threading.Thread(target=_pump, args=(proc.stdout, stdout, linter["name"], echo), daemon=True),
+            threading.Thread(target=_pump, args=(proc.stderr, stderr, linter["name"], echo), daemon=True),
+        ]
+        for pump in pumps:
+            pump.start()
         
-        result["output"] = proc.stdout[:2000] if proc.stdout else ""
-        result["error"] = proc.stderr[:500] if proc.stderr else ""
-        result["passed"] = proc.returncode == 0
+        try:
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
+            timed_out = False
+        except subprocess.TimeoutExpired:
+            kill_group(proc)
+            timed_out = True
+        for pump in pumps:
+            # A process that escaped the group could still hold the pipes open
+            pump.join(timeout=DRAIN_TIMEOUT if timed_out else max(DRAIN_TIMEOUT, deadline - time.monotonic()))
+        
+        result["output"] = "".join(stdout)[:2000]
+        result["error"] = "".join(stderr)[:500]
+        result["passed"] = not timed_out and proc.returncode == 0
+        if timed_out:
+            result["error"] = f"Timeout: lint budget exhausted after {time.monotonic() - started:.0f}s"
         
     except FileNotFoundError:
         result["error"] = f"Command not found: {linter['cmd'][0]}"
-    except subprocess.TimeoutExpired:
-        result["error"] = "Timeout after 120s"
     except Exception as e:
         result["error"] = str(e)
     
+    result["duration"] = round(time.monotonic() - started, 2)
     return result
 
 
+def run_linters(linters: list, cwd: Path, budget: float = DEFAULT_BUDGET,
+                jobs: int = 0, echo: bool = False) -> list:
+    """Run linters concurrently under one wall-clock budget; results keep input order."""
+    deadline = time.monotonic() + budget
+    workers = jobs if jobs > 0 else len(linters)
+    with ThreadPoolExecutor(max_workers=max(1, workers)) as pool:
+        return list(pool.map(lambda linter: run_linter(linter, cwd, deadline, echo), linters))
+
+
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = positional_args(sys.argv[1:])
+    project_path = Path(args[0] if args else ".").resolve()
+    budget = parse_budget(sys.argv)
+    quiet = "--quiet" in sys.argv
+    incremental = "--changed" in sys.argv
+    use_hashes = "--hash-cache" in sys.argv
     
     print(f"\n{'='*60}")
     print(f"[LINT RUNNER] Unified Linting")
@@ -110,41 +359,50 @@ def main():
     print(f"Project: {project_path}")
     print(f"Time: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
+    changed = cache_dir = clean = None
+    if incremental:
+        cache_dir = prepare_cache_dir(project_path, flag_value(sys.argv, '--cache-dir'))
+        changed = git_changed_files(project_path, flag_value(sys.argv, '--base'))
+        if changed is None:
+            # Not a git checkout: consider everything and rely on the hash cache
+            changed = all_source_files(project_path)
+            use_hashes = True
+            print("Mode: changed (no git; content-hash cache only)")
+        else:
+            print(f"Mode: changed ({len(changed)} files changed in git)")
+    
     # Detect project type
-    project_info = detect_project_type(project_path)
+    project_info = detect_project_type(project_path, changed, cache_dir)
+    if use_hashes and incremental:
+        clean = load_clean_hashes(cache_dir)
+        project_info["linters"] = drop_clean_files(project_info["linters"], project_path, clean)
     print(f"Type: {project_info['type']}")
     print(f"Linters: {len(project_info['linters'])}")
     print("-"*60)
     
     if not project_info["linters"]:
-        print("No linters found for this project type.")
+        print("Nothing to lint." if incremental else "No linters found for this project type.")
         output = {
             "script": "lint_runner",
             "project": str(project_path),
             "type": project_info["type"],
             "checks": [],
             "passed": True,
-            "message": "No linters configured"
+            "message": "Nothing changed since the last clean lint" if incremental else "No linters configured"
         }
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
-    # Run each linter
-    results = []
-    all_passed = True
-    
-    for linter in project_info["linters"]:
-        print(f"\nRunning: {linter['name']}...")
-        result = run_linter(linter, project_path)
-        results.append(result)
-        
-        if result["passed"]:
-            print(f"  [PASS] {linter['name']}")
-        else:
-            print(f"  [FAIL] {linter['name']}")
-            if result["error"]:
-                print(f"  Error: {result['error'][:200]}")
-            all_passed = False
+    # Run all linters at once under the shared budget
+    linters = project_info["linters"]
+    jobs = parse_jobs(sys.argv, default=len(linters))
+    print(f"\nRunning: {', '.join(l['name'] for l in linters)} (jobs={jobs}, budget={budget:.0f}s)...")
+    started = time.monotonic()
+    results = run_linters(linters, project_path, budget, jobs, echo=not quiet)
+    wall = time.monotonic() - started
+    all_passed = all(r["passed"] for r in results)
+    if clean is not None:
+        save_clean_hashes(cache_dir, record_clean_files(linters, results, clean))
     
     # Summary
     print("\n" + "="*60)
@@ -153,13 +411,19 @@ def main():
     
     for r in results:
         icon = "[PASS]" if r["passed"] else "[FAIL]"
-        print(f"{icon} {r['name']}")
+        scope = f", {len(r['files'])} files" if "files" in r else ""
+        print(f"{icon} {r['name']} ({r['duration']:.1f}s{scope})")
+        if not r["passed"] and r["error"]:
+            print(f"  Error: {r['error'][:200]}")
+    print(f"Total: {wall:.1f}s wall (sum of linters {sum(r['duration'] for r in results):.1f}s)")
     
     output = {
         "script": "lint_runner",
         "project": str(project_path),
         "type": project_info["type"],
         "checks": results,
+        "mode": "changed" if incremental else "full",
+        "duration": round(wall, 2),
         "passed": all_passed
     }
     
@@ -2,12 +2,19 @@
 """
 Type Coverage Checker - Measures TypeScript/Python type coverage.
 Identifies untyped functions, any usage, and type safety issues.
+
+Usage: python type_coverage.py [project_path] [--max-size 2M]
 """
 import sys
 import re
+import time
 import subprocess
 from pathlib import Path
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit.files import DEFAULT_MAX_BYTES, SlowestFiles, parse_max_size, read_text
+from audit_kit.parallel import walk_files
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,40 +22,93 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
-    """Check TypeScript type coverage."""
+# Never descended into (pruned during the walk, not filtered afterwards)
+SKIP_DIRS = {'node_modules', '.git', '__pycache__', 'venv', '.venv', '.next', 'dist', 'build', '.mypy_cache'}
+
+# Compiled once; each rule is only run when its keyword occurs in the file
+TS_ANY = re.compile(r':\s*any\b')
+# function name(params) { - no return type
+TS_UNTYPED_FUNCTION = re.compile(r'function\s+\w+\s*\([^)]*\)\s*{')
+# Arrow functions without types: const fn = (x) => or (x) =>
+TS_UNTYPED_ARROW = re.compile(r'=\s*\([^:)]*\)\s*=>')
+TS_TYPED_FUNCTION = re.compile(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+')
+TS_TYPED_ARROW = re.compile(r':\s*\([^)]*\)\s*=>\s*\w+')
+
+PY_ANY = re.compile(r':\s*Any\b')
+# One match per def: (params, closing paren, return arrow)
+PY_FUNCTION = re.compile(r'def\s+\w+\s*\(([^)]*)(\))?(\s*->)?')
+
+
+def collect_source_files(project_path: Path) -> dict:
+    """One pruned walk: {'typescript': [...], 'python': [...]} (.d.ts excluded)."""
+    files = {'typescript': [], 'python': []}
+    for path in walk_files(str(project_path), {'.ts', '.tsx', '.py'}, SKIP_DIRS):
+        if path.endswith('.py'):
+            files['python'].append(Path(path))
+        elif not path.endswith('.d.ts'):
+            files['typescript'].append(Path(path))
+    return files
+
+def _count(rx, content: str) -> int:
+    return sum(1 for _ in rx.finditer(content))
+
+def analyze_typescript(content: str) -> tuple:
+    """(any_count, untyped_functions, typed_functions) for one file."""
+    any_count = _count(TS_ANY, content) if 'any' in content else 0
+    untyped = typed = 0
+    if 'function' in content:
+        untyped += _count(TS_UNTYPED_FUNCTION, content)
+        typed += _count(TS_TYPED_FUNCTION, content)
+    if '=>' in content:
+        untyped += _count(TS_UNTYPED_ARROW, content)
+        typed += _count(TS_TYPED_ARROW, content)
+    return any_count, untyped, typed
+
+def analyze_python(content: str) -> tuple:
+    """(any_count, typed_functions, all_functions) for one file.
+    A def counts as typed once, whether it annotates params, return or both."""
+    any_count = _count(PY_ANY, content) if 'Any' in content else 0
+    if 'def' not in content:
+        return any_count, 0, 0
+    typed = total = 0
+    for match in PY_FUNCTION.finditer(content):
+        total += 1
+        params, closed, arrow = match.groups()
+        if arrow or (closed and ':' in params.rstrip(':')):
+            typed += 1
+    return any_count, typed, total
+
+def check_typescript_coverage(project_path: Path, max_bytes: int = DEFAULT_MAX_BYTES,
+                              ts_files: list = None) -> dict:
+    """Check TypeScript type coverage of every file. Binary and oversized files are skipped."""
     issues = []
     passed = []
-    stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
+    stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0, 'skipped_files': 0}
+    slowest = SlowestFiles()
     
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
+    if ts_files is None:
+        ts_files = collect_source_files(project_path)['typescript']
     
     if not ts_files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
-    for file_path in ts_files[:30]:  # Limit
+    for file_path in ts_files:
+        started = time.perf_counter()
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
+            content, _ = read_text(str(file_path), max_bytes, errors='ignore')
+            if content is None:
+                stats['skipped_files'] += 1
+                continue
             
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
+            any_count, untyped, typed = analyze_typescript(content)
+            stats['any_count'] += any_count
+            stats['untyped_functions'] += untyped
+            stats['total_functions'] += typed + untyped
             
         except Exception:
             continue
+        finally:
+            slowest.record(str(file_path.relative_to(project_path)), time.perf_counter() - started)
     
     # Analyze results
     if stats['any_count'] == 0:
@@ -69,39 +129,43 @@ def check_typescript_coverage(project_path: Path) -> dict:
     
     passed.append(f"[OK] Analyzed {len(ts_files)} TypeScript files")
     
-    return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
+    if stats['skipped_files']:
+        issues.append(f"[!] Skipped {stats['skipped_files']} binary/oversized TypeScript files")
+    
+    return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats,
+            'slowest_files': slowest.top()}
 
-def check_python_coverage(project_path: Path) -> dict:
-    """Check Python type hints coverage."""
+def check_python_coverage(project_path: Path, max_bytes: int = DEFAULT_MAX_BYTES,
+                          py_files: list = None) -> dict:
+    """Check Python type hints coverage of every file. Binary and oversized files are skipped."""
     issues = []
     passed = []
-    stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
+    stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0, 'skipped_files': 0}
+    slowest = SlowestFiles()
     
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+    if py_files is None:
+        py_files = collect_source_files(project_path)['python']
     
     if not py_files:
         return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
     
-    for file_path in py_files[:30]:  # Limit
+    for file_path in py_files:
+        started = time.perf_counter()
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
+            content, _ = read_text(str(file_path), max_bytes, errors='ignore')
+            if content is None:
+                stats['skipped_files'] += 1
+                continue
             
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
+            any_count, typed, all_funcs = analyze_python(content)
+            stats['any_count'] += any_count
+            stats['typed_functions'] += typed
+            stats['untyped_functions'] += all_funcs - typed
             
         except Exception:
             continue
+        finally:
+            slowest.record(str(file_path.relative_to(project_path)), time.perf_counter() - started)
     
     total = stats['typed_functions'] + stats['untyped_functions']
     
@@ -123,25 +187,31 @@ def check_python_coverage(project_path: Path) -> dict:
     
     passed.append(f"[OK] Analyzed {len(py_files)} Python files")
     
-    return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
+    if stats['skipped_files']:
+        issues.append(f"[!] Skipped {stats['skipped_files']} binary/oversized Python files")
+    
+    return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats,
+            'slowest_files': slowest.top()}
 
 def main():
-    target = sys.argv[1] if len(sys.argv) > 1 else "."
+    target = sys.argv[1] if len(sys.argv) > 1 and not sys.argv[1].startswith('--') else "."
     project_path = Path(target)
+    max_bytes = parse_max_size(sys.argv)
     
     print("\n" + "=" * 60)
     print("  TYPE COVERAGE CHECKER")
     print("=" * 60 + "\n")
     
     results = []
+    files = collect_source_files(project_path)
     
     # Check TypeScript
-    ts_result = check_typescript_coverage(project_path)
+    ts_result = check_typescript_coverage(project_path, max_bytes, files['typescript'])
     if ts_result['files'] > 0:
         results.append(ts_result)
     
     # Check Python
-    py_result = check_python_coverage(project_path)
+    py_result = check_python_coverage(project_path, max_bytes, files['python'])
     if py_result['files'] > 0:
         results.append(py_result)
     
@@ -160,6 +230,10 @@ def main():
             print(f"  {item}")
             if item.startswith("[X]"):
                 critical_issues += 1
+        if result['slowest_files']:
+            print("  Slowest files:")
+            for slow in result['slowest_files']:
+                print(f"    {slow['seconds'] * 1000:7.1f}ms  {slow['file']}")
     
     print("\n" + "=" * 60)
     if critical_issues == 0:
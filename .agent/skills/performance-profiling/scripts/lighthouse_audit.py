@@ -4,7 +4,19 @@ Skill: performance-profiling
 Script: lighthouse_audit.py
 Purpose: Run Lighthouse performance audit on a URL
 Usage: python lighthouse_audit.py https://example.com
+       python lighthouse_audit.py <url> <url> ... --runs 5 [--jobs 2] [--out summary.json]
+       python lighthouse_audit.py --base http://localhost:3000 --urls routes.txt --runs 5
+       python lighthouse_audit.py --base http://localhost:3000 --from src/data/seed.json \\
+           --route '/business/{slug}' --runs 3
 Output: JSON with performance scores
+Batch: --runs N audits every URL N times (--jobs bounds concurrent Lighthouse
+    processes) and reports median, p90 and spread per metric. Relative routes
+    are joined to --base; --from/--route expand a template over a JSON array.
+Budgets: --budget budget.json checks each URL against the first entry whose
+    "route" glob matches its path and exits 1 with a per-metric diff:
+    [{"route": "/business/*", "max_lcp": 2500, "max_tbt": 200,
+      "max_js_bytes": 170000, "max_image_bytes": 300000, "min_performance": 80}]
+    Batch medians are compared by default (--budget-stat p90 for the tail).
 Note: Requires lighthouse CLI (npm install -g lighthouse)
 """
 import subprocess
@@ -12,13 +24,52 @@ import json
 import sys
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from fnmatch import fnmatchcase
+from pathlib import Path
+from urllib.parse import urlsplit
 
-def run_lighthouse(url: str) -> dict:
-    """Run Lighthouse audit on URL."""
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit.parallel import parse_jobs
+
+LIGHTHOUSE_TIMEOUT = 120
+
+# Lighthouse audit id -> summary metric name (numericValue: ms, unitless, bytes)
+METRIC_AUDITS = {
+    "largest-contentful-paint": "lcp",
+    "total-blocking-time": "tbt",
+    "cumulative-layout-shift": "cls",
+    "speed-index": "speed_index",
+    "total-byte-weight": "total_bytes",
+}
+
+# resource-summary resourceType -> metric name (transferSize, bytes)
+RESOURCE_METRICS = {
+    "script": "js_bytes",
+    "image": "image_bytes",
+}
+
+# Budget key -> (metric, direction); "max" fails above the limit, "min" below
+BUDGET_KEYS = {
+    "max_lcp": ("lcp", "max"),
+    "max_tbt": ("tbt", "max"),
+    "max_cls": ("cls", "max"),
+    "max_speed_index": ("speed_index", "max"),
+    "max_total_bytes": ("total_bytes", "max"),
+    "max_js_bytes": ("js_bytes", "max"),
+    "max_image_bytes": ("image_bytes", "max"),
+    "min_performance": ("performance", "min"),
+}
+
+
+def _lighthouse_report(url: str, categories: str) -> dict:
+    """Run the Lighthouse CLI once; the parsed JSON report, or {"error": ...}."""
     try:
         with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as f:
             output_path = f.name
-        
+
         result = subprocess.run(
             [
                 "lighthouse",
@@ -26,37 +77,203 @@ def run_lighthouse(url: str) -> dict:
                 "--output=json",
                 f"--output-path={output_path}",
                 "--chrome-flags=--headless",
-                "--only-categories=performance,accessibility,best-practices,seo"
+                f"--only-categories={categories}"
             ],
             capture_output=True,
             text=True,
-            timeout=120
+            timeout=LIGHTHOUSE_TIMEOUT
         )
-        
-        if os.path.exists(output_path):
+
+        if os.path.exists(output_path) and os.path.getsize(output_path):
             with open(output_path, 'r') as f:
                 report = json.load(f)
             os.unlink(output_path)
-            
-            categories = report.get("categories", {})
-            return {
-                "url": url,
-                "scores": {
-                    "performance": int(categories.get("performance", {}).get("score", 0) * 100),
-                    "accessibility": int(categories.get("accessibility", {}).get("score", 0) * 100),
-                    "best_practices": int(categories.get("best-practices", {}).get("score", 0) * 100),
-                    "seo": int(categories.get("seo", {}).get("score", 0) * 100)
-                },
-                "summary": get_summary(categories)
-            }
-        else:
-            return {"error": "Lighthouse failed to generate report", "stderr": result.stderr[:500]}
-            
+            return report
+        if os.path.exists(output_path):
+            os.unlink(output_path)
+        return {"error": "Lighthouse failed to generate report", "stderr": result.stderr[:500]}
+
     except subprocess.TimeoutExpired:
         return {"error": "Lighthouse audit timed out"}
     except FileNotFoundError:
         return {"error": "Lighthouse CLI not found. Install with: npm install -g lighthouse"}
 
+
+def run_lighthouse(url: str) -> dict:
+    """Run Lighthouse audit on URL."""
+    report = _lighthouse_report(url, "performance,accessibility,best-practices,seo")
+    if "error" in report:
+        return report
+
+    categories = report.get("categories", {})
+    return {
+        "url": url,
+        "scores": {
+            "performance": int(categories.get("performance", {}).get("score", 0) * 100),
+            "accessibility": int(categories.get("accessibility", {}).get("score", 0) * 100),
+            "best_practices": int(categories.get("best-practices", {}).get("score", 0) * 100),
+            "seo": int(categories.get("seo", {}).get("score", 0) * 100)
+        },
+        "summary": get_summary(categories)
+    }
+
+
+def extract_metrics(report: dict) -> dict:
+    """Numeric metrics of one Lighthouse report, keyed by METRIC_AUDITS names."""
+    audits = report.get("audits", {})
+    metrics = {}
+    for audit_id, name in METRIC_AUDITS.items():
+        value = audits.get(audit_id, {}).get("numericValue")
+        if value is not None:
+            metrics[name] = value
+    items = audits.get("resource-summary", {}).get("details", {}).get("items", [])
+    for item in items:
+        name = RESOURCE_METRICS.get(item.get("resourceType"))
+        if name:
+            metrics[name] = item.get("transferSize", 0)
+    score = report.get("categories", {}).get("performance", {}).get("score")
+    if score is not None:
+        metrics["performance"] = int(score * 100)
+    return metrics
+
+
+def percentile(values: list, pct: float) -> float:
+    """Linear-interpolated percentile of a non-empty list."""
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    low = int(rank)
+    high = min(low + 1, len(ordered) - 1)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def describe(values: list) -> dict:
+    """Median / p90 / spread of one metric across runs."""
+    digits = 4 if max(abs(v) for v in values) < 1 else 1
+    return {
+        "median": round(percentile(values, 50), digits),
+        "p90": round(percentile(values, 90), digits),
+        "min": round(min(values), digits),
+        "max": round(max(values), digits),
+        "spread": round(max(values) - min(values), digits),
+    }
+
+
+def _audit_once(task: tuple) -> tuple:
+    url, run = task
+    report = _lighthouse_report(url, "performance")
+    if "error" in report:
+        return url, run, {"error": report["error"]}
+    return url, run, extract_metrics(report)
+
+
+def run_batch(urls: list, runs: int = 3, jobs: int = 1) -> dict:
+    """Audit every URL `runs` times with at most `jobs` Lighthouse processes at once."""
+    started = time.perf_counter()
+    tasks = [(url, run) for run in range(runs) for url in urls]
+    samples = {url: [] for url in urls}
+    errors = {url: [] for url in urls}
+
+    with ThreadPoolExecutor(max_workers=max(1, jobs)) as pool:
+        for url, run, metrics in pool.map(_audit_once, tasks):
+            if "error" in metrics:
+                errors[url].append(metrics["error"])
+            else:
+                samples[url].append(metrics)
+
+    pages = {}
+    for url in urls:
+        names = sorted({name for metrics in samples[url] for name in metrics})
+        pages[url] = {
+            "runs": len(samples[url]),
+            "failed_runs": len(errors[url]),
+            "metrics": {
+                name: describe([m[name] for m in samples[url] if name in m])
+                for name in names
+            },
+        }
+        if errors[url]:
+            pages[url]["errors"] = sorted(set(errors[url]))
+
+    failed = [url for url, page in pages.items() if not page["runs"]]
+    return {
+        "generated": datetime.now().isoformat(timespec="seconds"),
+        "runs_per_url": runs,
+        "jobs": jobs,
+        "duration": round(time.perf_counter() - started, 1),
+        "pages": pages,
+        "passed": not failed,
+        "summary": f"[OK] {len(urls)} URL(s) x {runs} run(s)" if not failed
+                   else f"[X] {len(failed)} URL(s) produced no successful run",
+    }
+
+
+def load_budgets(path: str) -> list:
+    """Budget entries from a JSON file: a list, or {"budgets": [...]}; unknown keys are errors."""
+    with open(path, encoding="utf-8") as f:
+        data = json.load(f)
+    budgets = data.get("budgets", []) if isinstance(data, dict) else data
+    for entry in budgets:
+        unknown = set(entry) - set(BUDGET_KEYS) - {"route"}
+        if "route" not in entry or unknown:
+            raise ValueError(f"Bad budget entry {entry}: needs \"route\", "
+                             f"unknown keys {sorted(unknown)}")
+    return budgets
+
+
+def match_budget(url: str, budgets: list):
+    """First budget whose route glob matches the URL path (query ignored)."""
+    path = urlsplit(url).path or "/"
+    for entry in budgets:
+        if fnmatchcase(path, entry["route"]):
+            return entry
+    return None
+
+
+def check_budget(metrics: dict, budget: dict, stat: str = "median") -> list:
+    """Violations of one budget entry; metrics maps name -> describe() stats."""
+    violations = []
+    for key, (name, direction) in BUDGET_KEYS.items():
+        if key not in budget:
+            continue
+        limit = budget[key]
+        if name not in metrics:
+            violations.append({"metric": name, "limit": limit, "actual": None,
+                               "diff": "not reported by Lighthouse"})
+            continue
+        actual = metrics[name][stat]
+        over = actual - limit if direction == "max" else limit - actual
+        if over > 0:
+            violations.append({
+                "metric": name,
+                "limit": limit,
+                "actual": actual,
+                "over": round(over, 4),
+                "diff": f"{name} {actual} {'>' if direction == 'max' else '<'} {limit} "
+                        f"({'+' if direction == 'max' else '-'}{round(over, 4)}"
+                        f"{f', {over / limit:.0%}' if limit else ''})",
+            })
+    return violations
+
+
+def apply_budgets(result: dict, budgets: list, stat: str = "median") -> dict:
+    """Annotate each page of a run_batch result with its budget verdict."""
+    over_budget = []
+    for url, page in result["pages"].items():
+        budget = match_budget(url, budgets)
+        if budget is None:
+            continue
+        violations = check_budget(page["metrics"], budget, stat) if page["runs"] else []
+        page["budget"] = {"route": budget["route"], "stat": stat, "violations": violations}
+        if violations:
+            over_budget.append(url)
+
+    result["over_budget"] = over_budget
+    if over_budget:
+        result["passed"] = False
+        result["summary"] = f"[X] {len(over_budget)} URL(s) over budget"
+    return result
+
+
 def get_summary(categories: dict) -> str:
     """Generate summary based on scores."""
     perf = categories.get("performance", {}).get("score", 0) * 100
@@ -67,10 +284,96 @@ def get_summary(categories: dict) -> str:
     else:
         return "[X] Poor performance"
 
+
+def flag_value(argv: list, flag: str, default: str = None) -> str:
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+VALUE_FLAGS = {"--runs", "--jobs", "--out", "--base", "--urls", "--from", "--route",
+               "--budget", "--budget-stat"}
+
+
+def positional_args(argv: list) -> list:
+    args, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in VALUE_FLAGS:
+            skip = True
+        elif not arg.startswith("--"):
+            args.append(arg)
+    return args
+
+
+def collect_urls(argv: list) -> list:
+    """URLs from arguments, --urls FILE and --from JSON/--route template, joined to --base."""
+    routes = positional_args(argv)
+
+    urls_file = flag_value(argv, "--urls")
+    if urls_file:
+        with open(urls_file, encoding="utf-8") as f:
+            routes += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    data_file, template = flag_value(argv, "--from"), flag_value(argv, "--route")
+    if data_file and template:
+        with open(data_file, encoding="utf-8") as f:
+            records = json.load(f)
+        for record in records:
+            try:
+                routes.append(template.format(**record))
+            except (KeyError, IndexError):
+                continue  # record lacks a field the template needs
+
+    base = (flag_value(argv, "--base") or "").rstrip("/")
+    urls = [route if "://" in route else base + "/" + route.lstrip("/") for route in routes]
+    return list(dict.fromkeys(urls))
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
-        print(json.dumps({"error": "Usage: python lighthouse_audit.py <url>"}))
+    urls = collect_urls(sys.argv[1:])
+    if not urls:
+        print(json.dumps({"error": "Usage: python lighthouse_audit.py <url> [<url> ...] "
+                                   "[--runs N] [--jobs N] [--out FILE] [--base URL] "
+                                   "[--urls FILE] [--from data.json --route '/path/{field}'] "
+                                   "[--budget budget.json [--budget-stat median|p90]]"}))
         sys.exit(1)
-    
-    result = run_lighthouse(sys.argv[1])
+
+    runs = flag_value(sys.argv, "--runs")
+    budget_path = flag_value(sys.argv, "--budget")
+    if len(urls) == 1 and runs is None and budget_path is None:
+        result = run_lighthouse(urls[0])
+        print(json.dumps(result, indent=2))
+        sys.exit(0)
+
+    budgets = []
+    if budget_path:
+        try:
+            budgets = load_budgets(budget_path)
+        except (OSError, ValueError) as e:
+            print(json.dumps({"error": f"Cannot load budget file: {e}"}))
+            sys.exit(2)
+
+    result = run_batch(urls, runs=max(1, int(runs or 1)), jobs=parse_jobs(sys.argv, default=1))
+    if budgets:
+        stat = flag_value(sys.argv, "--budget-stat", "median")
+        apply_budgets(result, budgets, stat if stat in ("median", "p90") else "median")
+        for url in result["over_budget"]:
+            page = result["pages"][url]
+            print(f"[X] {url} (budget {page['budget']['route']}, {page['budget']['stat']})",
+                  file=sys.stderr)
+            for violation in page["budget"]["violations"]:
+                print(f"    {violation['diff']}", file=sys.stderr)
+    out_path = flag_value(sys.argv, "--out")
+    if out_path:
+        with open(out_path, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2, sort_keys=True)
+            f.write("\n")
+        result = {"out": out_path, "passed": result["passed"], "summary": result["summary"],
+                  "over_budget": result.get("over_budget", [])}
     print(json.dumps(result, indent=2))
+    sys.exit(0 if result["passed"] else 1)
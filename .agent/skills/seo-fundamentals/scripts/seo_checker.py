@@ -15,7 +15,7 @@ WHAT IT CHECKS:
     - Only files that are likely PUBLIC pages
 
 Usage:
-    python seo_checker.py <project_path>
+    python seo_checker.py <project_path> [--profile] [--profile-out prof.speedscope.json]
 """
 import sys
 import json
@@ -23,6 +23,12 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit import markup, profiling
+
+# Times each pattern per file when run with --profile; a plain pass-through otherwise
+re = profiling.instrument(re)
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -102,37 +108,46 @@ def check_page(file_path: Path) -> dict:
     except Exception as e:
         return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
+    with profiling.rule('markup.parse'):
+        doc = markup.load(str(file_path), content)
+    metas = doc.find('meta')
+    # Next.js App Router sets head tags through the metadata export instead of JSX
+    metadata_api = re.search(r'export\s+(?:const\s+metadata\b|(?:async\s+)?function\s+generateMetadata)', content)
+    
     # Detect if this is a layout/template file (has Head component)
-    is_layout = 'Head>' in content or '<head' in content.lower()
+    is_layout = doc.count('head') > 0
     
     # 1. Title tag
-    has_title = '<title' in content.lower() or 'title=' in content or 'Head>' in content
+    has_title = doc.count('title') > 0 or any(el.has('title') for el in doc.find('head'))
+    has_title = has_title or bool(metadata_api and re.search(r'\btitle\s*:', content))
     if not has_title and is_layout:
         issues.append("Missing <title> tag")
     
     # 2. Meta description
-    has_description = 'name="description"' in content.lower() or 'name=\'description\'' in content.lower()
+    has_description = any(str(m.get('name', '')).lower() == 'description' for m in metas)
+    has_description = has_description or bool(metadata_api and re.search(r'\bdescription\s*:', content))
     if not has_description and is_layout:
         issues.append("Missing meta description")
     
     # 3. Open Graph tags
-    has_og = 'og:' in content or 'property="og:' in content.lower()
+    has_og = any(str(m.get('property', '')).startswith('og:') for m in metas)
+    has_og = has_og or bool(metadata_api and 'openGraph' in content)
     if not has_og and is_layout:
         issues.append("Missing Open Graph tags")
     
     # 4. Heading hierarchy - multiple H1s
-    h1_matches = re.findall(r'<h1[^>]*>', content, re.I)
-    if len(h1_matches) > 1:
-        issues.append(f"Multiple H1 tags ({len(h1_matches)})")
-    
-    # 5. Images without alt
-    img_pattern = r'<img[^>]+>'
-    imgs = re.findall(img_pattern, content, re.I)
-    for img in imgs:
-        if 'alt=' not in img.lower():
+    h1_count = doc.count('h1')
+    if h1_count > 1:
+        issues.append(f"Multiple H1 tags ({h1_count})")
+    
+    # 5. Images without alt (spread props may supply it)
+    for img in doc.find('img'):
+        if not img.has('alt'):
+            if img.spread:
+                continue
             issues.append("Image missing alt attribute")
             break
-        if 'alt=""' in img or "alt=''" in img:
+        if img.get('alt') == '':
             issues.append("Image has empty alt attribute")
             break
     
@@ -147,6 +162,7 @@ def check_page(file_path: Path) -> dict:
 
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    profiler = profiling.from_argv(sys.argv, 'seo_checker')
     
     print(f"\n{'='*60}")
     print(f"  SEO CHECKER - Search Engine Optimization Audit")
@@ -170,7 +186,8 @@ def main():
     # Check each page
     all_issues = []
     for f in pages:
-        result = check_page(f)
+        with profiling.track_file(f):
+            result = check_page(f)
         if result["issues"]:
             all_issues.append(result)
     
@@ -211,6 +228,7 @@ def main():
     }
     
     print("\n" + json.dumps(output, indent=2))
+    if profiler: profiler.finish()
     
     sys.exit(0 if passed else 1)
 
@@ -5,18 +5,49 @@ Runs tests and generates coverage report based on project type.
 
 Usage:
     python test_runner.py <project_path> [--coverage]
+    python test_runner.py <project_path> --shards N [--top 10] [--report merged.json]
+
+Sharded mode splits the suite across N concurrent processes: jest and vitest
+use their native --shard=i/N, pytest gets the test files it collects split
+across shards.
+Each shard writes a structured report (jest JSON, JUnit XML) which is merged
+into one report with per-test durations, instead of scraping console text.
+
+Sharded runs are recorded in .test-runner/history.sqlite. Each run reports the
+--top N (default 10) slowest tests and the tests that got slower than their
+rolling baseline (median of the last 10 runs). Once history exists, test files
+are assigned to shards by expected duration rather than by count.
 
 Supports:
     - Node.js: npm test, jest, vitest
     - Python: pytest, unittest
 """
 
+import os
+import sqlite3
+import statistics
 import subprocess
 import sys
 import json
+import time
+import xml.etree.ElementTree as ET
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit.processes import run_group
+
+TEST_TIMEOUT = 300  # 5 min budget for the whole run, shared by all shards
+STATE_DIR_NAME = '.test-runner'
+SHARDABLE = {'jest', 'vitest', 'pytest'}
+
+HISTORY_DB = 'history.sqlite'
+HISTORY_WINDOW = 10         # runs in the rolling baseline
+HISTORY_KEEP = 100          # runs kept per framework
+REGRESSION_RATIO = 1.5      # slower than 1.5x the baseline median...
+REGRESSION_MIN_DELTA = 0.05  # ...and by at least 50ms, to ignore timer noise
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -137,9 +168,421 @@ def run_tests(cmd: list, cwd: Path) -> dict:
     return result
 
 
+def flag_value(argv: list, flag: str, default: str = None) -> str:
+    """Read `FLAG VALUE` / `FLAG=VALUE` from argv."""
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + '='):
+            return arg.split('=', 1)[1]
+    return default
+
+
+def prepare_state_dir(project_path: Path) -> Path:
+    """Managed dir for shard reports; it ignores itself so it never shows up in git."""
+    state_dir = project_path / STATE_DIR_NAME
+    (state_dir / "shards").mkdir(parents=True, exist_ok=True)
+    ignore = state_dir / ".gitignore"
+    if not ignore.exists():
+        ignore.write_text("*\n", encoding='utf-8')
+    return state_dir
+
+
+# Each runner lists the test files it would run, so shards get exactly its suite
+LIST_COMMANDS = {
+    "pytest": ["python", "-m", "pytest", "--collect-only", "-q"],
+    "jest": ["npx", "jest", "--listTests"],
+    "vitest": ["npx", "vitest", "list", "--filesOnly"],
+}
+DISCOVERY_TIMEOUT = 120
+
+
+def list_test_files(framework: str, project_path: Path) -> list:
+    """
+    Test files as the runner itself collects them, relative to project_path
+    and in the runner's order. None when the runner cannot list them or names
+    a file that does not resolve under project_path (e.g. a pytest rootdir
+    above it), so the caller falls back to a run that drops nothing.
+    """
+    try:
+        returncode, stdout, _, timed_out = run_group(
+            LIST_COMMANDS[framework], DISCOVERY_TIMEOUT, cwd=str(project_path),
+            stdin=subprocess.DEVNULL, text=True, encoding='utf-8', errors='replace')
+    except FileNotFoundError:
+        return None
+    # pytest exits 5 when it collects nothing
+    if timed_out or returncode not in (0, 5):
+        return None
+    
+    files = []
+    for line in (stdout or "").splitlines():
+        line = line.strip()
+        if framework == "pytest":
+            # node ids ("tests/test_api.py::test_get"); skip the summary line
+            if "::" not in line:
+                continue
+            line = line.split("::", 1)[0]
+        if not line:
+            continue
+        path = Path(line) if os.path.isabs(line) else project_path / line
+        if not path.is_file():
+            return None
+        rel = os.path.relpath(path, project_path).replace(os.sep, '/')
+        if rel not in files:
+            files.append(rel)
+    return files
+
+
+def split_round_robin(items: list, shards: int) -> list:
+    """Split items into `shards` groups of (nearly) equal count."""
+    return [items[i::shards] for i in range(shards)]
+
+
+def split_by_duration(items: list, estimates: dict, shards: int) -> list:
+    """
+    Longest-expected-first onto the least loaded shard (LPT). Files without
+    history are assumed to take the median known file time.
+    """
+    default = statistics.median(estimates.values()) if estimates else 1.0
+    loads = [(0.0, i) for i in range(shards)]
+    groups = [[] for _ in range(shards)]
+    for item in sorted(items, key=lambda f: (-estimates.get(f, default), f)):
+        load, i = min(loads)
+        groups[i].append(item)
+        loads[i] = (load + estimates.get(item, default), i)
+    return groups
+
+
+def build_shards(test_info: dict, project_path: Path, shards: int, out_dir: Path,
+                 estimates: dict = None) -> list:
+    """
+    One {index, cmd, report, format} per shard. File lists come from the
+    runner's own discovery (list_test_files). With per-file duration estimates
+    every framework gets explicit, duration-balanced file lists; otherwise
+    jest/vitest use native --shard and pytest splits by file count. When
+    discovery fails, jest/vitest fall back to native --shard and pytest to a
+    single unsharded run.
+    """
+    framework = test_info["framework"]
+    plans = []
+    if estimates and framework in ("jest", "vitest"):
+        files = list_test_files(framework, project_path) or []
+        groups = [g for g in split_by_duration(files, estimates, shards) if g]
+        for i, group in enumerate(groups, 1):
+            if framework == "jest":
+                report = out_dir / f"jest-{i}.json"
+                cmd = ["npx", "jest", "--ci", "--json", f"--outputFile={report}", "--runTestsByPath"] + group
+            else:
+                report = out_dir / f"vitest-{i}.xml"
+                cmd = ["npx", "vitest", "run", "--reporter=junit", f"--outputFile={report}"] + group
+            plans.append({"index": i, "format": "jest" if framework == "jest" else "junit",
+                          "report": report, "cmd": cmd, "balanced": True})
+        if plans:
+            return plans
+    
+    if framework == "pytest":
+        files = list_test_files(framework, project_path)
+        if files is None:
+            # Collection failed or disagrees with the project layout: one
+            # unsharded run still reports every test (and the collection error)
+            groups = [[]]
+        elif estimates:
+            groups = split_by_duration(files, estimates, shards)
+        else:
+            groups = split_round_robin(files, shards)
+        groups = [g for g in groups if g]
+        for i, files in enumerate(groups or [[]], 1):
+            report = out_dir / f"pytest-{i}.xml"
+            # xunit1 adds the file attribute to each testcase
+            plans.append({"index": i, "format": "junit", "report": report,
+                          "cmd": ["python", "-m", "pytest", "-q", f"--junitxml={report}",
+                                  "-o", "junit_family=xunit1"] + files,
+                          "balanced": bool(estimates) and bool(files)})
+    elif framework == "jest":
+        for i in range(1, shards + 1):
+            report = out_dir / f"jest-{i}.json"
+            plans.append({"index": i, "format": "jest", "report": report,
+                          "cmd": ["npx", "jest", "--ci", f"--shard={i}/{shards}", "--json", f"--outputFile={report}"]})
+    elif framework == "vitest":
+        for i in range(1, shards + 1):
+            report = out_dir / f"vitest-{i}.xml"
+            plans.append({"index": i, "format": "junit", "report": report,
+                          "cmd": ["npx", "vitest", "run", f"--shard={i}/{shards}", "--reporter=junit",
+                                  f"--outputFile={report}"]})
+    return plans
+
+
+def parse_junit(path: Path) -> list:
+    """Per-test results from a JUnit XML report (pytest --junitxml, vitest junit)."""
+    tests = []
+    for case in ET.parse(path).getroot().iter("testcase"):
+        classname = case.get("classname", "")
+        name = case.get("name", "")
+        status = "passed"
+        if case.find("failure") is not None or case.find("error") is not None:
+            status = "failed"
+        elif case.find("skipped") is not None:
+            status = "skipped"
+        tests.append({
+            "id": f"{classname}::{name}" if classname else name,
+            "file": case.get("file") or classname,
+            "status": status,
+            "duration": float(case.get("time") or 0),
+        })
+    return tests
+
+
+def parse_jest_json(path: Path, project_path: Path) -> list:
+    """Per-test results from `jest --json` output."""
+    data = json.loads(path.read_text(encoding='utf-8'))
+    tests = []
+    for suite in data.get("testResults", []):
+        file = os.path.relpath(suite.get("name", ""), project_path)
+        for case in suite.get("assertionResults", []):
+            status = case.get("status", "")
+            tests.append({
+                "id": f"{file}::{case.get('fullName') or case.get('title')}",
+                "file": file,
+                "status": "skipped" if status in ("pending", "skipped", "todo", "disabled") else status,
+                "duration": (case.get("duration") or 0) / 1000,
+            })
+    return tests
+
+
+def run_shard(plan: dict, cwd: Path, deadline: float) -> dict:
+    """Run one shard to completion (or the shared deadline) and parse its report."""
+    shard = {"index": plan["index"], "returncode": None, "duration": 0.0, "tests": [], "error": "", "output": ""}
+    if plan["report"].exists():
+        plan["report"].unlink()
+    started = time.monotonic()
+    budget = max(1.0, deadline - time.monotonic())
+    try:
+        # Own process group: on timeout the jest/vitest/pytest workers die with npx
+        returncode, stdout, stderr, timed_out = run_group(
+            plan["cmd"],
+            budget,
+            cwd=str(cwd),
+            stdin=subprocess.DEVNULL,
+            text=True,
+            encoding='utf-8',
+            errors='replace'
+        )
+        shard["returncode"] = returncode
+        shard["output"] = (stdout or "")[-2000:]
+        shard["error"] = (stderr or "")[-500:]
+        if timed_out:
+            shard["error"] = f"Timeout: shared test budget ran out after {budget:.0f}s"
+    except FileNotFoundError:
+        shard["error"] = f"Command not found: {plan['cmd'][0]}"
+    shard["duration"] = round(time.monotonic() - started, 2)
+    
+    try:
+        if plan["format"] == "jest":
+            shard["tests"] = parse_jest_json(plan["report"], cwd)
+        else:
+            shard["tests"] = parse_junit(plan["report"])
+    except (OSError, ValueError, ET.ParseError) as e:
+        if shard["returncode"] != 5:
+            shard["error"] = shard["error"] or f"No readable report: {e}"
+    return shard
+
+
+def run_sharded(plans: list, cwd: Path, timeout: float = TEST_TIMEOUT) -> dict:
+    """Run all shards concurrently and merge them into one report."""
+    deadline = time.monotonic() + timeout
+    started = time.monotonic()
+    with ThreadPoolExecutor(max_workers=max(1, len(plans))) as pool:
+        shards = list(pool.map(lambda plan: run_shard(plan, cwd, deadline), plans))
+    
+    tests = []
+    for shard in shards:
+        tests.extend(shard["tests"])
+        shard["tests"] = len(shard["tests"])
+    tests.sort(key=lambda t: t["id"])
+    counts = {status: sum(1 for t in tests if t["status"] == status) for status in ("passed", "failed", "skipped")}
+    # pytest exits 5 when a shard collects no tests, which is not a failure
+    shards_ok = all(s["returncode"] == 0 or (s["returncode"] == 5 and not s["tests"]) for s in shards)
+    return {
+        "passed": shards_ok and counts["failed"] == 0,
+        "wall": round(time.monotonic() - started, 2),
+        "tests_run": counts["passed"] + counts["failed"],
+        "tests_passed": counts["passed"],
+        "tests_failed": counts["failed"],
+        "tests_skipped": counts["skipped"],
+        "shards": shards,
+        "tests": tests,
+    }
+
+
+def open_history(state_dir: Path) -> sqlite3.Connection:
+    db = sqlite3.connect(str(state_dir / HISTORY_DB))
+    db.executescript("""
+        CREATE TABLE IF NOT EXISTS runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TEXT NOT NULL,
+            framework TEXT NOT NULL,
+            shards INTEGER NOT NULL,
+            wall REAL NOT NULL,
+            passed INTEGER NOT NULL
+        );
+        CREATE TABLE IF NOT EXISTS results (
+            run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+            test_id TEXT NOT NULL,
+            file TEXT NOT NULL,
+            status TEXT NOT NULL,
+            duration REAL NOT NULL
+        );
+        CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+    """)
+    return db
+
+
+def _recent_runs(db: sqlite3.Connection, framework: str, window: int = HISTORY_WINDOW) -> list:
+    rows = db.execute("SELECT id FROM runs WHERE framework = ? ORDER BY id DESC LIMIT ?", (framework, window))
+    return [row[0] for row in rows]
+
+
+def _durations(db: sqlite3.Connection, run_ids: list) -> list:
+    """(run_id, test_id, file, duration) of passed tests in the given runs."""
+    if not run_ids:
+        return []
+    marks = ",".join("?" * len(run_ids))
+    return db.execute(f"SELECT run_id, test_id, file, duration FROM results "
+                      f"WHERE status = 'passed' AND run_id IN ({marks})", run_ids).fetchall()
+
+
+def test_baselines(db: sqlite3.Connection, framework: str) -> dict:
+    """{test_id: median duration} over the rolling window of recent runs."""
+    samples = {}
+    for _, test_id, _, duration in _durations(db, _recent_runs(db, framework)):
+        samples.setdefault(test_id, []).append(duration)
+    return {test_id: statistics.median(values) for test_id, values in samples.items()}
+
+
+def file_estimates(db: sqlite3.Connection, framework: str) -> dict:
+    """{file: median per-run total} over the rolling window, for shard balancing."""
+    per_run = {}
+    for run_id, _, file, duration in _durations(db, _recent_runs(db, framework)):
+        per_run[(run_id, file)] = per_run.get((run_id, file), 0.0) + duration
+    samples = {}
+    for (_, file), total in per_run.items():
+        samples.setdefault(file, []).append(total)
+    return {file: statistics.median(values) for file, values in samples.items()}
+
+
+def record_run(db: sqlite3.Connection, framework: str, shards: int, merged: dict) -> None:
+    """Store this run's per-test durations and drop runs beyond HISTORY_KEEP."""
+    with db:
+        cur = db.execute("INSERT INTO runs (started_at, framework, shards, wall, passed) VALUES (?, ?, ?, ?, ?)",
+                         (datetime.now().isoformat(timespec='seconds'), framework, shards,
+                          merged["wall"], int(merged["passed"])))
+        db.executemany("INSERT INTO results (run_id, test_id, file, status, duration) VALUES (?, ?, ?, ?, ?)",
+                       [(cur.lastrowid, t["id"], t["file"], t["status"], t["duration"]) for t in merged["tests"]])
+        stale = [row[0] for row in db.execute(
+            "SELECT id FROM runs WHERE framework = ? ORDER BY id DESC LIMIT -1 OFFSET ?", (framework, HISTORY_KEEP))]
+        if stale:
+            marks = ",".join("?" * len(stale))
+            db.execute(f"DELETE FROM results WHERE run_id IN ({marks})", stale)
+            db.execute(f"DELETE FROM runs WHERE id IN ({marks})", stale)
+
+
+def slowest_tests(tests: list, baselines: dict, top: int) -> list:
+    ranked = sorted((t for t in tests if t["status"] != "skipped"), key=lambda t: t["duration"], reverse=True)
+    return [{"id": t["id"], "duration": round(t["duration"], 3),
+             "baseline": round(baselines[t["id"]], 3) if t["id"] in baselines else None}
+            for t in ranked[:top]]
+
+
+def find_regressions(tests: list, baselines: dict) -> list:
+    """Passed tests clearly slower than their rolling median, worst first."""
+    regressions = []
+    for t in tests:
+        base = baselines.get(t["id"])
+        if base is None or t["status"] != "passed":
+            continue
+        if t["duration"] > base * REGRESSION_RATIO and t["duration"] - base >= REGRESSION_MIN_DELTA:
+            regressions.append({"id": t["id"], "duration": round(t["duration"], 3), "baseline": round(base, 3),
+                                "slowdown": round(t["duration"] / base, 2) if base else None})
+    return sorted(regressions, key=lambda r: r["duration"] - r["baseline"], reverse=True)
+
+
+def main_sharded(test_info: dict, project_path: Path, shards: int) -> None:
+    """--shards N: run, merge, print a summary and exit with the merged status."""
+    state_dir = prepare_state_dir(project_path)
+    top = int(flag_value(sys.argv, "--top", "10"))
+    framework = test_info["framework"]
+    db = open_history(state_dir)
+    estimates = file_estimates(db, framework)
+    
+    plans = build_shards(test_info, project_path, shards, state_dir / "shards", estimates)
+    balanced = any(plan.get("balanced") for plan in plans)
+    print(f"Running {len(plans)} {framework} shards in parallel"
+          f"{' (balanced by recorded durations)' if balanced else ''}")
+    print("-"*60)
+    
+    merged = run_sharded(plans, project_path)
+    baselines = test_baselines(db, framework)
+    merged["slowest"] = slowest_tests(merged["tests"], baselines, top)
+    merged["regressions"] = find_regressions(merged["tests"], baselines)
+    record_run(db, framework, len(plans), merged)
+    db.close()
+    report_path = Path(flag_value(sys.argv, "--report", str(state_dir / "last-report.json")))
+    report_path.write_text(json.dumps(merged, indent=2), encoding='utf-8')
+    
+    for shard in merged["shards"]:
+        status = "[PASS]" if shard["returncode"] in (0, 5) else "[FAIL]"
+        print(f"{status} shard {shard['index']}: {shard['tests']} tests in {shard['duration']:.1f}s")
+        if shard["returncode"] not in (0, 5):
+            for line in (shard["error"] or shard["output"]).strip().splitlines()[-10:]:
+                print(f"    {line}")
+    failed = [t for t in merged["tests"] if t["status"] == "failed"]
+    for t in failed[:10]:
+        print(f"  FAILED {t['id']}")
+    
+    if merged["slowest"]:
+        print(f"\nSlowest {len(merged['slowest'])} tests:")
+        for t in merged["slowest"]:
+            base = f" (baseline {t['baseline']:.3f}s)" if t["baseline"] is not None else ""
+            print(f"  {t['duration']:8.3f}s  {t['id']}{base}")
+    if merged["regressions"]:
+        print(f"\nSlower than baseline ({len(merged['regressions'])}):")
+        for r in merged["regressions"][:top]:
+            print(f"  {r['baseline']:.3f}s -> {r['duration']:.3f}s  {r['id']}")
+    
+    print("\n" + "="*60)
+    print("SUMMARY")
+    print("="*60)
+    print("[PASS] All tests passed" if merged["passed"] else "[FAIL] Some tests failed")
+    print(f"Tests: {merged['tests_run']} total, {merged['tests_passed']} passed, "
+          f"{merged['tests_failed']} failed, {merged['tests_skipped']} skipped")
+    print(f"Wall: {merged['wall']:.1f}s across {len(plans)} shards "
+          f"(sum of shards {sum(s['duration'] for s in merged['shards']):.1f}s)")
+    
+    output = {
+        "script": "test_runner",
+        "project": str(project_path),
+        "type": test_info["type"],
+        "framework": test_info["framework"],
+        "shards": len(plans),
+        "tests_run": merged["tests_run"],
+        "tests_passed": merged["tests_passed"],
+        "tests_failed": merged["tests_failed"],
+        "balanced": balanced,
+        "slowest": merged["slowest"],
+        "regressions": merged["regressions"],
+        "report": str(report_path),
+        "passed": merged["passed"]
+    }
+    print("\n" + json.dumps(output, indent=2))
+    sys.exit(0 if merged["passed"] else 1)
+
+
 def main():
-    project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
+    args = [a for i, a in enumerate(sys.argv[1:], 1)
+            if not a.startswith('--') and sys.argv[i - 1] not in ('--shards', '--report', '--top')]
+    project_path = Path(args[0] if args else ".").resolve()
     with_coverage = "--coverage" in sys.argv
+    shards = int(flag_value(sys.argv, "--shards", "0"))
     
     print(f"\n{'='*60}")
     print(f"[TEST RUNNER] Unified Test Execution")
@@ -167,6 +610,14 @@ def main():
         print(json.dumps(output, indent=2))
         sys.exit(0)
     
+    if shards > 0:
+        if with_coverage:
+            print("Coverage is collected unsharded; ignoring --shards.")
+        elif test_info["framework"] not in SHARDABLE:
+            print(f"Sharding needs jest, vitest or pytest; running {test_info['framework']} unsharded.")
+        else:
+            main_sharded(test_info, project_path, shards)
+    
     # Choose command
     cmd = test_info["coverage_cmd"] if with_coverage and test_info["coverage_cmd"] else test_info["cmd"]
     
@@ -2,29 +2,103 @@
 """
 TypeScript Project Diagnostic Script
 Analyzes TypeScript projects for configuration, performance, and common issues.
+
+Usage: python ts_diagnostic.py [--clean]
+
+The type check runs once per invocation with `tsc --incremental` against a
+build-info file kept in .ts-diagnostic/, so repeat runs only re-check what
+changed; --extendedDiagnostics from the same run supplies the phase timings.
+--clean drops the cache for a cold measurement.
 """
 
+import re
+import shutil
 import subprocess
 import sys
 import os
 import json
+import time
 from pathlib import Path
 
-def run_cmd(cmd: str) -> str:
-    """Run shell command and return output."""
+CACHE_DIR_NAME = ".ts-diagnostic"
+TS_EXTENSIONS = {".ts", ".tsx"}
+
+# "Check time:   1.23s", "Memory used: 123456K", "Files:   312"
+DIAGNOSTIC_LINE = re.compile(r'^([A-Za-z][\w /()-]*?):\s+([\d.]+)([sK]?)\s*$')
+PHASES = ("I/O Read time", "Parse time", "ResolveModule time", "ResolveTypeReference time",
+          "Program time", "Bind time", "Check time", "transformTime time", "Emit time", "Total time")
+COUNTS = ("Files", "Lines", "Identifiers", "Symbols", "Types", "Instantiations", "Memory used")
+
+
+def run_cmd(cmd: list, cwd: str = None) -> str:
+    """Run a command (argument list, no shell) and return output."""
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
+        result = subprocess.run(cmd, capture_output=True, text=True, cwd=cwd)
         return result.stdout + result.stderr
-    except Exception as e:
-        return str(e)
+    except (OSError, subprocess.SubprocessError):
+        return ""
+
+
+def tsc_command() -> list:
+    """The project's own tsc when installed, skipping npx start-up; npx otherwise."""
+    local = Path("node_modules") / ".bin" / ("tsc.cmd" if os.name == "nt" else "tsc")
+    return [str(local)] if local.exists() else ["npx", "--no-install", "tsc"]
+
+
+def prepare_cache_dir() -> Path:
+    cache_dir = Path(CACHE_DIR_NAME)
+    cache_dir.mkdir(exist_ok=True)
+    gitignore = cache_dir / ".gitignore"
+    if not gitignore.exists():
+        gitignore.write_text("*\n")
+    return cache_dir
+
+
+def run_type_check() -> dict:
+    """One incremental `tsc --noEmit --extendedDiagnostics` run: errors plus phase stats."""
+    build_info = prepare_cache_dir() / "tsconfig.tsbuildinfo"
+    warm = build_info.exists()
+    started = time.perf_counter()
+    output = run_cmd(tsc_command() + [
+        "--noEmit", "--incremental", "--tsBuildInfoFile", str(build_info),
+        "--extendedDiagnostics", "--pretty", "false",
+    ])
+    wall = time.perf_counter() - started
+
+    errors, stats = [], {}
+    for line in output.splitlines():
+        if "error TS" in line:
+            errors.append(line)
+            continue
+        match = DIAGNOSTIC_LINE.match(line.strip())
+        if match:
+            name, value, unit = match.groups()
+            stats[name] = float(value) if unit == "s" or "." in value else int(value)
+    return {"output": output, "errors": errors, "stats": stats, "warm": warm, "wall": wall}
+
+
+def iter_source_lines(root: str = "src"):
+    """(path, line) for every .ts/.tsx line under root."""
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = sorted(d for d in dirs if d != "node_modules")
+        for name in sorted(files):
+            if os.path.splitext(name)[1] not in TS_EXTENSIONS:
+                continue
+            path = os.path.join(dirpath, name)
+            try:
+                with open(path, encoding="utf-8", errors="ignore") as f:
+                    for number, line in enumerate(f, 1):
+                        yield path, number, line.rstrip("\n")
+            except OSError:
+                continue
 
 def check_versions():
     """Check TypeScript and Node versions."""
     print("\n📦 Versions:")
     print("-" * 40)
     
-    ts_version = run_cmd("npx tsc --version 2>/dev/null").strip()
-    node_version = run_cmd("node -v 2>/dev/null").strip()
+    ts_version = run_cmd(tsc_command() + ["--version"]).strip()
+    node_version = run_cmd(["node", "-v"]).strip()
     
     print(f"  TypeScript: {ts_version or 'Not found'}")
     print(f"  Node.js: {node_version or 'Not found'}")
@@ -129,16 +203,18 @@ def check_monorepo():
     if not found:
         print("  ⚪ No monorepo configuration detected")
 
-def check_type_errors():
+def check_type_errors(type_check: dict = None):
     """Run quick type check."""
     print("\n🔍 Type Check:")
     print("-" * 40)
     
-    result = run_cmd("npx tsc --noEmit 2>&1 | head -20")
-    if "error TS" in result:
-        errors = result.count("error TS")
-        print(f"  ❌ {errors}+ type errors found")
-        print(result[:500])
+    type_check = type_check or run_type_check()
+    errors = type_check["errors"]
+    if errors:
+        print(f"  ❌ {len(errors)} type errors found")
+        print("\n".join(errors[:20])[:500])
+    elif not type_check["stats"]:
+        print("  ⚠️ tsc did not run (is typescript installed?)")
     else:
         print("  ✅ No type errors")
 
@@ -147,13 +223,11 @@ def check_any_usage():
     print("\n⚠️ 'any' Type Usage:")
     print("-" * 40)
     
-    result = run_cmd("grep -r ': any' --include='*.ts' --include='*.tsx' src/ 2>/dev/null | wc -l")
-    count = result.strip()
-    if count and count != "0":
-        print(f"  ⚠️ Found {count} occurrences of ': any'")
-        sample = run_cmd("grep -rn ': any' --include='*.ts' --include='*.tsx' src/ 2>/dev/null | head -5")
-        if sample:
-            print(sample)
+    matches = [(path, number, line) for path, number, line in iter_source_lines() if ": any" in line]
+    if matches:
+        print(f"  ⚠️ Found {len(matches)} occurrences of ': any'")
+        for path, number, line in matches[:5]:
+            print(f"{path}:{number}:{line}")
     else:
         print("  ✅ No explicit 'any' types found")
 
@@ -162,38 +236,51 @@ def check_type_assertions():
     print("\n⚠️ Type Assertions (as):")
     print("-" * 40)
     
-    result = run_cmd("grep -r ' as ' --include='*.ts' --include='*.tsx' src/ 2>/dev/null | grep -v 'import' | wc -l")
-    count = result.strip()
-    if count and count != "0":
+    count = sum(1 for _, _, line in iter_source_lines() if " as " in line and "import" not in line)
+    if count:
         print(f"  ⚠️ Found {count} type assertions")
     else:
         print("  ✅ No type assertions found")
 
-def check_performance():
+def check_performance(type_check: dict = None):
     """Check type checking performance."""
     print("\n⏱️ Type Check Performance:")
     print("-" * 40)
     
-    result = run_cmd("npx tsc --extendedDiagnostics --noEmit 2>&1 | grep -E 'Check time|Files:|Lines:|Nodes:'")
-    if result.strip():
-        for line in result.strip().split('\n'):
-            print(f"  {line}")
-    else:
+    type_check = type_check or run_type_check()
+    stats = type_check["stats"]
+    if not stats:
         print("  ⚠️ Could not measure performance")
+        return
+
+    cache = "warm (incremental)" if type_check["warm"] else "cold (cache created)"
+    print(f"  Run: {cache}, {type_check['wall']:.2f}s wall")
+    for name in COUNTS:
+        if name in stats:
+            print(f"  {name}: {stats[name]}{'K' if name == 'Memory used' else ''}")
+    total = stats.get("Total time") or sum(stats.get(p, 0) for p in PHASES[:-1]) or 1
+    for phase in PHASES:
+        if phase in stats:
+            share = "" if phase == "Total time" else f" ({stats[phase] / total:.0%})"
+            print(f"  {phase}: {stats[phase]:.2f}s{share}")
 
 def main():
     print("=" * 50)
     print("🔍 TypeScript Project Diagnostic Report")
     print("=" * 50)
     
+    if "--clean" in sys.argv:
+        shutil.rmtree(CACHE_DIR_NAME, ignore_errors=True)
+
     check_versions()
     check_tsconfig()
     check_tooling()
     check_monorepo()
     check_any_usage()
     check_type_assertions()
-    check_type_errors()
-    check_performance()
+    type_check = run_type_check()
+    check_type_errors(type_check)
+    check_performance(type_check)
     
     print("\n" + "=" * 50)
     print("✅ Diagnostic Complete")
@@ -3,8 +3,8 @@
 Skill: vulnerability-scanner
 Script: security_scan.py
 Purpose: Validate that security principles from SKILL.md are applied correctly
-Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config]
-Output: JSON with validation findings
+Usage: python security_scan.py <project_path> [--scan-type all|deps|secrets|patterns|config] [--jsonl] [--max-size 2M]
+Output: JSON with validation findings (or one JSON line per finding with --jsonl)
 
 This script verifies:
 1. Dependencies - Supply chain security (OWASP A03)
@@ -18,10 +18,17 @@ import os
 import sys
 import re
 import argparse
+import time
+from functools import partial
 from pathlib import Path
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Callable, Optional
 from datetime import datetime
 
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / '.shared'))
+from audit_kit import profiling
+from audit_kit.jsonl import emit, emit_summary
+from audit_kit.files import DEFAULT_MAX_BYTES, SlowestFiles, finditer_mmap, is_binary, parse_size, read_text, skip_reason
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -85,6 +92,16 @@ DANGEROUS_PATTERNS = [
     (r'yaml\.load\s*\([^)]*\)(?!\s*,\s*Loader)', "Unsafe YAML load", "high", "Deserialization risk"),
 ]
 
+# Times each pattern per file when run with --profile; a plain pass-through otherwise
+re = profiling.instrument(re)
+profiling.label((pattern, name) for pattern, name, *_ in SECRET_PATTERNS + DANGEROUS_PATTERNS)
+
+# (text regex, bytes regex for mmap scanning of large files, type, severity)
+COMPILED_SECRET_PATTERNS = [
+    (re.compile(pattern, re.IGNORECASE), re.compile(pattern.encode(), re.IGNORECASE), secret_type, severity)
+    for pattern, secret_type, severity in SECRET_PATTERNS
+]
+
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
@@ -94,12 +111,32 @@ CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.
 #  SCANNING FUNCTIONS
 # ============================================================================
 
-def scan_dependencies(project_path: str) -> Dict[str, Any]:
+Emitter = Optional[Callable[[dict], None]]
+
+
+def add_finding(results: Dict[str, Any], finding: Dict[str, Any], emit_fn: Emitter = None) -> None:
+    """
+    Record a finding. With an emitter the finding is streamed immediately
+    and only counted, so memory stays flat and nothing is truncated.
+    """
+    severity = finding.get("severity", "low")
+    counts = results["finding_counts"]
+    counts[severity] = counts.get(severity, 0) + 1
+    if emit_fn:
+        # A finding's own "type" (e.g. "AWS Access Key") is streamed as "rule"
+        record = {"type": "finding", "tool": results["tool"]}
+        record.update({("rule" if key == "type" else key): value for key, value in finding.items()})
+        emit_fn(record)
+    else:
+        results["findings"].append(finding)
+
+
+def scan_dependencies(project_path: str, emit_fn: Emitter = None) -> Dict[str, Any]:
     """
     Validate supply chain security (OWASP A03).
     Checks: npm audit, lock file presence, dependency age.
     """
-    results = {"tool": "dependency_scanner", "findings": [], "status": "[OK] Secure"}
+    results = {"tool": "dependency_scanner", "findings": [], "finding_counts": {}, "status": "[OK] Secure"}
     
     # Check for lock files
     lock_files = {
@@ -122,11 +159,11 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                 found_locks.append(manager)
             else:
                 missing_locks.append(manager)
-                results["findings"].append({
+                add_finding(results, {
                     "type": "Missing Lock File",
                     "severity": "high",
                     "message": f"{manager}: No lock file found. Supply chain integrity at risk."
-                })
+                }, emit_fn)
     
     # Run npm audit if applicable
     if (Path(project_path) / "package.json").exists():
@@ -151,18 +188,18 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
                 
                 if severity_count["critical"] > 0:
                     results["status"] = "[!!] Critical vulnerabilities"
-                    results["findings"].append({
+                    add_finding(results, {
                         "type": "npm audit",
                         "severity": "critical",
                         "message": f"{severity_count['critical']} critical vulnerabilities in dependencies"
-                    })
+                    }, emit_fn)
                 elif severity_count["high"] > 0:
                     results["status"] = "[!] High vulnerabilities"
-                    results["findings"].append({
+                    add_finding(results, {
                         "type": "npm audit",
                         "severity": "high",
                         "message": f"{severity_count['high']} high severity vulnerabilities"
-                    })
+                    }, emit_fn)
                 
                 results["npm_audit"] = severity_count
                 
@@ -172,24 +209,51 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
         except (FileNotFoundError, subprocess.TimeoutExpired):
             pass
     
-    if not results["findings"]:
+    if not results["finding_counts"]:
         results["status"] = "[OK] Supply chain checks passed"
     
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
+def _count_secrets(filepath: Path, max_bytes: int) -> List[tuple]:
+    """
+    Return [(secret_type, severity, count)] for one file. Files above max_bytes
+    are scanned through mmap windows so memory stays bounded.
+    """
+    found = []
+    if filepath.stat().st_size > max_bytes:
+        for _, bytes_rx, secret_type, severity in COMPILED_SECRET_PATTERNS:
+            count = sum(1 for _ in finditer_mmap(str(filepath), bytes_rx))
+            if count:
+                found.append((secret_type, severity, count))
+        return found
+    
+    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+        content = f.read()
+    for text_rx, _, secret_type, severity in COMPILED_SECRET_PATTERNS:
+        matches = text_rx.findall(content)
+        if matches:
+            found.append((secret_type, severity, len(matches)))
+    return found
+
+
+def scan_secrets(project_path: str, emit_fn: Emitter = None, max_bytes: int = DEFAULT_MAX_BYTES) -> Dict[str, Any]:
     """
     Validate no hardcoded secrets (OWASP A04).
     Checks: API keys, tokens, passwords, cloud credentials.
+    Binary files are skipped; files above max_bytes are scanned in chunks.
     """
     results = {
         "tool": "secret_scanner",
         "findings": [],
+        "finding_counts": {},
         "status": "[OK] No secrets detected",
         "scanned_files": 0,
+        "chunked_files": 0,
+        "skipped_files": 0,
         "by_severity": {"critical": 0, "high": 0, "medium": 0}
     }
+    slowest = SlowestFiles()
     
     for root, dirs, files in os.walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
@@ -200,25 +264,30 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
                 continue
                 
             filepath = Path(root) / file
+            if is_binary(str(filepath)):
+                results["skipped_files"] += 1
+                continue
             results["scanned_files"] += 1
             
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
+            started = time.perf_counter()
+            with profiling.track_file(filepath.relative_to(project_path)):
+                try:
+                    if filepath.stat().st_size > max_bytes:
+                        results["chunked_files"] += 1
+                    for secret_type, severity, count in _count_secrets(filepath, max_bytes):
+                        add_finding(results, {
+                            "file": str(filepath.relative_to(project_path)),
+                            "type": secret_type,
+                            "severity": severity,
+                            "count": count
+                        }, emit_fn)
+                        results["by_severity"][severity] += count
                             
-            except Exception:
-                pass
+                except Exception:
+                    pass
+            slowest.record(str(filepath.relative_to(project_path)), time.perf_counter() - started)
+    
+    results["slowest_files"] = slowest.top()
     
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
@@ -227,24 +296,28 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     elif sum(results["by_severity"].values()) > 0:
         results["status"] = "[?] Potential secrets detected"
     
-    # Limit findings for output
+    # Limit findings for output (streamed findings are never truncated)
     results["findings"] = results["findings"][:15]
     
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str, emit_fn: Emitter = None, max_bytes: int = DEFAULT_MAX_BYTES) -> Dict[str, Any]:
     """
     Validate dangerous code patterns (OWASP A05).
     Checks: Injection risks, XSS, unsafe deserialization.
+    Binary files and files above max_bytes (minified bundles) are skipped.
     """
     results = {
         "tool": "pattern_scanner",
         "findings": [],
+        "finding_counts": {},
         "status": "[OK] No dangerous patterns",
         "scanned_files": 0,
+        "skipped_files": 0,
         "by_category": {}
     }
+    slowest = SlowestFiles()
     
     for root, dirs, files in os.walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
@@ -255,36 +328,42 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
                 continue
                 
             filepath = Path(root) / file
+            if skip_reason(str(filepath), max_bytes):
+                results["skipped_files"] += 1
+                continue
             results["scanned_files"] += 1
             
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
+            started = time.perf_counter()
+            with profiling.track_file(filepath.relative_to(project_path)):
+                try:
+                    with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
+                        for line_num, line in enumerate(f, 1):
+                            for pattern, name, severity, category in DANGEROUS_PATTERNS:
+                                if re.search(pattern, line, re.IGNORECASE):
+                                    add_finding(results, {
+                                        "file": str(filepath.relative_to(project_path)),
+                                        "line": line_num,
+                                        "pattern": name,
+                                        "severity": severity,
+                                        "category": category,
+                                        "snippet": line.strip()[:80]
+                                    }, emit_fn)
+                                    results["by_category"][category] = results["by_category"].get(category, 0) + 1
                                 
-            except Exception:
-                pass
+                except Exception:
+                    pass
+            slowest.record(str(filepath.relative_to(project_path)), time.perf_counter() - started)
     
-    critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
-    high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
+    results["slowest_files"] = slowest.top()
+    
+    critical_count = results["finding_counts"].get("critical", 0)
+    high_count = results["finding_counts"].get("high", 0)
     
     if critical_count > 0:
         results["status"] = f"[!!] CRITICAL: {critical_count} dangerous patterns"
     elif high_count > 0:
         results["status"] = f"[!] HIGH: {high_count} risky patterns"
-    elif results["findings"]:
+    elif results["finding_counts"]:
         results["status"] = "[?] Some patterns need review"
     
     # Limit findings
@@ -293,7 +372,7 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_configuration(project_path: str, emit_fn: Emitter = None, max_bytes: int = DEFAULT_MAX_BYTES) -> Dict[str, Any]:
     """
     Validate security configuration (OWASP A02).
     Checks: Security headers, CORS, debug modes.
@@ -301,6 +380,7 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     results = {
         "tool": "config_scanner",
         "findings": [],
+        "finding_counts": {},
         "status": "[OK] Configuration secure",
         "checks": {}
     }
@@ -324,21 +404,18 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
                 continue
                 
             filepath = Path(root) / file
+            content, _ = read_text(str(filepath), max_bytes, errors='ignore')
+            if content is None:
+                continue
             
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
+            with profiling.track_file(filepath.relative_to(project_path)):
+                for pattern, issue, severity in config_issues:
+                    if re.search(pattern, content, re.IGNORECASE):
+                        add_finding(results, {
+                            "file": str(filepath.relative_to(project_path)),
+                            "issue": issue,
+                            "severity": severity
+                        }, emit_fn)
     
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
@@ -349,17 +426,17 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
             break
     else:
         results["checks"]["security_headers_config"] = False
-        results["findings"].append({
+        add_finding(results, {
             "issue": "No security headers configuration found",
             "severity": "medium",
             "recommendation": "Configure CSP, HSTS, X-Frame-Options headers"
-        })
+        }, emit_fn)
     
-    if any(f["severity"] == "critical" for f in results["findings"]):
+    if results["finding_counts"].get("critical"):
         results["status"] = "[!!] CRITICAL: Configuration issues"
-    elif any(f["severity"] == "high" for f in results["findings"]):
+    elif results["finding_counts"].get("high"):
         results["status"] = "[!] HIGH: Configuration review needed"
-    elif results["findings"]:
+    elif results["finding_counts"]:
         results["status"] = "[?] Minor configuration issues"
     
     return results
@@ -369,8 +446,9 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
 #  MAIN
 # ============================================================================
 
-def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
-    """Execute security validation scans."""
+def run_full_scan(project_path: str, scan_type: str = "all", emit_fn: Emitter = None,
+                  max_bytes: int = DEFAULT_MAX_BYTES) -> Dict[str, Any]:
+    """Execute security validation scans. With emit_fn, findings are streamed instead of kept."""
     
     report = {
         "project": project_path,
@@ -387,25 +465,21 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     
     scanners = {
         "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
+        "secrets": ("secrets", partial(scan_secrets, max_bytes=max_bytes)),
+        "patterns": ("code_patterns", partial(scan_code_patterns, max_bytes=max_bytes)),
+        "config": ("configuration", partial(scan_configuration, max_bytes=max_bytes)),
     }
     
     for key, (name, scanner) in scanners.items():
         if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
+            result = scanner(project_path, emit_fn)
             report["scans"][name] = result
             
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
-                if sev == "critical":
-                    report["summary"]["critical"] += 1
-                elif sev == "high":
-                    report["summary"]["high"] += 1
+            # Count from finding_counts so truncated/streamed findings are still totalled
+            counts = result.get("finding_counts", {})
+            report["summary"]["total_findings"] += sum(counts.values())
+            report["summary"]["critical"] += counts.get("critical", 0)
+            report["summary"]["high"] += counts.get("high", 0)
     
     # Determine overall status
     if report["summary"]["critical"] > 0:
@@ -425,16 +499,36 @@ def main():
     parser.add_argument("project_path", nargs="?", default=".", help="Project directory to scan")
     parser.add_argument("--scan-type", choices=["all", "deps", "secrets", "patterns", "config"],
                         default="all", help="Type of scan to run")
-    parser.add_argument("--output", choices=["json", "summary"], default="json",
+    parser.add_argument("--output", choices=["json", "summary", "jsonl"], default="json",
                         help="Output format")
+    parser.add_argument("--jsonl", action="store_const", dest="output", const="jsonl",
+                        help="Stream one JSON line per finding as it is found (no truncation)")
+    parser.add_argument("--max-size", type=parse_size, default=DEFAULT_MAX_BYTES,
+                        help="Skip files larger than this (e.g. 500K, 2M); secrets are still scanned in chunks")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time every rule and file; report the slowest on stderr")
+    parser.add_argument("--profile-top", type=int, default=10, help="Rules/files shown in the profile report")
+    parser.add_argument("--profile-out",
+                        help="Write the profile (.speedscope.json, .folded, or JSON report otherwise)")
     
     args = parser.parse_args()
+    profiler = None
+    if args.profile or args.profile_out:
+        profiler = profiling.start("security_scan", args.profile_top, args.profile_out)
     
     if not os.path.isdir(args.project_path):
         print(json.dumps({"error": f"Directory not found: {args.project_path}"}))
         sys.exit(1)
     
-    result = run_full_scan(args.project_path, args.scan_type)
+    if args.output == "jsonl":
+        result = run_full_scan(args.project_path, args.scan_type, emit_fn=emit, max_bytes=args.max_size)
+        emit_summary("security_scan", project=result["project"], scan_type=result["scan_type"],
+                     **result["summary"],
+                     statuses={name: scan["status"] for name, scan in result["scans"].items()})
+        if profiler: profiler.finish()
+        return
+    
+    result = run_full_scan(args.project_path, args.scan_type, max_bytes=args.max_size)
     
     if args.output == "summary":
         print(f"\n{'='*60}")
@@ -450,8 +544,12 @@ def main():
             print(f"\n{scan_name.upper()}: {scan_result['status']}")
             for finding in scan_result.get('findings', [])[:5]:
                 print(f"  - {finding}")
+            if scan_result.get('slowest_files'):
+                slow = ", ".join(f"{s['file']} ({s['seconds'] * 1000:.0f}ms)" for s in scan_result['slowest_files'][:3])
+                print(f"  Slowest: {slow}")
     else:
         print(json.dumps(result, indent=2))
+    if profiler: profiler.finish()
 
 
 if __name__ == "__main__":
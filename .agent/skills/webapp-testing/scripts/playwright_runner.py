@@ -4,15 +4,30 @@ Skill: webapp-testing
 Script: playwright_runner.py
 Purpose: Run basic Playwright browser tests
 Usage: python playwright_runner.py <url> [--screenshot]
+       python playwright_runner.py <url> <url> ... [--concurrency 4] [--a11y]
+       python playwright_runner.py --urls urls.txt [--concurrency 4]
+       python playwright_runner.py --serve out/ [/route ...]
 Output: JSON with page info, health status, and optional screenshot path
+    Performance: navigation/paint timing, LCP/CLS/INP, transfer sizes and a
+    request waterfall (PerformanceObserver installed before navigation)
+Multi-URL: one browser is launched and pages run in parallel contexts
+    (async Playwright, bounded by --concurrency); one JSON report for all URLs.
+    --serve DIR serves a static export (e.g. `next build` output in out/) on a
+    local port and checks the given routes, or every .html page in DIR.
 Note: Requires playwright (pip install playwright && playwright install chromium)
 Screenshots: Saved to system temp directory (auto-cleaned by OS)
 """
 import sys
 import json
 import os
+import re
+import asyncio
 import tempfile
+import threading
+import time
 from datetime import datetime
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
 
 # Fix Windows console encoding for Unicode output
 try:
@@ -22,93 +37,278 @@ except AttributeError:
     pass  # Python < 3.7
 
 try:
-    from playwright.sync_api import sync_playwright
+    from playwright.async_api import async_playwright
     PLAYWRIGHT_AVAILABLE = True
 except ImportError:
     PLAYWRIGHT_AVAILABLE = False
 
+DEFAULT_CONCURRENCY = 4
+VIEWPORT = {"width": 1280, "height": 720}
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
+NOT_INSTALLED = {
+    "error": "Playwright not installed",
+    "fix": "pip install playwright && playwright install chromium"
+}
 
-def run_basic_test(url: str, take_screenshot: bool = False) -> dict:
-    """Run basic browser test on URL."""
-    if not PLAYWRIGHT_AVAILABLE:
-        return {
-            "error": "Playwright not installed",
-            "fix": "pip install playwright && playwright install chromium"
-        }
-    
+# Installed with add_init_script, so observers exist before the first byte of
+# the page runs; buffered entries cover anything recorded before they attach.
+VITALS_INIT_SCRIPT = """
+(() => {
+  const vitals = window.__vitals = {lcp: null, lcpElement: null, cls: 0, inp: null};
+  const observe = (type, callback, options) => {
+    try {
+      new PerformanceObserver(list => list.getEntries().forEach(callback))
+        .observe(Object.assign({type, buffered: true}, options));
+    } catch (e) { /* entry type not supported by this browser */ }
+  };
+  observe('largest-contentful-paint', entry => {
+    vitals.lcp = entry.renderTime || entry.loadTime || entry.startTime;
+    const el = entry.element;
+    vitals.lcpElement = el ? el.tagName.toLowerCase() + (el.id ? '#' + el.id : '') : null;
+  });
+  // CLS: largest session window (gap < 1s, window < 5s), ignoring input-driven shifts
+  let windowValue = 0, windowStart = 0, lastShift = 0;
+  observe('layout-shift', entry => {
+    if (entry.hadRecentInput) return;
+    if (entry.startTime - lastShift > 1000 || entry.startTime - windowStart > 5000) {
+      windowValue = 0;
+      windowStart = entry.startTime;
+    }
+    windowValue += entry.value;
+    lastShift = entry.startTime;
+    vitals.cls = Math.max(vitals.cls, windowValue);
+  });
+  // INP: slowest interaction; stays null when nothing was interacted with
+  observe('event', entry => {
+    if (entry.interactionId) vitals.inp = Math.max(vitals.inp || 0, entry.duration);
+  }, {durationThreshold: 16});
+})();
+"""
+
+COLLECT_TIMINGS_SCRIPT = """
+() => {
+  const nav = performance.getEntriesByType('navigation')[0] || null;
+  const paint = {};
+  performance.getEntriesByType('paint').forEach(p => { paint[p.name] = p.startTime; });
+  const resources = performance.getEntriesByType('resource').map(r => ({
+    name: r.name, type: r.initiatorType, start: r.startTime, duration: r.duration,
+    transfer_size: r.transferSize, encoded_size: r.encodedBodySize,
+    decoded_size: r.decodedBodySize, protocol: r.nextHopProtocol
+  }));
+  return {nav: nav && nav.toJSON(), paint, resources, vitals: window.__vitals || null};
+}
+"""
+
+
+def _screenshot_path(url: str) -> str:
+    """Unique per URL, so concurrent pages never overwrite each other."""
+    # Cross-platform: Windows=%TEMP%, Linux/macOS=/tmp
+    screenshot_dir = os.path.join(tempfile.gettempdir(), "maestro_screenshots")
+    os.makedirs(screenshot_dir, exist_ok=True)
+    slug = re.sub(r'[^A-Za-z0-9]+', '_', url.split('://', 1)[-1]).strip('_')[:60]
+    return os.path.join(screenshot_dir, f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{slug}.png")
+
+
+def _ms(value):
+    return round(value, 1) if isinstance(value, (int, float)) else None
+
+
+def summarize_timings(raw: dict) -> dict:
+    """Shape the COLLECT_TIMINGS_SCRIPT entries into the per-URL performance report."""
+    nav = raw.get("nav") or {}
+    vitals = raw.get("vitals") or {}
+    resources = sorted(raw.get("resources") or [], key=lambda r: r["start"])
+
+    def span(start, end):
+        return _ms(nav[end] - nav[start]) if nav.get(start) and nav.get(end) else 0.0
+
+    by_type = {}
+    for res in resources:
+        bucket = by_type.setdefault(res["type"] or "other", {"count": 0, "transfer_bytes": 0})
+        bucket["count"] += 1
+        bucket["transfer_bytes"] += res["transfer_size"] or 0
+    document_bytes = nav.get("transferSize") or 0
+
+    return {
+        # Milliseconds from navigation start, as before
+        "dom_content_loaded": _ms(nav.get("domContentLoadedEventEnd")),
+        "load_complete": _ms(nav.get("loadEventEnd")),
+        "navigation": {
+            "type": nav.get("type"),
+            "protocol": nav.get("nextHopProtocol"),
+            "redirect": span("redirectStart", "redirectEnd"),
+            "dns": span("domainLookupStart", "domainLookupEnd"),
+            "connect": span("connectStart", "connectEnd"),
+            "tls": span("secureConnectionStart", "connectEnd"),
+            "ttfb": _ms(nav.get("responseStart")),
+            "download": span("responseStart", "responseEnd"),
+            "dom_interactive": _ms(nav.get("domInteractive")),
+            "transfer_size": document_bytes,
+            "encoded_body_size": nav.get("encodedBodySize"),
+            "decoded_body_size": nav.get("decodedBodySize"),
+        },
+        "paint": {
+            "first_paint": _ms(raw.get("paint", {}).get("first-paint")),
+            "first_contentful_paint": _ms(raw.get("paint", {}).get("first-contentful-paint")),
+        },
+        "web_vitals": {
+            "lcp": _ms(vitals.get("lcp")),
+            "lcp_element": vitals.get("lcpElement"),
+            "cls": round(vitals.get("cls") or 0, 4),
+            "inp": _ms(vitals.get("inp")),
+        },
+        "transfer": {
+            "requests": len(resources) + (1 if nav else 0),
+            "total_bytes": document_bytes + sum(b["transfer_bytes"] for b in by_type.values()),
+            "by_type": by_type,
+        },
+        "waterfall": [
+            {
+                "url": res["name"],
+                "type": res["type"],
+                "start": _ms(res["start"]),
+                "duration": _ms(res["duration"]),
+                "transfer_size": res["transfer_size"],
+                "encoded_size": res["encoded_size"],
+                "protocol": res["protocol"],
+            }
+            for res in resources
+        ],
+    }
+
+
+async def _basic_checks(page, url: str, take_screenshot: bool) -> dict:
+    """The run_basic_test report for one page, in its own context."""
     result = {
         "url": url,
         "timestamp": datetime.now().isoformat(),
         "status": "pending"
     }
-    
+
+    # Listeners go on before navigation so errors raised while loading are kept
+    console_errors, page_errors, failed_requests = [], [], []
+    page.on("console", lambda msg: console_errors.append(msg.text) if msg.type == "error" else None)
+    page.on("pageerror", lambda error: page_errors.append(str(error)))
+    page.on("requestfailed", lambda request: failed_requests.append(
+        {"url": request.url, "error": request.failure}))
+    page.on("response", lambda response: failed_requests.append(
+        {"url": response.url, "status": response.status}) if response.status >= 400 else None)
+
+    # Navigate
+    response = await page.goto(url, wait_until="networkidle", timeout=30000)
+    title = await page.title()
+
+    # Basic info
+    result["page"] = {
+        "title": title,
+        "url": page.url,
+        "status_code": response.status if response else None
+    }
+
+    # Health checks
+    result["health"] = {
+        "loaded": response.ok if response else False,
+        "has_title": bool(title),
+        "has_h1": await page.locator("h1").count() > 0,
+        "has_links": await page.locator("a").count() > 0,
+        "has_images": await page.locator("img").count() > 0
+    }
+
+    # Performance metrics
+    result["performance"] = summarize_timings(await page.evaluate(COLLECT_TIMINGS_SCRIPT))
+    result["console_errors"] = console_errors
+    result["page_errors"] = page_errors
+    result["failed_requests"] = failed_requests
+
+    # Screenshot - uses system temp directory (cross-platform, auto-cleaned)
+    if take_screenshot:
+        screenshot_path = _screenshot_path(url)
+        await page.screenshot(path=screenshot_path, full_page=True)
+        result["screenshot"] = screenshot_path
+        result["screenshot_note"] = "Saved to temp directory (auto-cleaned by OS)"
+
+    # Element counts
+    result["elements"] = {
+        "links": await page.locator("a").count(),
+        "buttons": await page.locator("button").count(),
+        "inputs": await page.locator("input").count(),
+        "images": await page.locator("img").count(),
+        "forms": await page.locator("form").count()
+    }
+
+    result["status"] = "success" if result["health"]["loaded"] else "failed"
+    result["summary"] = "[OK] Page loaded successfully" if result["status"] == "success" else "[X] Page failed to load"
+    return result
+
+
+async def _accessibility_checks(page, url: str) -> dict:
+    """The run_accessibility_check report for one page."""
+    result = {"url": url, "accessibility": {}}
+    await page.goto(url, wait_until="networkidle", timeout=30000)
+
+    # Basic a11y checks
+    result["accessibility"] = {
+        "images_with_alt": await page.locator("img[alt]").count(),
+        "images_without_alt": await page.locator("img:not([alt])").count(),
+        "buttons_with_label": await page.locator("button[aria-label], button:has-text('')").count(),
+        "links_with_text": await page.locator("a:has-text('')").count(),
+        "form_labels": await page.locator("label").count(),
+        "headings": {
+            "h1": await page.locator("h1").count(),
+            "h2": await page.locator("h2").count(),
+            "h3": await page.locator("h3").count()
+        }
+    }
+    result["status"] = "success"
+    return result
+
+
+async def _check_url(browser, semaphore, url: str, take_screenshot: bool, a11y: bool) -> dict:
+    """Run one URL in a fresh context of the shared browser."""
+    async with semaphore:
+        started = time.perf_counter()
+        context = await browser.new_context(viewport=VIEWPORT, user_agent=USER_AGENT)
+        try:
+            if not a11y:
+                await context.add_init_script(VITALS_INIT_SCRIPT)
+            page = await context.new_page()
+            if a11y:
+                result = await _accessibility_checks(page, url)
+            else:
+                result = await _basic_checks(page, url, take_screenshot)
+        except Exception as e:
+            result = {"url": url, "status": "error", "error": str(e)}
+            if not a11y:
+                result["summary"] = f"[X] Error: {str(e)[:100]}"
+        finally:
+            await context.close()
+        result["duration_ms"] = round((time.perf_counter() - started) * 1000)
+        return result
+
+
+async def _check_urls(urls: list, concurrency: int, take_screenshot: bool, a11y: bool) -> list:
+    """Launch Chromium once and check every URL with at most `concurrency` open pages."""
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    async with async_playwright() as p:
+        browser = await p.chromium.launch(headless=True)
+        try:
+            return await asyncio.gather(*(
+                _check_url(browser, semaphore, url, take_screenshot, a11y) for url in urls
+            ))
+        finally:
+            await browser.close()
+
+
+def run_basic_test(url: str, take_screenshot: bool = False) -> dict:
+    """Run basic browser test on URL."""
+    if not PLAYWRIGHT_AVAILABLE:
+        return dict(NOT_INSTALLED)
+
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            context = browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                user_agent="Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
-            )
-            page = context.new_page()
-            
-            # Navigate
-            response = page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # Basic info
-            result["page"] = {
-                "title": page.title(),
-                "url": page.url,
-                "status_code": response.status if response else None
-            }
-            
-            # Health checks
-            result["health"] = {
-                "loaded": response.ok if response else False,
-                "has_title": bool(page.title()),
-                "has_h1": page.locator("h1").count() > 0,
-                "has_links": page.locator("a").count() > 0,
-                "has_images": page.locator("img").count() > 0
-            }
-            
-            # Console errors
-            console_errors = []
-            page.on("console", lambda msg: console_errors.append(msg.text) if msg.type == "error" else None)
-            
-            # Performance metrics
-            result["performance"] = {
-                "dom_content_loaded": page.evaluate("window.performance.timing.domContentLoadedEventEnd - window.performance.timing.navigationStart"),
-                "load_complete": page.evaluate("window.performance.timing.loadEventEnd - window.performance.timing.navigationStart")
-            }
-            
-            # Screenshot - uses system temp directory (cross-platform, auto-cleaned)
-            if take_screenshot:
-                # Cross-platform: Windows=%TEMP%, Linux/macOS=/tmp
-                screenshot_dir = os.path.join(tempfile.gettempdir(), "maestro_screenshots")
-                os.makedirs(screenshot_dir, exist_ok=True)
-                screenshot_path = os.path.join(screenshot_dir, f"screenshot_{datetime.now().strftime('%Y%m%d_%H%M%S')}.png")
-                page.screenshot(path=screenshot_path, full_page=True)
-                result["screenshot"] = screenshot_path
-                result["screenshot_note"] = "Saved to temp directory (auto-cleaned by OS)"
-            
-            # Element counts
-            result["elements"] = {
-                "links": page.locator("a").count(),
-                "buttons": page.locator("button").count(),
-                "inputs": page.locator("input").count(),
-                "images": page.locator("img").count(),
-                "forms": page.locator("form").count()
-            }
-            
-            browser.close()
-            
-            result["status"] = "success" if result["health"]["loaded"] else "failed"
-            result["summary"] = "[OK] Page loaded successfully" if result["status"] == "success" else "[X] Page failed to load"
-            
+        result = asyncio.run(_check_urls([url], 1, take_screenshot, False))[0]
     except Exception as e:
-        result["status"] = "error"
-        result["error"] = str(e)
-        result["summary"] = f"[X] Error: {str(e)[:100]}"
-    
+        return {"url": url, "status": "error", "error": str(e), "summary": f"[X] Error: {str(e)[:100]}"}
+    result.pop("duration_ms", None)
     return result
 
 
@@ -116,58 +316,151 @@ def run_accessibility_check(url: str) -> dict:
     """Run basic accessibility check."""
     if not PLAYWRIGHT_AVAILABLE:
         return {"error": "Playwright not installed"}
-    
-    result = {"url": url, "accessibility": {}}
-    
+
     try:
-        with sync_playwright() as p:
-            browser = p.chromium.launch(headless=True)
-            page = browser.new_page()
-            page.goto(url, wait_until="networkidle", timeout=30000)
-            
-            # Basic a11y checks
-            result["accessibility"] = {
-                "images_with_alt": page.locator("img[alt]").count(),
-                "images_without_alt": page.locator("img:not([alt])").count(),
-                "buttons_with_label": page.locator("button[aria-label], button:has-text('')").count(),
-                "links_with_text": page.locator("a:has-text('')").count(),
-                "form_labels": page.locator("label").count(),
-                "headings": {
-                    "h1": page.locator("h1").count(),
-                    "h2": page.locator("h2").count(),
-                    "h3": page.locator("h3").count()
-                }
-            }
-            
-            browser.close()
-            result["status"] = "success"
-            
+        result = asyncio.run(_check_urls([url], 1, False, True))[0]
     except Exception as e:
-        result["status"] = "error"
-        result["error"] = str(e)
-    
+        return {"url": url, "accessibility": {}, "status": "error", "error": str(e)}
+    result.pop("duration_ms", None)
     return result
 
 
+def run_multi(urls: list, concurrency: int = DEFAULT_CONCURRENCY,
+              take_screenshot: bool = False, a11y: bool = False) -> dict:
+    """Check many URLs with one browser; per-URL results in a single report."""
+    if not PLAYWRIGHT_AVAILABLE:
+        return dict(NOT_INSTALLED)
+
+    report = {
+        "timestamp": datetime.now().isoformat(),
+        "mode": "a11y" if a11y else "basic",
+        "concurrency": concurrency,
+        "browser_launches": 1,
+        "pages": []
+    }
+    started = time.perf_counter()
+    try:
+        report["pages"] = asyncio.run(_check_urls(urls, concurrency, take_screenshot, a11y))
+    except Exception as e:
+        report["error"] = str(e)
+
+    ok = sum(1 for page in report["pages"] if page.get("status") == "success")
+    report["summary"] = {
+        "total": len(urls),
+        "ok": ok,
+        "failed": len(urls) - ok,
+        "wall_ms": round((time.perf_counter() - started) * 1000)
+    }
+    report["status"] = "success" if ok == len(urls) and "error" not in report else "failed"
+    return report
+
+
+class _ExportHandler(SimpleHTTPRequestHandler):
+    """Static export semantics: /about serves about.html when it exists."""
+
+    def send_head(self):
+        path = self.translate_path(self.path)
+        if not os.path.exists(path) and os.path.isfile(path + ".html"):
+            self.path = self.path.split('?', 1)[0].rstrip('/') + ".html"
+        return super().send_head()
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve_directory(directory: str):
+    """Serve a static export on a free localhost port; returns (server, base_url)."""
+    handler = partial(_ExportHandler, directory=os.path.abspath(directory))
+    server = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+def export_routes(directory: str) -> list:
+    """Every page of a static export: index.html -> /, blog/post.html -> /blog/post."""
+    routes = []
+    for root, dirs, files in os.walk(directory):
+        dirs[:] = sorted(d for d in dirs if not d.startswith(('_next', '.')))
+        for file in sorted(files):
+            if not file.endswith(".html") or file in ("404.html", "500.html"):
+                continue
+            rel = os.path.relpath(os.path.join(root, file), directory).replace(os.sep, "/")
+            route = "/" + rel[:-len(".html")]
+            routes.append(route[:-len("index")] if route.endswith("/index") or route == "/index" else route)
+    return routes
+
+
+def _flag_value(argv: list, flag: str, default: str = None) -> str:
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return default
+
+
+def _positional(argv: list) -> list:
+    values = {"--concurrency", "--urls", "--serve"}
+    args, skip = [], False
+    for arg in argv:
+        if skip:
+            skip = False
+        elif arg in values:
+            skip = True
+        elif not arg.startswith("--"):
+            args.append(arg)
+    return args
+
+
 if __name__ == "__main__":
-    if len(sys.argv) < 2:
+    targets = _positional(sys.argv[1:])
+    urls_file = _flag_value(sys.argv, "--urls")
+    serve_dir = _flag_value(sys.argv, "--serve")
+
+    if not targets and not urls_file and not serve_dir:
         print(json.dumps({
-            "error": "Usage: python playwright_runner.py <url> [--screenshot] [--a11y]",
+            "error": "Usage: python playwright_runner.py <url> [<url> ...] [--screenshot] [--a11y] "
+                     "[--urls FILE] [--serve DIR] [--concurrency N]",
             "examples": [
                 "python playwright_runner.py https://example.com",
                 "python playwright_runner.py https://example.com --screenshot",
-                "python playwright_runner.py https://example.com --a11y"
+                "python playwright_runner.py https://example.com --a11y",
+                "python playwright_runner.py --urls urls.txt --concurrency 8",
+                "python playwright_runner.py --serve out/"
             ]
         }, indent=2))
         sys.exit(1)
-    
-    url = sys.argv[1]
+
     take_screenshot = "--screenshot" in sys.argv
     check_a11y = "--a11y" in sys.argv
-    
-    if check_a11y:
-        result = run_accessibility_check(url)
-    else:
-        result = run_basic_test(url, take_screenshot)
-    
-    print(json.dumps(result, indent=2))
+
+    if len(targets) == 1 and not urls_file and not serve_dir:
+        url = targets[0]
+        if check_a11y:
+            result = run_accessibility_check(url)
+        else:
+            result = run_basic_test(url, take_screenshot)
+        print(json.dumps(result, indent=2))
+        sys.exit(0)
+
+    urls = list(targets)
+    if urls_file:
+        with open(urls_file, encoding="utf-8") as f:
+            urls += [line.strip() for line in f if line.strip() and not line.startswith("#")]
+
+    server = None
+    if serve_dir:
+        server, base_url = serve_directory(serve_dir)
+        routes = urls or export_routes(serve_dir)
+        urls = [base_url + route if route.startswith("/") else route for route in routes]
+
+    try:
+        concurrency = int(_flag_value(sys.argv, "--concurrency", str(DEFAULT_CONCURRENCY)))
+        report = run_multi(urls, concurrency, take_screenshot, check_a11y)
+    finally:
+        if server:
+            server.shutdown()
+    if serve_dir:
+        report["served_from"] = os.path.abspath(serve_dir)
+    print(json.dumps(report, indent=2))
+    sys.exit(0 if report.get("status") == "success" else 1)
@@ -7,19 +7,40 @@ Paste the email content when prompted, then script will:
 1. Parse the submission
 2. Add to seed.json
 3. Build and deploy (optional)
+
+Batch mode ingests many submission emails at once:
+  python scripts/add_business.py --batch submissions.mbox
+  python scripts/add_business.py --batch inbox/ --jobs 4 --dry-run   # directory of .eml files
+
+Emails are parsed in parallel. Records failing validate_seed's checks and
+submissions already in the directory (same phone and address, or same name
+and address) are skipped; ids come from the seed store's persisted counter
+and seed.json is rewritten once, atomically.
+Same-name branches get their own slug (pho-hoa-dfw, pho-hoa-dfw-1, ...).
+--dry-run only reads.
 """
 
+import email
+import html
 import json
+import mailbox
+import os
 import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from email import policy
 from pathlib import Path
 
+import vi_text
+from add_slugs import SlugAllocator
+from csv_to_seed import clean_phone, clean_website, normalize_category
+from find_duplicates import normalize_address, normalize_phone
+from seed_store import SEED_PATH, STORE_PATH, SeedStore, export_seed, import_seed
+from validate_seed import CATEGORIES, check_record, iter_records
+
 def slugify(name):
     """Create URL-friendly slug from name"""
-    slug = name.lower().strip()
-    slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-    slug = re.sub(r'[\s_-]+', '-', slug)
-    slug = slug.strip('-')
-    return f"{slug}-dfw"
+    return f"{vi_text.slugify(name)}-dfw"
 
 def get_vietnamese_subcategory(category):
     """Map category to Vietnamese subcategory"""
@@ -35,6 +56,18 @@ def get_vietnamese_subcategory(category):
     }
     return mappings.get(category, category)
 
+def format_phone(phone):
+    """(xxx) xxx-xxxx for any 10-digit US number; anything else is kept as
+    typed so validation reports it"""
+    if not phone:
+        return None
+    digits = normalize_phone(phone)
+    if len(digits) == 11 and digits.startswith("1"):
+        digits = digits[1:]
+    if len(digits) == 10:
+        return clean_phone(f"({digits[:3]}) {digits[3:6]}-{digits[6:]}")
+    return phone
+
 def parse_email(email_text):
     """Parse email submission into business data"""
     data = {}
@@ -62,7 +95,189 @@ def parse_email(email_text):
     
     return data
 
+def build_business(data, biz_id):
+    """Seed record for a parsed submission"""
+    # Map to category structure
+    original_category = {
+        "Restaurant": "Restaurant",
+        "Services": "Professional Services",
+        "Healthcare": "Healthcare",
+        "Retail": "Retail",
+        "Automotive": "Automotive",
+        "Beauty": "Beauty & Personal Care",
+        "Religious": "Religious",
+        "Community": "Community",
+    }.get(data["category"], "Professional Services")
+    # Site category: the form's own value when it already is one, else via CATEGORY_MAP
+    if data["category"] in CATEGORIES:
+        category = data["category"]
+    else:
+        category = normalize_category(data["category"] or original_category)[0]
+    
+    # Create business entry
+    new_business = {
+        "id": biz_id,
+        "name": data["name"],
+        "slug": slugify(data["name"]),
+        "category": category,
+        "originalCategory": original_category,
+        "subcategory": get_vietnamese_subcategory(original_category),
+        "address": data["address"] or "DFW Area, TX",
+        "phone": format_phone(data["phone"]),
+        "website": clean_website(data["website"]),
+        "email": data["email"],
+        "description": data["description"] or f"{data['name']} - Doanh nghiệp Việt Nam tại DFW",
+        "googleMapsLink": None,
+        "linkType": None
+    }
+    
+    return new_business
+
+def message_text(raw):
+    """Plain-text body of a raw email (HTML-only emails are flattened)"""
+    message = email.message_from_bytes(raw, policy=policy.default)
+    part = message.get_body(preferencelist=("plain", "html"))
+    if part is None:
+        return ""
+    text = part.get_content()
+    if part.get_content_type() == "text/html":
+        text = re.sub(r"<br\s*/?>|</(?:p|div|tr|li)>", "\n", text, flags=re.IGNORECASE)
+        text = html.unescape(re.sub(r"<[^>]+>", "", text))
+    return text
+
+def parse_message(raw):
+    """parse_email() on one raw email; runs in the worker processes"""
+    return parse_email(message_text(raw))
+
+def read_submissions(path):
+    """Raw emails from an mbox file or a directory of .eml files, in a stable order"""
+    path = Path(path)
+    if path.is_dir():
+        return [(eml.name, eml.read_bytes()) for eml in sorted(path.glob("*.eml"))]
+    box = mailbox.mbox(str(path), create=False)
+    try:
+        return [(f"message {i + 1}", box.get_bytes(key)) for i, key in enumerate(box.keys())]
+    finally:
+        box.close()
+
+def duplicate_keys(biz):
+    """Keys under which two records count as the same business. The name alone
+    is not one: chains have many branches with the same name."""
+    keys = set()
+    phone = normalize_phone(biz.get("phone") or "")
+    address = normalize_address(biz.get("address") or "")
+    if not address:
+        return keys
+    keys.add(("name+address", vi_text.fold(biz.get("name") or "").strip(), address))
+    if len(phone) >= 10:
+        keys.add(("phone+address", phone, address))
+    return keys
+
+def persisted_next_id():
+    """next_id saved in the seed store index (1 when there is none)"""
+    if not os.path.exists(STORE_PATH + ".idx"):
+        return 1
+    with open(STORE_PATH + ".idx", "r", encoding="utf-8") as f:
+        return json.load(f).get("next_id", 1)
+
+def open_store():
+    """Seed store in sync with seed.json, keeping the persisted id counter"""
+    if os.path.exists(STORE_PATH) and os.path.getmtime(STORE_PATH) >= os.path.getmtime(SEED_PATH):
+        return SeedStore.open(STORE_PATH)
+    # seed.json was edited without the store: re-import, but never hand out an id twice
+    next_id = persisted_next_id()
+    store = import_seed(SEED_PATH, STORE_PATH)
+    if next_id > store.next_id:
+        store.next_id = next_id
+        store.dirty = True
+    return store
+
+def ingest_batch(path, jobs, dry_run=False):
+    submissions = read_submissions(path)
+    print(f"📬 {len(submissions)} submissions in {path}")
+    if not submissions:
+        return
+
+    raws = [raw for _, raw in submissions]
+    if jobs > 1 and len(raws) > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            parsed = list(pool.map(parse_message, raws, chunksize=max(1, len(raws) // (jobs * 4))))
+    else:
+        parsed = [parse_message(raw) for raw in raws]
+
+    # A dry run reads seed.json directly so it writes nothing, not even the store
+    store = None if dry_run else open_store()
+    try:
+        if store is None:
+            existing = list(iter_records(SEED_PATH))
+            next_id = max([persisted_next_id()] + [biz["id"] + 1 for biz in existing])
+        else:
+            existing, next_id = store, store.next_id
+
+        seen = set()
+        slugs = SlugAllocator()
+        count = 0
+        for biz in existing:
+            seen.update(duplicate_keys(biz))
+            if biz.get("slug"):
+                slugs.reserve(biz["slug"])
+            count += 1
+
+        additions, skipped = [], []
+        for (label, _), data in zip(submissions, parsed):
+            if not data["name"]:
+                skipped.append((label, "no business name"))
+                continue
+            new_business = build_business(data, next_id)
+            problems = check_record(new_business)
+            if problems:
+                skipped.append((label, f"invalid ({'; '.join(problems)})"))
+                continue
+            keys = duplicate_keys(new_business)
+            if keys & seen:
+                skipped.append((label, f"same business already in the directory or this batch "
+                                       f"({new_business['name']}, {new_business['address']})"))
+                continue
+            seen.update(keys)
+            new_business["slug"] = slugs.allocate(new_business["slug"])
+            additions.append(new_business)
+            next_id += 1
+
+        for label, reason in skipped:
+            print(f"   ⏭️  {label}: {reason}")
+        for biz in additions:
+            print(f"   ➕ {biz['id']}: {biz['name']} ({biz['slug']})")
+        print(f"\n📊 {len(additions)} to add, {len(skipped)} skipped, {count} existing")
+
+        if dry_run or not additions:
+            return
+
+        # seed.json first (one atomic write): if anything fails after it, the
+        # store is re-imported from seed.json on the next run
+        export_seed((biz for source in (store, additions) for biz in source), SEED_PATH)
+        for biz in additions:
+            store.append(biz)
+        print(f"✅ Added {len(additions)}! Total: {len(store)} businesses")
+    finally:
+        if store is not None:
+            store.close()
+
+def flag_value(argv, flag, default=None):
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + "="):
+            return arg.split("=", 1)[1]
+    return default
+
 def main():
+    argv = sys.argv[1:]
+    batch = flag_value(argv, "--batch")
+    if batch:
+        jobs = int(flag_value(argv, "--jobs", 0))
+        ingest_batch(batch, jobs if jobs > 0 else os.cpu_count() or 1, dry_run="--dry-run" in argv)
+        return
+
     seed_path = Path("src/data/seed.json")
     
     print("\n" + "="*50)
@@ -105,34 +320,7 @@ def main():
         print("❌ Could not find business name. Exiting.")
         return
     
-    # Map to category structure
-    original_category = {
-        "Restaurant": "Restaurant",
-        "Services": "Professional Services",
-        "Healthcare": "Healthcare",
-        "Retail": "Retail",
-        "Automotive": "Automotive",
-        "Beauty": "Beauty & Personal Care",
-        "Religious": "Religious",
-        "Community": "Community",
-    }.get(data["category"], "Professional Services")
-    
-    # Create business entry
-    new_business = {
-        "id": next_id,
-        "name": data["name"],
-        "slug": slugify(data["name"]),
-        "category": "Services" if original_category == "Professional Services" else data["category"] or "Services",
-        "originalCategory": original_category,
-        "subcategory": get_vietnamese_subcategory(original_category),
-        "address": data["address"] or "DFW Area, TX",
-        "phone": data["phone"],
-        "website": data["website"],
-        "email": data["email"],
-        "description": data["description"] or f"{data['name']} - Doanh nghiệp Việt Nam tại DFW",
-        "googleMapsLink": None,
-        "linkType": None
-    }
+    new_business = build_business(data, next_id)
     
     # Show preview
     print("\n" + "="*50)
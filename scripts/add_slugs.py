@@ -1,15 +1,26 @@
 #!/usr/bin/env python3
 """
-Add slug field to all businesses in seed.json
-Slug format: business-name-city (lowercase, hyphenated)
+Add slug field to businesses in seed.json that do not have one yet
+Slug format: business-name-city (lowercase, hyphenated); existing slugs are kept
+
+Usage:
+  python scripts/add_slugs.py              # new slugs unique within seed.json
+  python scripts/add_slugs.py --supabase   # also avoid slugs already in approved_businesses
+  python scripts/add_slugs.py --benchmark  # allocator vs counter loop on 100k records
 """
 
 import json
+import os
+import random
 import re
-import unicodedata
+import sys
+import time
+
+from vi_text import slugify
 
 INPUT_FILE = "/Volumes/homes/phongto/GitHub/dfw-viet-biz/src/data/seed.json"
 OUTPUT_FILE = INPUT_FILE
+SUPABASE_PAGE_SIZE = 1000
 
 def create_slug(name, address):
     """Create URL-friendly slug from business name and city"""
@@ -26,22 +37,140 @@ def create_slug(name, address):
     if not city:
         city = "dfw"
     
-    # Combine name and city
-    text = f"{name} {city}"
-    
-    # Normalize unicode characters (convert Vietnamese accents to base letters)
-    text = unicodedata.normalize('NFKD', text).encode('ASCII', 'ignore').decode('ASCII')
-    
-    # Convert to lowercase and replace non-alphanumeric with hyphens
-    text = text.lower()
-    text = re.sub(r'[^a-z0-9]+', '-', text)
-    
-    # Remove leading/trailing hyphens and collapse multiple hyphens
-    text = re.sub(r'-+', '-', text).strip('-')
-    
-    return text
+    # Combine name and city; Vietnamese accents (and đ) fold to base letters
+    return slugify(f"{name} {city}")
+
+
+class SlugAllocator:
+    """Hands out unique slugs: base, base-1, base-2, ...
+
+    Remembers the next suffix to try for every base slug, so a chain with
+    thousands of locations costs one set lookup per new slug instead of a
+    counter loop that restarts at 1 each time. Slugs taken elsewhere (for
+    example already in Supabase) are reserved up front and skipped.
+    """
+
+    def __init__(self, reserved=()):
+        self.taken = set(reserved)
+        self.next_suffix = {}
+
+    def reserve(self, slug):
+        self.taken.add(slug)
+
+    def allocate(self, base_slug):
+        slug = base_slug
+        if slug in self.taken:
+            counter = self.next_suffix.get(base_slug, 1)
+            slug = f"{base_slug}-{counter}"
+            while slug in self.taken:
+                counter += 1
+                slug = f"{base_slug}-{counter}"
+            self.next_suffix[base_slug] = counter + 1
+        self.taken.add(slug)
+        return slug
+
+
+def reserve_existing(businesses, allocator):
+    """Reserve every slug already on a record: a slug is a public URL and the
+    approved_businesses key, so it never changes once given. A record repeating
+    an earlier record's slug loses it and is returned, to get a new one."""
+    seen = set()
+    repeated = []
+    for biz in businesses:
+        slug = biz.get('slug')
+        if not slug:
+            continue
+        if slug in seen:
+            biz['slug'] = None
+            repeated.append(biz)
+            continue
+        seen.add(slug)
+        allocator.reserve(slug)
+    return repeated
+
+
+def assign_slugs(businesses, allocator):
+    """Streaming stage: yields each business, giving one a slug only if it has
+    none (call reserve_existing first), in one pass."""
+    for biz in businesses:
+        if not biz.get('slug'):
+            biz['slug'] = allocator.allocate(create_slug(biz.get('name', ''), biz.get('address', '')))
+        yield biz
+
+
+def load_env():
+    """Load environment variables from .env.local"""
+    env_path = os.path.join(os.path.dirname(__file__), '..', '.env.local')
+    if os.path.exists(env_path):
+        with open(env_path) as f:
+            for line in f:
+                if '=' in line and not line.startswith('#'):
+                    key, value = line.strip().split('=', 1)
+                    os.environ[key] = value
+
+
+def fetch_supabase_slugs():
+    """Every approved_businesses.slug, paged so large tables are not truncated."""
+    from supabase import create_client
+
+    load_env()
+    supabase_url = os.environ.get('NEXT_PUBLIC_SUPABASE_URL')
+    supabase_key = os.environ.get('SUPABASE_SERVICE_ROLE_KEY') or os.environ.get('NEXT_PUBLIC_SUPABASE_ANON_KEY')
+    if not supabase_url or not supabase_key:
+        raise RuntimeError("Set NEXT_PUBLIC_SUPABASE_URL and SUPABASE_SERVICE_ROLE_KEY in .env.local")
+
+    supabase = create_client(supabase_url, supabase_key)
+    slugs = set()
+    start = 0
+    while True:
+        page = (supabase.table('approved_businesses').select('slug')
+                .order('id').range(start, start + SUPABASE_PAGE_SIZE - 1).execute())
+        slugs.update(row['slug'] for row in page.data or [] if row.get('slug'))
+        if len(page.data or []) < SUPABASE_PAGE_SIZE:
+            return slugs
+        start += SUPABASE_PAGE_SIZE
+
+
+def benchmark(size=100_000):
+    """Time the allocator against the old restart-from-1 counter loop."""
+    rng = random.Random(42)
+    # Chains and common names: few distinct bases, many records each
+    names = [f"{dish} {place}" for dish in ("Phở", "Bánh Mì", "Cơm Tấm", "Nail Spa", "Boba Tea")
+             for place in ("Sài Gòn", "Hà Nội", "Huế", "Golden", "Star")]
+    cities = ["Garland", "Arlington", "Dallas", "Plano", "Grand Prairie", "Haltom City"]
+    businesses = [{'name': rng.choice(names), 'address': f"{i} Main St, {rng.choice(cities)}, TX 75040"}
+                  for i in range(size)]
+    bases = [create_slug(biz['name'], biz['address']) for biz in businesses]
+
+    started = time.perf_counter()
+    used_slugs = {}
+    loop_slugs = []
+    for base_slug in bases:
+        slug = base_slug
+        counter = 1
+        while slug in used_slugs:
+            slug = f"{base_slug}-{counter}"
+            counter += 1
+        used_slugs[slug] = True
+        loop_slugs.append(slug)
+    loop_time = time.perf_counter() - started
+
+    started = time.perf_counter()
+    allocator = SlugAllocator()
+    allocated = [allocator.allocate(base_slug) for base_slug in bases]
+    allocator_time = time.perf_counter() - started
+
+    assert allocated == loop_slugs, "allocator disagrees with the counter loop"
+    print(f"⏱️  {size:,} records, {len(set(bases))} distinct base slugs")
+    print(f"   counter loop: {loop_time:.2f}s")
+    print(f"   allocator:    {allocator_time:.3f}s ({loop_time / allocator_time:.0f}x)")
+
 
 def main():
+    if '--benchmark' in sys.argv:
+        benchmark()
+        return
+
     # Read seed.json
     with open(INPUT_FILE, 'r', encoding='utf-8') as f:
         businesses = json.load(f)
@@ -49,26 +178,29 @@ def main():
     print(f"📂 Processing {len(businesses)} businesses...")
     
     # Track slugs to ensure uniqueness
-    used_slugs = {}
+    allocator = SlugAllocator()
+    if '--supabase' in sys.argv:
+        try:
+            reserved = fetch_supabase_slugs()
+        except Exception as e:
+            print(f"❌ Could not read slugs from Supabase: {e}")
+            sys.exit(1)
+        for slug in reserved:
+            allocator.reserve(slug)
+        print(f"📊 Reserved {len(reserved)} slugs already in approved_businesses")
     
-    for biz in businesses:
-        base_slug = create_slug(biz.get('name', ''), biz.get('address', ''))
-        
-        # Ensure uniqueness
-        slug = base_slug
-        counter = 1
-        while slug in used_slugs:
-            slug = f"{base_slug}-{counter}"
-            counter += 1
-        
-        used_slugs[slug] = True
-        biz['slug'] = slug
+    # Existing slugs are kept; only records without one get a new slug
+    missing = sum(1 for biz in businesses if not biz.get('slug'))
+    for biz in reserve_existing(businesses, allocator):
+        print(f"⚠️  {biz['name']} (id {biz.get('id')}) repeats an earlier record's slug; giving it a new one")
+        missing += 1
+    businesses = list(assign_slugs(businesses, allocator))
     
     # Write updated seed.json
     with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
         json.dump(businesses, f, ensure_ascii=False, indent=2)
     
-    print(f"✅ Added slugs to {len(businesses)} businesses")
+    print(f"✅ Added slugs to {missing} of {len(businesses)} businesses")
     
     # Show samples
     print("\n📋 Sample slugs:")
@@ -0,0 +1,240 @@
+#!/usr/bin/env python3
+"""
+Build a compact, precomputed search index next to src/data/seed.json so the
+client can search and facet instantly instead of scanning every record per
+keystroke.
+
+Usage:
+  python scripts/build_search_index.py                      # seed.json -> search-index.json
+  python scripts/build_search_index.py <seed.json> <out.json>
+  python scripts/build_search_index.py --benchmark          # size/latency at 10k and 100k
+
+Index format (version 1, records are addressed by position "doc" 0..count-1):
+  ids        seed id of each doc
+  tokens     sorted, diacritic-folded tokens ("pho", "banh", "dinh" for "Đình")
+  postings   per token, the docs containing it, delta-encoded ([3, 1, 4] = docs 3, 4, 8)
+  prefixes   every 1..3 letter prefix -> [first, end) slice of `tokens`; longer
+             prefixes narrow that slice with a binary search
+  facets     category / originalCategory / subcategory value -> base64 bitmap,
+             bit `doc` set when the doc has that value (LSB first)
+
+A query is folded and split like the records; every word is a prefix match and
+the words are ANDed, then intersected with the selected facet bitmaps.
+"""
+
+import base64
+import bisect
+import gzip
+import json
+import os
+import random
+import sys
+import time
+
+from vi_text import fold, tokenize
+
+SEED_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'seed.json')
+INDEX_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'search-index.json')
+
+SEARCH_FIELDS = ('name', 'subcategory', 'originalCategory', 'address')
+FACET_FIELDS = ('category', 'originalCategory', 'subcategory')
+PREFIX_LENGTH = 3
+BENCHMARK_SIZES = (10_000, 100_000)
+BENCHMARK_QUERIES = 1000
+
+def encode_bitmap(docs, count):
+    bits = bytearray((count + 7) // 8)
+    for doc in docs:
+        bits[doc >> 3] |= 1 << (doc & 7)
+    return base64.b64encode(bytes(bits)).decode('ascii')
+
+
+def decode_bitmap(value):
+    bits = base64.b64decode(value)
+    return {i * 8 + bit for i, byte in enumerate(bits) if byte for bit in range(8) if byte >> bit & 1}
+
+
+def build_index(businesses):
+    """The version-1 index dict for a list of seed records."""
+    postings = {}
+    facets = {field: {} for field in FACET_FIELDS}
+    for doc, biz in enumerate(businesses):
+        for field in SEARCH_FIELDS:
+            for token in tokenize(biz.get(field)):
+                docs = postings.setdefault(token, [])
+                if not docs or docs[-1] != doc:
+                    docs.append(doc)
+        for field in FACET_FIELDS:
+            value = biz.get(field)
+            if value:
+                facets[field].setdefault(value, []).append(doc)
+
+    tokens = sorted(postings)
+    prefixes = {}
+    for position, token in enumerate(tokens):
+        for length in range(1, min(PREFIX_LENGTH, len(token)) + 1):
+            span = prefixes.setdefault(token[:length], [position, position + 1])
+            span[1] = position + 1
+
+    count = len(businesses)
+    return {
+        'version': 1,
+        'count': count,
+        'fields': list(SEARCH_FIELDS),
+        'ids': [biz.get('id') for biz in businesses],
+        'tokens': tokens,
+        'postings': [[doc - prev for prev, doc in zip([0] + docs, docs)] for docs in
+                     (postings[token] for token in tokens)],
+        'prefixes': prefixes,
+        'facets': {field: {value: encode_bitmap(docs, count) for value, docs in sorted(values.items())}
+                   for field, values in facets.items()},
+    }
+
+
+class SearchIndex:
+    """Reference reader: the lookups a client does against the built index."""
+
+    def __init__(self, index):
+        self.index = index
+        self.tokens = index['tokens']
+        self.prefixes = index['prefixes']
+        self._postings = index['postings']
+        self._decoded = {}
+        self._facets = {}
+
+    def docs_for(self, position):
+        docs = self._decoded.get(position)
+        if docs is None:
+            docs, doc = [], 0
+            for delta in self._postings[position]:
+                doc += delta
+                docs.append(doc)
+            docs = self._decoded[position] = docs
+        return docs
+
+    def token_range(self, prefix):
+        """[first, end) of tokens starting with prefix."""
+        lo, hi = self.prefixes.get(prefix[:PREFIX_LENGTH], (0, 0))
+        if len(prefix) > PREFIX_LENGTH and lo < hi:
+            lo = bisect.bisect_left(self.tokens, prefix, lo, hi)
+            hi = bisect.bisect_left(self.tokens, prefix + '\uffff', lo, hi)
+        return lo, hi
+
+    def facet(self, field, value):
+        key = (field, value)
+        if key not in self._facets:
+            self._facets[key] = decode_bitmap(self.index['facets'][field].get(value, ''))
+        return self._facets[key]
+
+    def search(self, query, **facet_values):
+        """Docs matching every word of query (as a prefix) and every given facet value."""
+        result = None
+        for word in tokenize(query):
+            lo, hi = self.token_range(word)
+            matches = set()
+            for position in range(lo, hi):
+                matches.update(self.docs_for(position))
+            result = matches if result is None else result & matches
+            if not result:
+                return []
+        for field, value in facet_values.items():
+            docs = self.facet(field, value)
+            result = docs if result is None else result & docs
+        return sorted(result) if result is not None else list(range(self.index['count']))
+
+
+def write_index(index, path):
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(index, f, ensure_ascii=False, separators=(',', ':'))
+    os.replace(tmp_path, path)
+
+
+def load_businesses(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def synthesize(businesses, size, rng):
+    """size records cycling through the seed with varied names and ids."""
+    records = []
+    for i in range(size):
+        biz = dict(businesses[i % len(businesses)])
+        if i >= len(businesses):
+            biz['name'] = f"{biz.get('name', '')} {rng.choice(['Garland', 'Arlington', 'Plano', 'Dallas'])} {i}"
+        biz['id'] = i + 1
+        records.append(biz)
+    return records
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+def benchmark(businesses):
+    """Build time, size (raw/gzip) and query latency vs a linear scan, per size."""
+    rng = random.Random(42)
+    words = sorted({w for biz in businesses for w in tokenize(biz.get('name'))})
+    queries = []
+    for _ in range(BENCHMARK_QUERIES):
+        word = rng.choice(words)
+        queries.append(word[:rng.randint(1, len(word))] if rng.random() < 0.6 else
+                       f"{word} {rng.choice(words)[:2]}")
+
+    print(f"{'records':>8} {'build':>8} {'size':>10} {'gzip':>10} {'p50':>9} {'p95':>9} {'scan p95':>9}")
+    for size in BENCHMARK_SIZES:
+        records = synthesize(businesses, size, rng)
+        started = time.perf_counter()
+        index = build_index(records)
+        build = time.perf_counter() - started
+        raw = json.dumps(index, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+
+        reader = SearchIndex(json.loads(raw))
+        latencies = []
+        for query in queries:
+            started = time.perf_counter()
+            reader.search(query)
+            latencies.append((time.perf_counter() - started) * 1000)
+
+        # What the page does today: fold and scan every record per keystroke
+        scan = []
+        for query in queries[:50]:
+            started = time.perf_counter()
+            needle = fold(query)
+            [r for r in records if needle in fold(r.get('name') or '')]
+            scan.append((time.perf_counter() - started) * 1000)
+
+        print(f"{size:>8,} {build:>7.2f}s {len(raw) / 1024:>8.0f}KB {len(gzip.compress(raw)) / 1024:>8.0f}KB "
+              f"{percentile(latencies, 50):>7.3f}ms {percentile(latencies, 95):>7.3f}ms "
+              f"{percentile(scan, 95):>7.2f}ms")
+
+
+def main():
+    args = [a for a in sys.argv[1:] if not a.startswith('--')]
+    seed_path = args[0] if args else SEED_PATH
+    index_path = args[1] if len(args) > 1 else INDEX_PATH
+
+    businesses = load_businesses(seed_path)
+
+    if '--benchmark' in sys.argv:
+        if not businesses and os.path.exists(seed_path + '.backup'):
+            print(f"ℹ️  {os.path.basename(seed_path)} is empty; benchmarking with its .backup")
+            businesses = load_businesses(seed_path + '.backup')
+        if not businesses:
+            print("❌ No records to benchmark with")
+            sys.exit(1)
+        benchmark(businesses)
+        return
+
+    started = time.perf_counter()
+    index = build_index(businesses)
+    write_index(index, index_path)
+    size = os.path.getsize(index_path)
+    print(f"✅ Indexed {index['count']} businesses, {len(index['tokens'])} tokens "
+          f"in {time.perf_counter() - started:.2f}s")
+    print(f"📦 {index_path} ({size / 1024:.1f} KB)")
+
+
+if __name__ == '__main__':
+    main()
@@ -3,12 +3,19 @@
 Script to:
 1. Categorize restaurants by food type based on name analysis
 2. Add Vietnamese translations for all subcategories
+
+Usage: python scripts/categorize_and_translate.py [--benchmark]
 """
 
 import json
+import random
 import re
+import sys
+import time
 from pathlib import Path
 
+from vi_text import fold
+
 # Vietnamese translations for all subcategories
 SUBCATEGORY_TRANSLATIONS = {
     # Restaurant food types
@@ -102,45 +109,92 @@ SUBCATEGORY_TRANSLATIONS = {
     "Asian Fusion": "Fusion",
 }
 
-# Food type detection patterns
+# Food type detection patterns, matched against the folded name ("Phở" -> "pho")
 FOOD_PATTERNS = [
     (r'\bpho\b', "Phở"),
-    (r'\bphở\b', "Phở"),
     (r'\bbanh mi\b', "Bánh Mì"),
-    (r'\bbánh mì\b', "Bánh Mì"),
     (r'\bbun bo\b', "Bún Bò"),
-    (r'\bbún bò\b', "Bún Bò"),
     (r'\bhu tieu\b', "Hủ Tiếu"),
-    (r'\bhủ tiếu\b', "Hủ Tiếu"),
     (r'\bcom\b', "Cơm"),
-    (r'\bcơm\b', "Cơm"),
     (r'\bche\b', "Chè & Trà Sữa"),
-    (r'\bchè\b', "Chè & Trà Sữa"),
     (r'\bboba\b', "Chè & Trà Sữa"),
     (r'\btea\b', "Chè & Trà Sữa"),
     (r'\bcoffee\b', "Cà Phê"),
-    (r'\bcà phê\b', "Cà Phê"),
+    (r'\bca phe\b', "Cà Phê"),
     (r'\bcafe\b', "Cà Phê"),
     (r'\bbakery\b', "Bánh Ngọt"),
     (r'\bseafood\b', "Hải Sản"),
-    (r'\bhải sản\b', "Hải Sản"),
+    (r'\bhai san\b', "Hải Sản"),
     (r'\bhotpot\b', "Lẩu & Nướng"),
     (r'\blau\b', "Lẩu & Nướng"),
-    (r'\blẩu\b', "Lẩu & Nướng"),
     (r'\bbbq\b', "Lẩu & Nướng"),
-    (r'\bnướng\b', "Lẩu & Nướng"),
+    (r'\bnuong\b', "Lẩu & Nướng"),
 ]
 
 
+DEFAULT_FOOD_TYPE = "Ẩm Thực Việt"
+
+FOOD_TYPES = list(dict.fromkeys(food_type for _, food_type in FOOD_PATTERNS))
+
+
+def _combine(patterns):
+    """One alternation with group f<i> for FOOD_PATTERNS[i]; a \\b shared by every
+    pattern is hoisted out so most positions are rejected by a single check."""
+    bodies = [pattern for pattern, _ in patterns]
+    if all(body.startswith(r'\b') and body.endswith(r'\b') for body in bodies):
+        return r'\b(?:' + '|'.join(f'(?P<f{i}>{body[2:-2]})' for i, body in enumerate(bodies)) + r')\b'
+    return '|'.join(f'(?P<f{i}>{body})' for i, body in enumerate(bodies))
+
+
+FOOD_RE = re.compile(_combine(FOOD_PATTERNS))
+# match.lastindex (group number) -> (pattern priority, FOOD_TYPES index)
+FOOD_GROUPS = [None] + [(i, FOOD_TYPES.index(food_type)) for i, (_, food_type) in enumerate(FOOD_PATTERNS)]
+
+# The name decides on its own; subcategory and description settle names with no match
+FIELD_WEIGHTS = (("name", 4), ("subcategory", 2), ("description", 1))
+
+
+def classify_food_types(items):
+    """Food type per item from one regex pass per field over the whole batch.
+
+    Each field's folded texts are joined into one newline-separated buffer and
+    scanned with FOOD_RE.finditer; a match's line number is its item. Each
+    food type scores the field weight once per field; the highest score wins
+    and ties go to the higher-priority pattern, so a name alone classifies
+    exactly as the first matching FOOD_PATTERNS entry.
+    """
+    # (item, food type) -> [score, best priority]
+    scores = {}
+    for field, weight in FIELD_WEIGHTS:
+        buffer = "\n".join([fold(item.get(field)).replace("\n", " ") for item in items])
+        index, position, credited = 0, 0, set()
+        for match in FOOD_RE.finditer(buffer):
+            start = match.start()
+            index += buffer.count("\n", position, start)
+            position = start
+            priority, food_type = FOOD_GROUPS[match.lastindex]
+            key = (index, food_type)
+            if key in credited:
+                continue
+            credited.add(key)
+            entry = scores.get(key)
+            if entry is None:
+                scores[key] = [weight, priority]
+            else:
+                entry[0] += weight
+                entry[1] = min(entry[1], priority)
+
+    best = {}
+    for (index, food_type), (score, priority) in scores.items():
+        rank = (-score, priority)
+        if index not in best or rank < best[index][0]:
+            best[index] = (rank, food_type)
+    return [FOOD_TYPES[best[i][1]] if i in best else DEFAULT_FOOD_TYPE for i in range(len(items))]
+
+
 def categorize_restaurant_by_name(name):
     """Detect food type from business name"""
-    name_lower = name.lower()
-    
-    for pattern, food_type in FOOD_PATTERNS:
-        if re.search(pattern, name_lower):
-            return food_type
-    
-    return "Ẩm Thực Việt"  # Default
+    return classify_food_types([{"name": name}])[0]
 
 
 def translate_subcategory(sub):
@@ -148,7 +202,53 @@ def translate_subcategory(sub):
     return SUBCATEGORY_TRANSLATIONS.get(sub, sub)
 
 
+def benchmark(size=100_000):
+    """Time the one-pass classifier against the previous per-pattern re.search loop."""
+    rng = random.Random(42)
+    food_words = ["Phở", "Pho", "Bánh Mì", "Bún Bò", "Hủ Tiếu", "Cơm Tấm", "Chè", "Boba", "Cà Phê",
+                  "Seafood", "Lẩu", "BBQ", "Nướng"]
+    other_words = ["Kitchen", "Saigon", "Garland", "Grill", "House", "Golden", "Dragon", "Little",
+                   "Sài Gòn", "Hà Nội", "Huế", "Express", "Bistro", "Corner", "Family", "Star"]
+    items = []
+    for i in range(size):
+        # About half the names carry a dish word, like the real directory
+        words = rng.sample(other_words, 2)
+        if rng.random() < 0.5:
+            words.insert(rng.randrange(3), rng.choice(food_words))
+        items.append({"name": " ".join(words) + f" #{i}",
+                      "description": rng.choice(["Vietnamese noodle soup", "Coffee and bakery", "Family owned"])})
+    fold.cache_clear()
+
+    started = time.perf_counter()
+    loop_results = []
+    for item in items:
+        name = fold(item["name"])
+        loop_results.append(next((t for pattern, t in FOOD_PATTERNS if re.search(pattern, name)),
+                                 DEFAULT_FOOD_TYPE))
+    loop_time = time.perf_counter() - started
+    fold.cache_clear()
+
+    names = [{"name": item["name"]} for item in items]
+    started = time.perf_counter()
+    names_only = classify_food_types(names)
+    batch_time = time.perf_counter() - started
+    fold.cache_clear()
+    started = time.perf_counter()
+    classify_food_types(items)
+    scored_time = time.perf_counter() - started
+
+    assert names_only == loop_results, "one-pass classifier disagrees with the pattern loop"
+    print(f"⏱️  {size:,} names")
+    print(f"   per-pattern loop:         {loop_time:.2f}s")
+    print(f"   one pass (names):         {batch_time:.2f}s ({loop_time / batch_time:.1f}x)")
+    print(f"   one pass (+description):  {scored_time:.2f}s")
+
+
 def main():
+    if "--benchmark" in sys.argv:
+        benchmark()
+        return
+
     seed_path = Path("src/data/seed.json")
     
     print("📂 Loading seed.json...")
@@ -162,12 +262,11 @@ def main():
     restaurant_count = 0
     food_type_counts = {}
     
-    for item in data:
-        if item.get("originalCategory") == "Restaurant":
-            food_type = categorize_restaurant_by_name(item["name"])
-            item["subcategory"] = food_type
-            restaurant_count += 1
-            food_type_counts[food_type] = food_type_counts.get(food_type, 0) + 1
+    restaurants = [item for item in data if item.get("originalCategory") == "Restaurant"]
+    for item, food_type in zip(restaurants, classify_food_types(restaurants)):
+        item["subcategory"] = food_type
+        restaurant_count += 1
+        food_type_counts[food_type] = food_type_counts.get(food_type, 0) + 1
     
     print(f"   Categorized {restaurant_count} restaurants:")
     for ft, count in sorted(food_type_counts.items(), key=lambda x: -x[1]):
@@ -9,6 +9,8 @@ Data cleanup script for DFW Vietnamese Business Directory
 import json
 from pathlib import Path
 
+from vi_text import slugify
+
 # Encoding fixes (mojibake to proper Vietnamese)
 ENCODING_FIXES = {
     "Má»¹ Lan Restaurant": "Mỹ Lan Restaurant",
@@ -33,18 +35,7 @@ def fix_encoding(data):
 
 def generate_slug(name):
     """Generate URL-friendly slug from name"""
-    import re
-    import unicodedata
-    
-    # Normalize and remove accents
-    normalized = unicodedata.normalize('NFD', name)
-    ascii_name = ''.join(c for c in normalized if unicodedata.category(c) != 'Mn')
-    
-    # Convert to lowercase and replace non-alphanumeric with hyphens
-    slug = re.sub(r'[^a-zA-Z0-9]+', '-', ascii_name.lower())
-    slug = slug.strip('-')
-    
-    return f"{slug}-dfw"
+    return f"{slugify(name)}-dfw"
 
 def remove_duplicates(data):
     """Remove duplicate businesses at same address, keep highest review count"""
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Query-plan regression check for the Supabase schema, run against a local
+throwaway Postgres (no Supabase project needed).
+
+Applies supabase/*.sql, loads a synthetic dataset scaled from seed.json,
+runs EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) on the query shapes the app
+issues and compares the plans with the stored baseline. Fails when a query
+that used an index now does a sequential scan.
+
+Usage:
+  python scripts/query_plan_check.py                    # throwaway cluster via initdb
+  python scripts/query_plan_check.py --dsn "host=localhost user=postgres"
+  python scripts/query_plan_check.py --rows 1000000 --update   # record a new baseline
+
+Options:
+  --dsn DSN        existing server; a temporary database is created and dropped
+  --rows N         approved_businesses / business_submissions rows (default 1000000)
+  --baseline PATH  stored plans (default supabase/query_plans.json)
+  --update         write the current plans as the new baseline
+
+Requires the Postgres client and server binaries (psql, initdb, pg_ctl) on PATH.
+"""
+
+import json
+import os
+import shutil
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from urllib.parse import urlsplit, urlunsplit
+
+ROOT = os.path.join(os.path.dirname(__file__), '..')
+SUPABASE_DIR = os.path.join(ROOT, 'supabase')
+SEED_PATH = os.path.join(ROOT, 'src', 'data', 'seed.json')
+DEFAULT_BASELINE = os.path.join(SUPABASE_DIR, 'query_plans.json')
+DEFAULT_ROWS = 1_000_000
+
+# Migrations in the order they were run in the SQL editor; others follow by name
+MIGRATION_ORDER = [
+    'schema.sql',
+    'approved_businesses.sql',
+    'add_delete_policy.sql',
+    'migrate_schema.sql',
+    'add_location_images.sql',
+    'admin_action_logs.sql',
+    'search_businesses.sql',
+]
+
+# Supabase objects the migrations reference that a bare Postgres lacks
+SUPABASE_SHIM = """
+CREATE SCHEMA IF NOT EXISTS storage;
+CREATE TABLE IF NOT EXISTS storage.buckets (id TEXT PRIMARY KEY, name TEXT, public BOOLEAN);
+CREATE TABLE IF NOT EXISTS storage.objects (
+    id UUID DEFAULT gen_random_uuid() PRIMARY KEY, bucket_id TEXT, name TEXT
+);
+DO $$
+BEGIN
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'anon') THEN
+        CREATE ROLE anon NOLOGIN;
+    END IF;
+    IF NOT EXISTS (SELECT 1 FROM pg_roles WHERE rolname = 'authenticated') THEN
+        CREATE ROLE authenticated NOLOGIN;
+    END IF;
+END $$;
+"""
+
+# Query shapes issued by src/app (pages and API routes). {param} values are
+# picked from the loaded data by the matching `params` query.
+QUERIES = [
+    {
+        'name': 'submissions_pending_by_created',
+        'source': 'src/app/admin/page.tsx',
+        'sql': "SELECT * FROM business_submissions WHERE status = 'pending' ORDER BY created_at DESC",
+    },
+    {
+        'name': 'submission_by_id',
+        'source': 'src/app/api/admin/approve/route.ts',
+        'params': "SELECT id AS id FROM business_submissions ORDER BY created_at LIMIT 1 OFFSET {middle}",
+        'sql': "SELECT * FROM business_submissions WHERE id = '{id}'",
+    },
+    {
+        'name': 'approved_by_slug',
+        'source': 'src/app/business/[slug]/page.tsx',
+        'params': "SELECT slug AS slug FROM approved_businesses ORDER BY id LIMIT 1 OFFSET {middle}",
+        'sql': "SELECT * FROM approved_businesses WHERE slug = '{slug}'",
+    },
+    {
+        'name': 'approved_by_id',
+        'source': 'src/app/api/admin/edit/route.ts',
+        'params': "SELECT id AS id FROM approved_businesses ORDER BY id LIMIT 1 OFFSET {middle}",
+        'sql': "SELECT address, city, state FROM approved_businesses WHERE id = {id}",
+    },
+    {
+        'name': 'approved_by_category',
+        'source': 'src/app/page.tsx',
+        'params': "SELECT category AS category FROM approved_businesses "
+                  "GROUP BY category ORDER BY count(*) LIMIT 1",
+        'sql': "SELECT * FROM approved_businesses WHERE category = '{category}' ORDER BY name LIMIT 50",
+    },
+    {
+        'name': 'approved_recent',
+        'source': 'src/app/admin/page.tsx',
+        'sql': "SELECT * FROM approved_businesses ORDER BY created_at DESC LIMIT 50",
+    },
+    {
+        'name': 'action_logs_recent',
+        'source': 'src/app/admin/page.tsx',
+        'sql': "SELECT * FROM admin_action_logs ORDER BY action_timestamp DESC LIMIT 50",
+    },
+]
+
+FALLBACK_SEED = [
+    {'name': 'Phở Hòa', 'category': 'Food', 'originalCategory': 'Restaurant',
+     'subcategory': 'Pho', 'address': '123 Main St, Garland, TX 75041'},
+    {'name': 'Tiệm Bánh Mì Sài Gòn', 'category': 'Food', 'originalCategory': 'Bakery',
+     'subcategory': 'Banh Mi', 'address': '456 Walnut St, Garland, TX 75042'},
+    {'name': 'Nha Khoa Gia Đình', 'category': 'Services', 'originalCategory': 'Dental',
+     'subcategory': 'Dentist', 'address': '789 Jupiter Rd, Richardson, TX 75081'},
+    {'name': 'Siêu Thị Hồng Kông', 'category': 'Shopping', 'originalCategory': 'Supermarket',
+     'subcategory': 'Grocery', 'address': '4500 Jupiter Rd, Garland, TX 75044'},
+    {'name': 'Chùa Pháp Quang', 'category': 'Community', 'originalCategory': 'Temple',
+     'subcategory': 'Buddhist Temple', 'address': '1 Temple Ln, Grand Prairie, TX 75050'},
+]
+
+SCAN_NODES = {'Seq Scan', 'Index Scan', 'Index Only Scan', 'Bitmap Heap Scan'}
+INDEX_NODES = {'Index Scan', 'Index Only Scan', 'Bitmap Heap Scan'}
+SLOWDOWN_WARN = 2.0
+
+
+# ---------------------------------------------------------------------------
+# Postgres plumbing (psql subprocesses, no Python driver needed)
+# ---------------------------------------------------------------------------
+
+def psql(dsn, sql, *, tuples=False):
+    """Run SQL through psql on stdin, stop on the first error; returns stdout."""
+    cmd = ['psql', '-X', '-q', '-v', 'ON_ERROR_STOP=1', '-d', dsn]
+    if tuples:
+        cmd += ['-A', '-t']
+    result = subprocess.run(cmd, input=sql, capture_output=True, text=True)
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr.strip() or f"psql exited with {result.returncode}")
+    return result.stdout
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(('127.0.0.1', 0))
+        return s.getsockname()[1]
+
+
+def start_cluster():
+    """initdb + pg_ctl in a temp dir; returns (dsn, cleanup)."""
+    data_dir = tempfile.mkdtemp(prefix='plan-check-')
+    port = free_port()
+    try:
+        subprocess.run(['initdb', '-D', data_dir, '-A', 'trust', '-U', 'postgres', '--no-sync'],
+                       check=True, capture_output=True)
+        subprocess.run(['pg_ctl', '-D', data_dir, '-w', '-l', os.path.join(data_dir, 'server.log'),
+                        '-o', f"-k {data_dir} -p {port} -c listen_addresses='' -c fsync=off", 'start'],
+                       check=True, capture_output=True)
+    except (OSError, subprocess.CalledProcessError):
+        shutil.rmtree(data_dir, ignore_errors=True)
+        raise
+
+    def cleanup():
+        subprocess.run(['pg_ctl', '-D', data_dir, '-m', 'immediate', 'stop'], capture_output=True)
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+    return f"host={data_dir} port={port} user=postgres dbname=postgres", cleanup
+
+
+def with_database(dsn, dbname):
+    """The same connection string pointing at another database."""
+    if dsn.startswith(('postgres://', 'postgresql://')):
+        parts = urlsplit(dsn)
+        return urlunsplit(parts._replace(path='/' + dbname))
+    return f"{dsn} dbname={dbname}"
+
+
+def temp_database(dsn):
+    """Create a scratch database on an existing server; returns (dsn, cleanup)."""
+    dbname = f"plan_check_{os.getpid()}"
+    psql(dsn, f"CREATE DATABASE {dbname};")
+
+    def cleanup():
+        try:
+            psql(dsn, f"DROP DATABASE IF EXISTS {dbname};")
+        except RuntimeError as e:
+            print(f"⚠️  Could not drop {dbname}: {e}")
+
+    return with_database(dsn, dbname), cleanup
+
+
+# ---------------------------------------------------------------------------
+# Schema and data
+# ---------------------------------------------------------------------------
+
+def migration_files():
+    names = sorted(f for f in os.listdir(SUPABASE_DIR) if f.endswith('.sql'))
+    ordered = [n for n in MIGRATION_ORDER if n in names]
+    return ordered + [n for n in names if n not in ordered]
+
+
+def apply_migrations(dsn):
+    psql(dsn, SUPABASE_SHIM)
+    for name in migration_files():
+        with open(os.path.join(SUPABASE_DIR, name), encoding='utf-8') as f:
+            try:
+                psql(dsn, f.read())
+            except RuntimeError as e:
+                raise RuntimeError(f"{name}: {e}") from None
+        print(f"  ✓ {name}")
+
+
+def sql_array(values):
+    quoted = ["'" + str(v).replace("'", "''") + "'" for v in values]
+    return f"ARRAY[{', '.join(quoted)}]::text[]"
+
+
+def load_seed_values():
+    try:
+        with open(SEED_PATH, encoding='utf-8') as f:
+            businesses = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        businesses = []
+    return businesses or FALLBACK_SEED
+
+
+def load_synthetic_data(dsn, rows):
+    """Scale seed.json up to `rows` businesses and submissions with generate_series."""
+    seed = load_seed_values()
+
+    def column(key, default):
+        return sql_array([b.get(key) or default for b in seed])
+
+    # Mostly reviewed submissions with a small pending queue, as in production
+    load_sql = f"""
+SELECT setseed(0.42);
+INSERT INTO approved_businesses (name, slug, category, original_category, subcategory,
+                                 address, city, state, phone, description, source, created_at)
+SELECT n.v[1 + g % cardinality(n.v)] || ' ' || g,
+       'biz-' || g,
+       c.v[1 + g % cardinality(c.v)],
+       o.v[1 + g % cardinality(o.v)],
+       s.v[1 + g % cardinality(s.v)],
+       a.v[1 + g % cardinality(a.v)],
+       'Garland', 'TX',
+       '(972) ' || lpad((g % 1000)::text, 3, '0') || '-' || lpad((g % 10000)::text, 4, '0'),
+       'Vietnamese business serving the DFW community.',
+       'seed',
+       now() - (random() * interval '1095 days')
+FROM generate_series(1, {rows}) AS g,
+     (SELECT {column('name', 'Business')} AS v) n,
+     (SELECT {column('category', 'Services')} AS v) c,
+     (SELECT {column('originalCategory', 'Services')} AS v) o,
+     (SELECT {column('subcategory', 'General')} AS v) s,
+     (SELECT {column('address', 'Dallas-Fort Worth Area')} AS v) a;
+
+INSERT INTO business_submissions (name, category, subcategory, address, city, state,
+                                  status, created_at, updated_at)
+SELECT n.v[1 + g % cardinality(n.v)] || ' ' || g,
+       c.v[1 + g % cardinality(c.v)],
+       s.v[1 + g % cardinality(s.v)],
+       a.v[1 + g % cardinality(a.v)],
+       'Garland', 'TX',
+       CASE WHEN r < 0.02 THEN 'pending' WHEN r < 0.85 THEN 'approved' ELSE 'rejected' END,
+       t, t
+FROM (SELECT g, random() AS r, now() - (random() * interval '1095 days') AS t
+      FROM generate_series(1, {rows}) AS g) AS rows_,
+     (SELECT {column('name', 'Business')} AS v) n,
+     (SELECT {column('category', 'Services')} AS v) c,
+     (SELECT {column('subcategory', 'General')} AS v) s,
+     (SELECT {column('address', 'Dallas-Fort Worth Area')} AS v) a;
+
+INSERT INTO admin_action_logs (action_type, business_name, business_category, submission_id,
+                               action_timestamp)
+SELECT CASE WHEN g % 6 = 0 THEN 'rejected' ELSE 'approved' END,
+       'Business ' || g, 'Food', g::text,
+       now() - (random() * interval '1095 days')
+FROM generate_series(1, GREATEST({rows} / 10, 1)) AS g;
+
+VACUUM ANALYZE;
+"""
+    psql(dsn, load_sql)
+
+
+# ---------------------------------------------------------------------------
+# Plans
+# ---------------------------------------------------------------------------
+
+def walk_plan(node, scans):
+    """Collect (relation, node type, index) for every scan node of a plan tree."""
+    node_type = node.get('Node Type')
+    if node_type in SCAN_NODES and node.get('Relation Name'):
+        index = node.get('Index Name')
+        if node_type == 'Bitmap Heap Scan':
+            index = ','.join(sorted({c.get('Index Name') for c in node.get('Plans', []) if c.get('Index Name')}))
+        scans.append({'relation': node['Relation Name'], 'node': node_type, 'index': index})
+    for child in node.get('Plans', []):
+        walk_plan(child, scans)
+    return scans
+
+
+def explain(dsn, query, rows):
+    sql = query['sql']
+    if query.get('params'):
+        row = psql(dsn, "SELECT row_to_json(p) FROM (" + query['params'].format(middle=rows // 2) + ") p;",
+                   tuples=True).strip()
+        if not row:
+            raise RuntimeError(f"{query['name']}: no sample row for parameters")
+        sql = sql.format(**json.loads(row))
+    output = psql(dsn, f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql};", tuples=True)
+    result = json.loads(output)[0]
+    plan = result['Plan']
+    return {
+        'source': query['source'],
+        'sql': query['sql'],
+        'scans': walk_plan(plan, []),
+        'execution_ms': round(result.get('Execution Time', 0.0), 3),
+        'planning_ms': round(result.get('Planning Time', 0.0), 3),
+        'shared_hit': plan.get('Shared Hit Blocks', 0),
+        'shared_read': plan.get('Shared Read Blocks', 0),
+        'plan': plan,
+    }
+
+
+def compare(baseline, current):
+    """(failures, warnings): index -> seq scan flips fail, big slowdowns warn."""
+    failures, warnings = [], []
+    for name, run in current.items():
+        before = baseline.get(name)
+        if not before:
+            continue
+        indexed = {s['relation']: s for s in before['scans'] if s['node'] in INDEX_NODES}
+        for scan in run['scans']:
+            was = indexed.get(scan['relation'])
+            if was and scan['node'] == 'Seq Scan':
+                failures.append(f"{name}: {scan['relation']} flipped from {was['node']} "
+                                f"({was['index']}) to Seq Scan")
+        if before['execution_ms'] and run['execution_ms'] > before['execution_ms'] * SLOWDOWN_WARN:
+            warnings.append(f"{name}: {before['execution_ms']}ms -> {run['execution_ms']}ms")
+    return failures, warnings
+
+
+def flag_value(argv, flag, default=None):
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + '='):
+            return arg.split('=', 1)[1]
+    return default
+
+
+def main():
+    argv = sys.argv[1:]
+    rows = int(flag_value(argv, '--rows', DEFAULT_ROWS))
+    baseline_path = flag_value(argv, '--baseline', DEFAULT_BASELINE)
+    dsn = flag_value(argv, '--dsn')
+
+    try:
+        dsn, cleanup = temp_database(dsn) if dsn else start_cluster()
+    except (OSError, subprocess.CalledProcessError, RuntimeError) as e:
+        print(f"❌ Could not start a throwaway Postgres: {e}")
+        print("  Install Postgres (psql, initdb, pg_ctl) or pass --dsn for an existing server")
+        sys.exit(2)
+
+    try:
+        print("📐 Applying migrations...")
+        apply_migrations(dsn)
+        print(f"📦 Loading {rows:,} synthetic businesses and submissions...")
+        started = time.perf_counter()
+        load_synthetic_data(dsn, rows)
+        print(f"  ✓ Loaded in {time.perf_counter() - started:.1f}s")
+
+        print("🔍 Explaining query shapes...")
+        current = {}
+        for query in QUERIES:
+            current[query['name']] = explain(dsn, query, rows)
+            run = current[query['name']]
+            scans = ', '.join(f"{s['node']}" + (f" ({s['index']})" if s['index'] else '')
+                              for s in run['scans'])
+            print(f"  {query['name']:32} {run['execution_ms']:>10.2f}ms  {scans}")
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    finally:
+        cleanup()
+
+    report = {'rows': rows, 'postgres_plans': current}
+    if '--update' in argv or not os.path.exists(baseline_path):
+        with open(baseline_path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+            f.write('\n')
+        print(f"\n✅ Baseline written to {os.path.relpath(baseline_path)}")
+        return
+
+    with open(baseline_path, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('rows') != rows:
+        print(f"⚠️  Baseline was recorded with {baseline.get('rows'):,} rows; comparing anyway")
+    failures, warnings = compare(baseline.get('postgres_plans', {}), current)
+
+    for warning in warnings:
+        print(f"⚠️  Slower: {warning}")
+    if failures:
+        print("\n❌ Plan regressions:")
+        for failure in failures:
+            print(f"  {failure}")
+        sys.exit(1)
+    print("\n✅ No index-to-seq-scan regressions")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+"""
+Load approved_businesses into a local throwaway Postgres and benchmark the
+search_businesses RPC (supabase/search_businesses.sql).
+
+Checks that accented and unaccented queries return the same rows, then times
+a mix of whole-word, prefix, multi-word and misspelled searches inside the
+server (no client round-trips) and fails when p95 exceeds the target.
+
+Usage:
+  python scripts/search_benchmark.py                       # 100k rows, p95 <= 50ms
+  python scripts/search_benchmark.py --rows 100000 --queries 1000 --p95-ms 30
+  python scripts/search_benchmark.py --dsn "host=localhost user=postgres"
+
+Requires the Postgres client and server binaries (psql, initdb, pg_ctl) on PATH
+plus the unaccent and pg_trgm extensions (postgresql-contrib).
+"""
+
+import json
+import random
+import re
+import subprocess
+import sys
+import time
+
+from query_plan_check import (apply_migrations, flag_value, load_seed_values,
+                              load_synthetic_data, psql, sql_array, start_cluster,
+                              temp_database)
+
+DEFAULT_ROWS = 100_000
+DEFAULT_QUERIES = 500
+DEFAULT_P95_MS = 50.0
+
+# Same rows whichever way the user types it
+ACCENT_PAIRS = [
+    ('Phở', 'pho'),
+    ('Bánh Mì', 'banh mi'),
+    ('Đình', 'dinh'),
+    ('SIÊU THỊ', 'sieu thi'),
+]
+
+
+def search_terms(count):
+    """Whole words, 2-4 letter prefixes, two-word phrases and one-letter typos from seed names."""
+    rng = random.Random(42)
+    words = sorted({w for b in load_seed_values() for w in re.findall(r'\w{3,}', b.get('name') or '')})
+    terms = []
+    for _ in range(count):
+        word = rng.choice(words)
+        kind = rng.randrange(4)
+        if kind == 0:
+            terms.append(word)
+        elif kind == 1:
+            terms.append(word[:rng.randint(2, min(4, len(word)))])
+        elif kind == 2:
+            terms.append(f"{word} {rng.choice(words)}")
+        else:
+            cut = rng.randrange(len(word))
+            terms.append(word[:cut] + word[cut + 1:])
+    return terms
+
+
+def check_accent_folding(dsn):
+    """Accented and plain spellings must return identical ids."""
+    mismatches = []
+    for accented, plain in ACCENT_PAIRS:
+        ids = []
+        for term in (accented, plain):
+            literal = "'" + term.replace("'", "''") + "'"
+            output = psql(dsn, f"SELECT coalesce(json_agg(id ORDER BY id), '[]') "
+                               f"FROM search_businesses({literal}, max_results => 1000);",
+                          tuples=True)
+            ids.append(json.loads(output))
+        if ids[0] != ids[1]:
+            mismatches.append(f"'{accented}' -> {len(ids[0])} rows, '{plain}' -> {len(ids[1])} rows")
+    return mismatches
+
+
+def benchmark(dsn, terms):
+    """Time every search server-side; returns latency percentiles in ms."""
+    sql = f"""
+CREATE TEMP TABLE bench (term TEXT, ms DOUBLE PRECISION);
+DO $bench$
+DECLARE
+    started TIMESTAMPTZ;
+    term TEXT;
+BEGIN
+    PERFORM * FROM search_businesses('warm up');
+    FOREACH term IN ARRAY {sql_array(terms)} LOOP
+        started := clock_timestamp();
+        PERFORM * FROM search_businesses(term);
+        INSERT INTO bench VALUES (term, extract(epoch FROM clock_timestamp() - started) * 1000);
+    END LOOP;
+END
+$bench$;
+SELECT json_build_object(
+    'queries', count(*),
+    'p50', percentile_cont(0.50) WITHIN GROUP (ORDER BY ms),
+    'p95', percentile_cont(0.95) WITHIN GROUP (ORDER BY ms),
+    'p99', percentile_cont(0.99) WITHIN GROUP (ORDER BY ms),
+    'max', max(ms),
+    'slowest', (SELECT json_agg(s) FROM (SELECT term, round(ms::numeric, 2) AS ms
+                                         FROM bench ORDER BY ms DESC LIMIT 5) s)
+) FROM bench;
+"""
+    return json.loads(psql(dsn, sql, tuples=True))
+
+
+def main():
+    argv = sys.argv[1:]
+    rows = int(flag_value(argv, '--rows', DEFAULT_ROWS))
+    count = int(flag_value(argv, '--queries', DEFAULT_QUERIES))
+    target = float(flag_value(argv, '--p95-ms', DEFAULT_P95_MS))
+    dsn = flag_value(argv, '--dsn')
+
+    try:
+        dsn, cleanup = temp_database(dsn) if dsn else start_cluster()
+    except (OSError, subprocess.CalledProcessError, RuntimeError) as e:
+        print(f"❌ Could not start a throwaway Postgres: {e}")
+        print("  Install Postgres (psql, initdb, pg_ctl) or pass --dsn for an existing server")
+        sys.exit(2)
+
+    try:
+        print("📐 Applying migrations...")
+        apply_migrations(dsn)
+        print(f"📦 Loading {rows:,} businesses...")
+        started = time.perf_counter()
+        load_synthetic_data(dsn, rows)
+        print(f"  ✓ Loaded and indexed in {time.perf_counter() - started:.1f}s")
+
+        mismatches = check_accent_folding(dsn)
+        for mismatch in mismatches:
+            print(f"  ❌ Accent folding: {mismatch}")
+
+        print(f"⏱️  Running {count:,} searches...")
+        stats = benchmark(dsn, search_terms(count))
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        sys.exit(2)
+    finally:
+        cleanup()
+
+    print(f"  p50 {stats['p50']:.2f}ms  p95 {stats['p95']:.2f}ms  "
+          f"p99 {stats['p99']:.2f}ms  max {stats['max']:.2f}ms")
+    for slow in stats['slowest'] or []:
+        print(f"    {slow['ms']:>8}ms  {slow['term']}")
+
+    if mismatches or stats['p95'] > target:
+        print(f"\n❌ Search check failed (p95 target {target}ms)")
+        sys.exit(1)
+    print(f"\n✅ p95 {stats['p95']:.2f}ms within {target}ms at {rows:,} rows")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,299 @@
+#!/usr/bin/env python3
+"""
+Offset-indexed seed store: random access to businesses without loading seed.json.
+
+src/data/seed.ndjson holds one business per line; src/data/seed.ndjson.idx
+maps every id to the byte offset and length of its line, every slug to its
+id, and keeps next_id. A lookup is a dict hit plus one read from the
+memory-mapped file; an append or update writes one line and the index.
+
+seed.json stays the file the Next.js build reads: `export` regenerates it
+(byte-identical to json.dump(..., ensure_ascii=False, indent=2)).
+
+    from seed_store import SeedStore
+    with SeedStore.open() as store:
+        biz = store.get_by_slug("pho-hoa-dfw")
+        store.append({...})          # id taken from store.next_id
+
+Usage:
+  python scripts/seed_store.py import [seed.json]    # seed.json -> seed.ndjson + index
+  python scripts/seed_store.py export [seed.json]    # store -> seed.json
+  python scripts/seed_store.py get <slug-or-id>
+  python scripts/seed_store.py selftest              # read-after-write checks on a temp store
+"""
+
+import json
+import mmap
+import os
+import sys
+import tempfile
+
+from validate_seed import iter_records
+
+DATA_DIR = os.path.join(os.path.dirname(__file__), '..', 'src', 'data')
+SEED_PATH = os.path.join(DATA_DIR, 'seed.json')
+STORE_PATH = os.path.join(DATA_DIR, 'seed.ndjson')
+INDEX_VERSION = 1
+
+
+def encode(biz):
+    return (json.dumps(biz, ensure_ascii=False, separators=(',', ':')) + '\n').encode('utf-8')
+
+
+def write_atomic(path, write):
+    """Call write(f) on a temp file next to path, then swap it in."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        write(f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class SeedStore:
+    """NDJSON records plus an id -> (offset, length) index.
+
+    Updates that fit in the old line are written in place (padded with
+    spaces); longer ones blank the old line and append. Blank lines are
+    skipped everywhere and dropped by compact(). Record order is the order
+    ids were first added, so export round-trips seed.json.
+    """
+
+    def __init__(self, path, index):
+        self.path = path
+        self.index_path = path + '.idx'
+        self.offsets = {int(biz_id): tuple(span) for biz_id, span in index['offsets'].items()}
+        self.slugs = index['slugs']
+        self.next_id = index['next_id']
+        self.size = index['size']
+        self.dirty = False
+        self._file = open(path, 'r+b')
+        self._map = None
+
+    @classmethod
+    def open(cls, path=STORE_PATH):
+        """Open the store, rebuilding the index if it is missing or stale."""
+        if not os.path.exists(path):
+            open(path, 'wb').close()
+        index = None
+        if os.path.exists(path + '.idx'):
+            with open(path + '.idx', 'r', encoding='utf-8') as f:
+                index = json.load(f)
+            if index.get('version') != INDEX_VERSION or index.get('size') != os.path.getsize(path):
+                index = None
+        store = cls(path, index or cls.scan(path))
+        if index is None:
+            store.dirty = True
+            store.flush()
+        return store
+
+    @staticmethod
+    def scan(path):
+        """Index built by reading every line of the NDJSON file."""
+        offsets, slugs, next_id, offset = {}, {}, 1, 0
+        with open(path, 'rb') as f:
+            for line in f:
+                if line.strip():
+                    biz = json.loads(line)
+                    offsets[str(biz['id'])] = [offset, len(line)]
+                    if biz.get('slug'):
+                        slugs[biz['slug']] = biz['id']
+                    next_id = max(next_id, biz['id'] + 1)
+                offset += len(line)
+        return {'version': INDEX_VERSION, 'size': offset, 'next_id': next_id,
+                'offsets': offsets, 'slugs': slugs}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def __contains__(self, biz_id):
+        return biz_id in self.offsets
+
+    def _read(self, offset, length):
+        if self._map is None:
+            if self.size == 0:
+                return b''
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        return self._map[offset:offset + length]
+
+    def _write(self, offset, data):
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.seek(offset)
+        self._file.write(data)
+        # Reads go through an mmap of the descriptor, not this buffer
+        self._file.flush()
+        self.size = max(self.size, offset + len(data))
+        self.dirty = True
+
+    def get(self, biz_id):
+        span = self.offsets.get(biz_id)
+        return json.loads(self._read(*span)) if span else None
+
+    def get_by_slug(self, slug):
+        biz_id = self.slugs.get(slug)
+        return self.get(biz_id) if biz_id is not None else None
+
+    def __iter__(self):
+        for offset, length in self.offsets.values():
+            yield json.loads(self._read(offset, length))
+
+    def append(self, biz):
+        """Add a new business; assigns biz['id'] from next_id when it has none."""
+        if biz.get('id') is None:
+            biz['id'] = self.next_id
+        if biz['id'] in self.offsets:
+            raise KeyError(f"id {biz['id']} already in store")
+        if biz.get('slug') in self.slugs:
+            raise KeyError(f"slug '{biz['slug']}' already in store")
+        line = encode(biz)
+        self.offsets[biz['id']] = (self.size, len(line))
+        self._write(self.size, line)
+        if biz.get('slug'):
+            self.slugs[biz['slug']] = biz['id']
+        self.next_id = max(self.next_id, biz['id'] + 1)
+        return biz
+
+    def update(self, biz):
+        """Replace the stored business with the same id."""
+        offset, length = self.offsets[biz['id']]
+        old_slug = json.loads(self._read(offset, length)).get('slug')
+        if biz.get('slug') != old_slug:
+            if self.slugs.get(biz.get('slug'), biz['id']) != biz['id']:
+                raise KeyError(f"slug '{biz['slug']}' already in store")
+            self.slugs.pop(old_slug, None)
+            if biz.get('slug'):
+                self.slugs[biz['slug']] = biz['id']
+        line = encode(biz)
+        if len(line) <= length:
+            self._write(offset, line[:-1] + b' ' * (length - len(line)) + b'\n')
+        else:
+            self._write(offset, b' ' * (length - 1) + b'\n')
+            self.offsets[biz['id']] = (self.size, len(line))
+            self._write(self.size, line)
+
+    def flush(self):
+        if not self.dirty:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        index = {'version': INDEX_VERSION, 'size': self.size, 'next_id': self.next_id,
+                 'offsets': {str(biz_id): list(span) for biz_id, span in self.offsets.items()},
+                 'slugs': self.slugs}
+        write_atomic(self.index_path, lambda f: json.dump(index, f, ensure_ascii=False, separators=(',', ':')))
+        self.dirty = False
+
+    def compact(self):
+        """Rewrite the file without blank or superseded lines."""
+        records = list(self)
+        self.close()
+        write_atomic(self.path, lambda f: f.writelines(encode(biz).decode('utf-8') for biz in records))
+        os.remove(self.index_path)
+        fresh = SeedStore.open(self.path)
+        self.__dict__.update(fresh.__dict__)
+
+    def close(self):
+        self.flush()
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+
+
+def import_seed(seed_path=SEED_PATH, store_path=STORE_PATH):
+    """Replace the store with the records of seed.json (streamed, not json.load)."""
+    write_atomic(store_path, lambda f: f.writelines(encode(biz).decode('utf-8') for biz in iter_records(seed_path)))
+    if os.path.exists(store_path + '.idx'):
+        os.remove(store_path + '.idx')
+    return SeedStore.open(store_path)
+
+
+def export_seed(businesses, seed_path=SEED_PATH):
+    """Write seed.json from a store (or any iterable of businesses), formatted
+    exactly like json.dump(indent=2)."""
+    def write(f):
+        first = True
+        for biz in businesses:
+            body = json.dumps(biz, ensure_ascii=False, indent=2).replace('\n', '\n  ')
+            f.write(('[\n  ' if first else ',\n  ') + body)
+            first = False
+        f.write('[]' if first else '\n]')
+    write_atomic(seed_path, write)
+
+
+def selftest():
+    """Reads right after append() and update() (in place and grown) see the new record."""
+    problems = []
+
+    def expect(label, read, want):
+        try:
+            got = read()
+        except ValueError as e:  # a stale read decodes half a line
+            problems.append(f"{label}: {e}")
+            return
+        if got != want:
+            problems.append(f"{label}: got {got!r}, want {want!r}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        with SeedStore.open(os.path.join(tmp, 'seed.ndjson')) as store:
+            first = store.append({'name': 'Lobo Automotive', 'slug': 'lobo-automotive-dfw'})
+            expect("get after append", lambda: store.get(first['id']), first)
+            second = store.append({'name': 'Phở Hòa', 'slug': 'pho-hoa-dfw'})
+            expect("get after second append", lambda: store.get(second['id']), second)
+            expect("get_by_slug after append", lambda: store.get_by_slug('pho-hoa-dfw'), second)
+
+            shorter = dict(first, name='Changed')
+            store.update(shorter)
+            expect("get after in-place update", lambda: store.get(first['id']), shorter)
+            longer = dict(first, name='Changed', description='x' * 200)
+            store.update(longer)
+            expect("get after growing update", lambda: store.get(first['id']), longer)
+            expect("iteration after updates", lambda: list(store), [longer, second])
+
+        with SeedStore.open(os.path.join(tmp, 'seed.ndjson')) as store:
+            expect("get after reopen", lambda: store.get(first['id']), longer)
+    return problems
+
+
+def main():
+    args = sys.argv[1:]
+    command = args[0] if args else None
+
+    if command == 'import':
+        store = import_seed(args[1] if len(args) > 1 else SEED_PATH)
+        print(f"✅ Imported {len(store)} businesses into {os.path.relpath(store.path)}")
+        store.close()
+    elif command == 'export':
+        seed_path = args[1] if len(args) > 1 else SEED_PATH
+        with SeedStore.open() as store:
+            export_seed(store, seed_path)
+            print(f"✅ Exported {len(store)} businesses to {os.path.relpath(seed_path)}")
+    elif command == 'get' and len(args) > 1:
+        with SeedStore.open() as store:
+            key = args[1]
+            biz = store.get(int(key)) if key.isdigit() else store.get_by_slug(key)
+        if biz is None:
+            print(f"❌ No business '{key}'")
+            sys.exit(1)
+        print(json.dumps(biz, ensure_ascii=False, indent=2))
+    elif command == 'selftest':
+        problems = selftest()
+        for problem in problems:
+            print(f"❌ {problem}")
+        if problems:
+            sys.exit(1)
+        print("✅ Reads after append and update see the written records")
+    else:
+        print(__doc__)
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
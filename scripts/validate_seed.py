@@ -0,0 +1,305 @@
+#!/usr/bin/env python3
+"""
+Validate src/data/seed.json before it ships.
+
+Every record is checked against SCHEMA (required fields, types, formats),
+ids and slugs must be unique, phones must pass csv_to_seed.clean_phone and
+categories must be one of the CATEGORY_MAP values. An empty or non-list file
+fails outright. Exits 1 when anything is wrong, listing the offending ids.
+
+The file is decoded record by record (never held as one parsed list) and
+records are checked in chunks, across worker processes with --jobs.
+
+Usage:
+  python scripts/validate_seed.py                     # src/data/seed.json
+  python scripts/validate_seed.py path/to/seed.json --jobs 4
+  python scripts/validate_seed.py --benchmark         # 100k synthetic records
+"""
+
+import json
+import os
+import re
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+from csv_to_seed import CATEGORY_MAP, clean_phone
+
+SEED_PATH = os.path.join(os.path.dirname(__file__), '..', 'src', 'data', 'seed.json')
+READ_SIZE = 1 << 20
+CHUNK_SIZE = 5000
+CHUNKS_PER_JOB = 2  # chunks queued per worker with --jobs; bounds how far parsing runs ahead
+MAX_SHOWN = 20
+BENCHMARK_SIZE = 100_000
+
+CATEGORIES = frozenset(CATEGORY_MAP.values())
+LINK_TYPES = frozenset({'PLACE_ID', 'SEARCH'})
+
+# Websites are stored without a scheme (csv_to_seed.clean_website strips it)
+WEBSITE_RE = re.compile(r'(?:https?://)?[a-z0-9](?:[a-z0-9-]*[a-z0-9])?(?:\.[a-z0-9](?:[a-z0-9-]*[a-z0-9])?)+'
+                        r'(?::\d+)?(?:[/?#]\S*)?', re.IGNORECASE)
+URL_RE = re.compile(r'https?://[^\s/?#]+\.[^\s/?#]+(?:[/?#]\S*)?', re.IGNORECASE)
+EMAIL_RE = re.compile(r'[^@\s]+@[^@\s]+\.[a-z]{2,}', re.IGNORECASE)
+SLUG_RE = re.compile(r'[a-z0-9]+(?:-[a-z0-9]+)*')
+
+# field -> (required, accepted types); optional fields may also be null
+SCHEMA = {
+    'id': (True, (int,)),
+    'name': (True, (str,)),
+    'slug': (True, (str,)),
+    'category': (True, (str,)),
+    'originalCategory': (False, (str,)),
+    'subcategory': (False, (str,)),
+    'address': (False, (str,)),
+    'phone': (False, (str,)),
+    'website': (False, (str,)),
+    'email': (False, (str,)),
+    'description': (False, (str,)),
+    'rating': (False, (int, float)),
+    'reviewCount': (False, (int,)),
+    'googleMapsLink': (False, (str,)),
+    'linkType': (False, (str,)),
+}
+
+
+def check_record(biz):
+    """Problems with one record, as short messages (empty when valid)."""
+    if not isinstance(biz, dict):
+        return [f"record is {type(biz).__name__}, not an object"]
+
+    problems = []
+    for field, (required, types) in SCHEMA.items():
+        value = biz.get(field)
+        if value is None:
+            if required:
+                problems.append(f"missing {field}")
+        elif not isinstance(value, types) or isinstance(value, bool):
+            problems.append(f"{field} is {type(value).__name__}")
+    if problems:
+        return problems
+
+    if not biz['name'].strip():
+        problems.append("empty name")
+    if not SLUG_RE.fullmatch(biz['slug']):
+        problems.append(f"slug '{biz['slug']}' is not lowercase-hyphenated")
+    if biz['category'] not in CATEGORIES:
+        problems.append(f"category '{biz['category']}' not in CATEGORY_MAP")
+
+    phone = biz.get('phone')
+    if phone is not None and clean_phone(phone) is None:
+        problems.append(f"phone '{phone}' is not (xxx) xxx-xxxx")
+    website = biz.get('website')
+    if website is not None and not WEBSITE_RE.fullmatch(website):
+        problems.append(f"website '{website}' is not a URL")
+    link = biz.get('googleMapsLink')
+    if link is not None and not URL_RE.fullmatch(link):
+        problems.append(f"googleMapsLink '{link[:60]}' is not a URL")
+    email = biz.get('email')
+    if email is not None and not EMAIL_RE.fullmatch(email):
+        problems.append(f"email '{email}' is not an address")
+    link_type = biz.get('linkType')
+    if link_type is not None and link_type not in LINK_TYPES:
+        problems.append(f"linkType '{link_type}' not one of {sorted(LINK_TYPES)}")
+    rating = biz.get('rating')
+    if rating is not None and not 0 <= rating <= 5:
+        problems.append(f"rating {rating} outside 0-5")
+    review_count = biz.get('reviewCount')
+    if review_count is not None and review_count < 0:
+        problems.append(f"reviewCount {review_count} is negative")
+    return problems
+
+
+def check_chunk(chunk):
+    """[(position, id, problems)] for the invalid records of a chunk of (position, record)."""
+    results = []
+    for position, biz in chunk:
+        problems = check_record(biz)
+        if problems:
+            results.append((position, biz.get('id') if isinstance(biz, dict) else None, problems))
+    return results
+
+
+def iter_records(path):
+    """Yield the elements of a top-level JSON array one at a time, reading in blocks."""
+    decoder = json.JSONDecoder()
+    with open(path, 'r', encoding='utf-8') as f:
+        buffer = f.read(READ_SIZE)
+        pos = len(buffer) - len(buffer.lstrip())
+        if buffer[pos:pos + 1] != '[':
+            raise ValueError("seed file is not a JSON array")
+        pos += 1
+        expect_value = True
+        while True:
+            while pos < len(buffer) and buffer[pos] in ' \t\r\n':
+                pos += 1
+            if pos == len(buffer):
+                more = f.read(READ_SIZE)
+                if not more:
+                    raise ValueError("seed file ends before the closing ]")
+                buffer, pos = more, 0
+                continue
+            char = buffer[pos]
+            if char == ']':
+                return
+            if char == ',' and not expect_value:
+                expect_value = True
+                pos += 1
+                continue
+            if not expect_value:
+                raise ValueError(f"expected ',' or ']' at offset {pos}")
+            try:
+                value, end = decoder.raw_decode(buffer, pos)
+            except json.JSONDecodeError:
+                # Value cut off at the block boundary: read on and retry
+                more = f.read(READ_SIZE)
+                if not more:
+                    raise
+                buffer, pos = buffer[pos:] + more, 0
+                continue
+            if end == len(buffer):
+                # A number may continue in the next block
+                more = f.read(READ_SIZE)
+                if more:
+                    buffer, pos = buffer[pos:] + more, 0
+                    continue
+            yield value
+            pos = end
+            expect_value = False
+
+
+def chunked(records, size):
+    chunk = []
+    for position, biz in enumerate(records):
+        chunk.append((position, biz))
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def validate(path, jobs=1):
+    """(record count, [(position, id, problems)]) for the seed file at path."""
+    ids, slugs = {}, {}
+    results = []
+    count = 0
+
+    def track(chunk):
+        # Uniqueness needs every record, so it stays in this process
+        nonlocal count
+        count += len(chunk)
+        for position, biz in chunk:
+            if not isinstance(biz, dict):
+                continue
+            for field, seen in (('id', ids), ('slug', slugs)):
+                value = biz.get(field)
+                if isinstance(value, (int, str)):
+                    seen.setdefault(value, []).append((position, biz.get('id')))
+        return chunk
+
+    chunks = (track(chunk) for chunk in chunked(iter_records(path), CHUNK_SIZE))
+    if jobs > 1:
+        # Executor.map would submit (parse and pickle) every chunk up front
+        pending = deque()
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            for chunk in chunks:
+                if len(pending) >= jobs * CHUNKS_PER_JOB:
+                    results.extend(pending.popleft().result())
+                pending.append(pool.submit(check_chunk, chunk))
+            while pending:
+                results.extend(pending.popleft().result())
+    else:
+        for chunk in chunks:
+            results.extend(check_chunk(chunk))
+
+    for field, seen in (('id', ids), ('slug', slugs)):
+        for value, owners in seen.items():
+            if len(owners) > 1:
+                shared = ', '.join(str(biz_id) for _, biz_id in owners)
+                for position, biz_id in owners:
+                    results.append((position, biz_id, [f"duplicate {field} '{value}' (ids {shared})"]))
+    results.sort(key=lambda result: result[0])
+    return count, results
+
+
+def synthesize(size):
+    """size valid records shaped like seed.json.backup."""
+    categories = sorted(CATEGORIES)
+    return [{
+        'id': i + 1,
+        'name': f"Phở Sài Gòn {i}",
+        'category': categories[i % len(categories)],
+        'originalCategory': 'Restaurant',
+        'subcategory': 'Phở',
+        'address': f"{i} Walnut St, Garland, TX 75040",
+        'phone': f"(972) {i % 1000:03d}-{i % 10000:04d}",
+        'website': f"pho{i}.com",
+        'email': None,
+        'description': "Vietnamese noodle soup and more.",
+        'rating': 4.5,
+        'reviewCount': 120,
+        'googleMapsLink': f"https://www.google.com/maps/search/?api=1&query=Pho%20{i}",
+        'linkType': 'PLACE_ID',
+        'slug': f"pho-sai-gon-{i}-garland",
+    } for i in range(size)]
+
+
+def report(path, count, results, elapsed):
+    name = os.path.relpath(path)
+    if not results:
+        print(f"✅ {name}: {count} records valid ({elapsed:.2f}s)")
+        return
+    records = len({position for position, _, _ in results})
+    print(f"❌ {name}: {records} of {count} records invalid ({elapsed:.2f}s)")
+    for position, biz_id, problems in results[:MAX_SHOWN]:
+        label = f"id {biz_id}" if biz_id is not None else f"record #{position}"
+        print(f"   {label}: {'; '.join(problems)}")
+    if len(results) > MAX_SHOWN:
+        print(f"   ... and {len(results) - MAX_SHOWN} more")
+
+
+def flag_value(argv, flag, default=None):
+    for i, arg in enumerate(argv):
+        if arg == flag and i + 1 < len(argv):
+            return argv[i + 1]
+        if arg.startswith(flag + '='):
+            return arg.split('=', 1)[1]
+    return default
+
+
+def main():
+    argv = sys.argv[1:]
+    jobs = int(flag_value(argv, '--jobs', 1))
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+
+    if '--benchmark' in argv:
+        path = os.path.join(os.path.dirname(SEED_PATH), 'seed.benchmark.json')
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(synthesize(BENCHMARK_SIZE), f, ensure_ascii=False, indent=2)
+    else:
+        args = [a for i, a in enumerate(argv) if not a.startswith('--') and (i == 0 or argv[i - 1] != '--jobs')]
+        path = args[0] if args else SEED_PATH
+
+    started = time.perf_counter()
+    try:
+        count, results = validate(path, jobs)
+    except (OSError, ValueError) as e:
+        print(f"❌ {os.path.relpath(path)}: {e}")
+        sys.exit(1)
+    finally:
+        if '--benchmark' in argv:
+            os.remove(path)
+    elapsed = time.perf_counter() - started
+
+    if count == 0:
+        print(f"❌ {os.path.relpath(path)}: no records (an empty list would ship an empty directory)")
+        sys.exit(1)
+    report(path, count, results, elapsed)
+    if results:
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
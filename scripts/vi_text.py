@@ -0,0 +1,51 @@
+"""
+Vietnamese text folding shared by the data scripts.
+
+fold("Phở Đình Bánh Mì") -> "pho dinh banh mi": lowercase, tone marks and
+vowel marks removed, đ/Đ -> d. One precomputed str.translate table does the
+work; results are cached because the same names, categories and addresses
+are folded many times per run.
+
+    from vi_text import fold, slugify
+"""
+
+import re
+import unicodedata
+from functools import lru_cache
+
+# Every precomposed Latin letter up to Latin Extended Additional (which holds
+# the Vietnamese tone-marked vowels) -> its ASCII base letter. đ/Đ are separate
+# letters with no decomposition, so NFD-based stripping alone would drop them.
+FOLD_TABLE = {ord('đ'): 'd', ord('Đ'): 'D'}
+for _code in range(0xC0, 0x1EFF + 1):
+    _base = ''.join(c for c in unicodedata.normalize('NFD', chr(_code)) if not unicodedata.combining(c))
+    if _base != chr(_code) and _base.isascii():
+        FOLD_TABLE[_code] = _base
+del _code, _base
+
+NON_ALNUM = re.compile(r'[^a-z0-9]+')
+TOKEN = re.compile(r'[a-z0-9]+')
+
+
+@lru_cache(maxsize=65536)
+def fold(text):
+    """Lowercase, diacritic-free form of text; ASCII input only gets lowercased."""
+    if not text:
+        return ''
+    if text.isascii():
+        return text.lower()
+    folded = unicodedata.normalize('NFC', text).translate(FOLD_TABLE)
+    if not folded.isascii():
+        # Marks NFC could not compose onto a letter the table knows
+        folded = ''.join(c for c in unicodedata.normalize('NFD', folded) if not unicodedata.combining(c))
+    return folded.lower()
+
+
+def slugify(text):
+    """URL slug: "Phở Hòa & Grill" -> "pho-hoa-grill"."""
+    return NON_ALNUM.sub('-', fold(text)).strip('-')
+
+
+def tokenize(text):
+    """Folded alphanumeric words of text."""
+    return TOKEN.findall(fold(text))